@@ -6,6 +6,7 @@ from typing import Any
 
 from pyplumio._version import __version__, __version_tuple__, version, version_tuple
 from pyplumio.connection import SerialConnection, TcpConnection
+from pyplumio.devices import load_device_classes
 from pyplumio.exceptions import (
     ChecksumError,
     ConnectionFailedError,
@@ -17,7 +18,7 @@ from pyplumio.exceptions import (
     UnknownDeviceError,
     UnknownFrameError,
 )
-from pyplumio.frames import Frame
+from pyplumio.frames import Frame, load_frame_classes
 from pyplumio.protocol import AsyncProtocol, DummyProtocol, Protocol
 from pyplumio.structures.network_info import EthernetParameters, WirelessParameters
 
@@ -90,6 +91,16 @@ def open_tcp_connection(
     )
 
 
+def preload() -> None:
+    """Load all frame and device classes ahead of time.
+
+    Classes are otherwise loaded when the frame or device is first
+    seen, which blocks the event loop while the module is imported.
+    """
+    load_frame_classes()
+    load_device_classes()
+
+
 __all__ = [
     "__version__",
     "__version_tuple__",
@@ -114,4 +125,5 @@ __all__ = [
     "WirelessParameters",
     "open_serial_connection",
     "open_tcp_connection",
+    "preload",
 ]
@@ -1,8 +1,12 @@
-"""Contains a serial connection example."""
+"""Contains a serial connection example and the benchmark entry point.
+
+Run `python -m pyplumio bench` to run the micro-benchmarks.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import sys
 
 import pyplumio
 
@@ -18,4 +22,9 @@ async def main() -> None:
     print(parameters)
 
 
+if sys.argv[1:2] == ["bench"]:
+    from pyplumio import bench
+
+    sys.exit(bench.main(sys.argv[2:]))
+
 asyncio.run(main())
@@ -0,0 +1,776 @@
+"""Contains the micro-benchmark suite.
+
+Benchmarks use the sample frames recorded by the test suite, that are
+shipped with the package, and are run with `python -m pyplumio bench`.
+Besides the time per operation, the suite measures the bytes copied
+by the frame decoder, the write latency and the memory retained by
+devices. Results are printed as JSON and can be compared against the
+stored baseline, e. g.
+`python -m pyplumio bench --baseline benchmarks/baseline.json`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable, Coroutine, Iterator, Sequence
+from functools import cache, partial
+import gc
+import inspect
+from itertools import cycle, islice
+import json
+import logging
+import pathlib
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Final, NamedTuple, TypeAlias, cast
+
+from pyplumio import filters
+from pyplumio._version import __version__
+from pyplumio.codec import MAX_FRAME_LENGTH, FrameDecoder
+from pyplumio.const import DeviceType, FrameType, ProductType
+from pyplumio.devices import Device, PhysicalDevice
+from pyplumio.devices.ecomax import ATTR_MIXERS, ATTR_THERMOSTATS, EcoMAX
+from pyplumio.frames import Frame, Response, bcc, get_frame_class
+from pyplumio.frames.requests import CheckDeviceRequest
+from pyplumio.helpers.event_manager import EventCallback, EventManager
+from pyplumio.parameters import Parameter
+from pyplumio.protocol import AsyncProtocol
+from pyplumio.stream import FrameReader
+from pyplumio.structures import Structure
+from pyplumio.structures.alerts import AlertsStructure
+from pyplumio.structures.ecomax_parameters import EcomaxParametersStructure
+from pyplumio.structures.mixer_parameters import MixerParametersStructure
+from pyplumio.structures.network_info import NetworkInfo
+from pyplumio.structures.product_info import ATTR_PRODUCT, ProductInfo
+from pyplumio.structures.regulator_data import RegulatorDataStructure
+from pyplumio.structures.regulator_data_schema import ATTR_REGDATA_SCHEMA
+from pyplumio.structures.schedules import SchedulesStructure
+from pyplumio.structures.sensor_data import (
+    ATTR_THERMOSTATS_AVAILABLE,
+    SensorDataStructure,
+)
+
+SAMPLE_FRAMES: Final = pathlib.Path(__file__).parent / "bench_frames.json"
+
+DEFAULT_REPEAT: Final = 5
+DEFAULT_MIN_TIME: Final = 0.2
+DEFAULT_THRESHOLD: Final = 10.0
+
+# Test data directories and the frame type prefixes they contain.
+FRAME_DIRECTORIES: Final = {
+    "messages": "MESSAGE",
+    "requests": "REQUEST",
+    "responses": "RESPONSE",
+}
+
+# Structures and the recorded frames they are decoded from.
+STRUCTURES: Final[dict[type[Structure], FrameType]] = {
+    SensorDataStructure: FrameType.MESSAGE_SENSOR_DATA,
+    RegulatorDataStructure: FrameType.MESSAGE_REGULATOR_DATA,
+    SchedulesStructure: FrameType.RESPONSE_SCHEDULES,
+    EcomaxParametersStructure: FrameType.RESPONSE_ECOMAX_PARAMETERS,
+    MixerParametersStructure: FrameType.RESPONSE_MIXER_PARAMETERS,
+    AlertsStructure: FrameType.RESPONSE_ALERTS,
+}
+
+# Values the event callbacks are called with.
+EVENT_VALUES: Final = (10.0, 10.05, 11.0, 11.0, 9.5, 10.0)
+EVENT_CALLBACKS: Final = 5
+
+# Requests written in a burst and the interval in seconds between the
+# frames sent by the controller for the write latency measurement.
+BURST_SIZE: Final = 20
+FRAME_INTERVAL: Final = 0.02
+
+# Devices set up for the memory measurement and the recorded frames,
+# that fully set up the device, in order.
+MEMORY_DEVICES: Final = 20
+MEMORY_THERMOSTATS: Final = 3
+MEMORY_DATASETS: Final = (
+    (FrameType.MESSAGE_SENSOR_DATA, "full_sensor_data"),
+    (FrameType.RESPONSE_ECOMAX_PARAMETERS, "EM350P2_parameters"),
+    (FrameType.RESPONSE_MIXER_PARAMETERS, "1_mixer_detected"),
+    (FrameType.RESPONSE_THERMOSTAT_PARAMETERS, "3_thermostats_connected"),
+    (FrameType.RESPONSE_SCHEDULES, "EM_heating_and_water_heater_schedule"),
+)
+MEMORY_PRODUCT_INFO: Final = ProductInfo(
+    type=ProductType.ECOMAX_P,
+    id=90,
+    uid="BENCHMARK",
+    logo=23040,
+    image=2816,
+    model="ecoMAX 350P2-ZF",
+)
+TRACEBACK_LIMIT: Final = 10
+
+# Allocations made in the parameter classes, e. g. in the constructor.
+PARAMETERS_FILE: Final = str(pathlib.Path(inspect.getfile(Parameter)).parent / "*.py")
+
+# Runs the benchmark for the number of operations and returns the
+# elapsed time in seconds.
+Benchmark: TypeAlias = Callable[[int], float]
+
+# Returns the measured value, where lower is better, e. g. the number
+# of bytes retained.
+Measurement: TypeAlias = Callable[[], float]
+
+
+class BenchmarkResult(NamedTuple):
+    """Represents a benchmark result."""
+
+    name: str
+    number: int
+    time_per_op: float
+
+    @property
+    def ops_per_second(self) -> float:
+        """Return the number of operations per second."""
+        return 1 / self.time_per_op if self.time_per_op else 0.0
+
+
+class MeasurementResult(NamedTuple):
+    """Represents a measurement result."""
+
+    name: str
+    value: float
+
+
+class Comparison(NamedTuple):
+    """Represents a comparison against the baseline result."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Return the time per operation or the value change in percents."""
+        return (self.current / self.baseline - 1) * 100
+
+
+def _decode_bytearrays(d: dict[str, Any]) -> Any:
+    """Decode hinted bytearrays and leave other objects as is."""
+    if "__bytearray__" in d:
+        return bytearray.fromhex("".join(d["items"]))
+
+    return d
+
+
+def load_messages(
+    testdata: pathlib.Path = SAMPLE_FRAMES,
+) -> Iterator[tuple[FrameType, str, bytearray]]:
+    """Yield frame type, dataset id and message for each recorded frame.
+
+    Frames are loaded from the sample frames file or from the test data
+    directory.
+    """
+    if not testdata.is_dir():
+        with open(testdata, encoding="utf-8") as fp:
+            for sample in json.load(fp):
+                yield (
+                    FrameType[sample["frame_type"]],
+                    sample["id"],
+                    bytearray.fromhex(sample["message"]),
+                )
+
+        return
+
+    for directory, prefix in FRAME_DIRECTORIES.items():
+        for path in sorted((testdata / directory).glob("*.json")):
+            frame_type = FrameType[f"{prefix}_{path.stem.upper()}"]
+            with open(path, encoding="utf-8") as fp:
+                datasets = json.load(fp, object_hook=_decode_bytearrays)
+
+            for dataset in datasets:
+                yield frame_type, dataset["id"], dataset["message"]
+
+
+class _RegdataSchema:
+    """Represents a device that only provides the regulator data schema."""
+
+    __slots__ = ("_schema",)
+
+    _schema: Any
+
+    def __init__(self, schema: Any) -> None:
+        """Initialize a new regulator data schema provider."""
+        self._schema = schema
+
+    def get_nowait(self, name: str, default: Any = None) -> Any:
+        """Return the schema."""
+        return self._schema if name == ATTR_REGDATA_SCHEMA else default
+
+
+def _sync(func: Callable[[], Any]) -> Benchmark:
+    """Return the benchmark for the function."""
+    return timeit.Timer(func).timeit
+
+
+def _async(func: Callable[[], Coroutine[Any, Any, Any]]) -> Benchmark:
+    """Return the benchmark for the coroutine function."""
+
+    async def _run(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+
+        return time.perf_counter() - start
+
+    return lambda number: asyncio.run(_run(number))
+
+
+def _bench_frame_reader(frames: list[bytes]) -> Benchmark:
+    """Return the frame reader benchmark."""
+
+    async def _run(number: int) -> float:
+        data = b"".join(islice(cycle(frames), number))
+        stream = asyncio.StreamReader(limit=len(data) + 1)
+        stream.feed_data(data)
+        stream.feed_eof()
+        reader = FrameReader(stream)
+        start = time.perf_counter()
+        for _ in range(number):
+            await reader.read()
+
+        return time.perf_counter() - start
+
+    return lambda number: asyncio.run(_run(number))
+
+
+def _structure_benchmarks(
+    messages: dict[FrameType, list[tuple[str, bytearray]]],
+) -> Iterator[tuple[str, Benchmark]]:
+    """Yield the decode benchmark for each structure."""
+    schemas = [
+        message for _, message in messages[FrameType.RESPONSE_REGULATOR_DATA_SCHEMA]
+    ]
+    for structure_class, frame_type in STRUCTURES.items():
+        decoders: list[Callable[[], Any]] = []
+        for index, (_, message) in enumerate(messages[frame_type]):
+            frame = cast(Response, get_frame_class(frame_type)(message=message))
+            if structure_class is RegulatorDataStructure:
+                schema = get_frame_class(FrameType.RESPONSE_REGULATOR_DATA_SCHEMA)(
+                    message=schemas[index]
+                ).data.get(ATTR_REGDATA_SCHEMA, [])
+                frame.assign_to(cast(PhysicalDevice, _RegdataSchema(schema)))
+
+            # Decode the preceding structures to get the offset.
+            offset = 0
+            for structure in frame.structures:
+                if structure is structure_class:
+                    break
+
+                _, offset = structure(frame).decode(message, offset)
+
+            decoders.append(partial(structure_class(frame).decode, message, offset))
+
+        yield f"{structure_class.__name__}.decode", _sync(partial(_call_all, decoders))
+
+
+def _call_all(funcs: list[Callable[[], Any]]) -> None:
+    """Call each function."""
+    for func in funcs:
+        func()
+
+
+async def _callback(value: Any) -> None:
+    """Do nothing with the value."""
+
+
+def _bench_dispatch() -> Benchmark:
+    """Return the event dispatch benchmark."""
+    manager: EventManager[Any] = EventManager()
+    for _ in range(EVENT_CALLBACKS):
+        manager.subscribe("benchmark", _callback)
+
+    values = cycle(EVENT_VALUES)
+    return _async(lambda: manager.dispatch("benchmark", next(values)))
+
+
+FILTERS: Final[dict[str, Callable[[EventCallback], EventCallback]]] = {
+    "aggregate": lambda callback: filters.aggregate(callback, 60, sample_size=10),
+    "clamp": lambda callback: filters.clamp(callback, 9.75, 10.75),
+    "custom": lambda callback: filters.custom(
+        callback, lambda value: value > EVENT_VALUES[0]
+    ),
+    "deadband": lambda callback: filters.deadband(callback, tolerance=0.1),
+    "debounce": lambda callback: filters.debounce(callback, min_calls=2),
+    "delta": filters.delta,
+    "on_change": filters.on_change,
+    "throttle": lambda callback: filters.throttle(callback, seconds=1),
+}
+
+
+def _bench_filter(factory: Callable[[EventCallback], EventCallback]) -> Benchmark:
+    """Return the filter benchmark."""
+    callback = factory(_callback)
+    values = cycle(EVENT_VALUES)
+    return _async(lambda: callback(next(values)))
+
+
+def _bench_handle_frame(messages: list[bytearray]) -> Benchmark:
+    """Return the sensor data dispatch benchmark.
+
+    Frames are decoded once, so only the event dispatch is measured.
+    """
+
+    async def _run(number: int) -> float:
+        ecomax = EcoMAX(asyncio.Queue(), network_info=NetworkInfo())
+        frames = [
+            get_frame_class(FrameType.MESSAGE_SENSOR_DATA)(
+                message=message, sender=DeviceType.ECOMAX
+            )
+            for message in messages
+        ]
+        for frame in frames:
+            ecomax.handle_frame(frame)
+
+        await ecomax.wait_until_done()
+        start = time.perf_counter()
+        for frame in islice(cycle(frames), number):
+            ecomax.handle_frame(frame)
+            await ecomax.wait_until_done()
+
+        elapsed = time.perf_counter() - start
+        await ecomax.shutdown()
+        return elapsed
+
+    return lambda number: asyncio.run(_run(number))
+
+
+def _bench_frame_decoder(frames: list[bytes]) -> Benchmark:
+    """Return the frame decoder benchmark.
+
+    Frames are fed in chunks of the maximum frame length.
+    """
+
+    def _run(number: int) -> float:
+        data = b"".join(islice(cycle(frames), number))
+        decoder = FrameDecoder()
+        start = time.perf_counter()
+        for offset in range(0, len(data), MAX_FRAME_LENGTH):
+            decoder.feed(data[offset : offset + MAX_FRAME_LENGTH])
+
+        return time.perf_counter() - start
+
+    return _run
+
+
+class _CountingDecoder(FrameDecoder):
+    """Represents a frame decoder that counts the bytes copied."""
+
+    __slots__ = ("copied",)
+
+    copied: int
+
+    def __init__(self) -> None:
+        """Initialize a new counting decoder."""
+        super().__init__()
+        self.copied = 0
+
+    def extend(self, data: bytes | bytearray) -> None:
+        """Count the bytes copied into the buffer."""
+        self.copied += min(len(data), len(self._buffer))
+        super().extend(data)
+
+    def _compact(self, size: int) -> None:
+        """Count the unread bytes moved to the start of the buffer."""
+        self.copied += min(size, len(self))
+        super()._compact(size)
+
+    def decode(self) -> list[Frame]:
+        """Count the messages copied out of the buffer."""
+        frames = super().decode()
+        self.copied += sum(len(frame.message) for frame in frames)
+        return frames
+
+
+def _measure_copied_bytes(frames: list[bytes]) -> float:
+    """Return the bytes copied by the frame decoder per frame."""
+    data = b"".join(frames)
+    decoder = _CountingDecoder()
+    decoded = 0
+    for offset in range(0, len(data), MAX_FRAME_LENGTH):
+        decoded += len(decoder.feed(data[offset : offset + MAX_FRAME_LENGTH]))
+
+    return decoder.copied / decoded if decoded else 0.0
+
+
+class _DiscardingProtocol(AsyncProtocol):
+    """Represents a protocol that discards the received frames."""
+
+    async def _process_frame(self, frame: Frame) -> None:
+        """Discard the received frame."""
+
+
+class _TimedStreamWriter:
+    """Represents a stream writer that records the write times."""
+
+    __slots__ = ("times",)
+
+    times: list[float]
+
+    def __init__(self) -> None:
+        """Initialize a new timed stream writer."""
+        self.times = []
+
+    def write(self, data: bytes) -> None:
+        """Record the write time."""
+        self.times.append(time.perf_counter())
+
+    async def drain(self) -> None:
+        """Do nothing."""
+
+    def close(self) -> None:
+        """Do nothing."""
+
+    async def wait_closed(self) -> None:
+        """Do nothing."""
+
+
+async def _feed_frames(reader: asyncio.StreamReader) -> None:
+    """Feed a frame into the stream at a fixed interval."""
+    data = get_frame_class(FrameType.MESSAGE_SENSOR_DATA)(
+        recipient=DeviceType.ECONET, sender=DeviceType.ECOMAX, message=bytearray()
+    ).bytes
+    while True:
+        reader.feed_data(data)
+        await asyncio.sleep(FRAME_INTERVAL)
+
+
+async def _write_latency(full_duplex: bool) -> float:
+    """Return the median write latency of the request burst in seconds.
+
+    The controller sends a frame at a fixed interval, while requests
+    are queued in a burst.
+    """
+    protocol = _DiscardingProtocol(full_duplex=full_duplex)
+    reader = asyncio.StreamReader()
+    writer = _TimedStreamWriter()
+    feeder = asyncio.create_task(_feed_frames(reader))
+    protocol.connection_established(reader, cast(asyncio.StreamWriter, writer))
+    await protocol._write_queue.join()  # Wait for the start master request.
+    writer.times.clear()
+    queued_at = time.perf_counter()
+    for _ in range(BURST_SIZE):
+        protocol._write_queue.put_nowait(CheckDeviceRequest())
+
+    await protocol._write_queue.join()
+    feeder.cancel()
+    await protocol.shutdown()
+    return statistics.median(written_at - queued_at for written_at in writer.times)
+
+
+async def _setup_device(frames: list[Frame]) -> EcoMAX:
+    """Set up the ecoMAX device from the frames."""
+    ecomax = EcoMAX(asyncio.Queue(), network_info=NetworkInfo())
+    await ecomax.dispatch(ATTR_PRODUCT, MEMORY_PRODUCT_INFO)
+    for frame in frames:
+        if frame.frame_type == FrameType.RESPONSE_THERMOSTAT_PARAMETERS:
+            # Recorded thermostat parameters are for three thermostats.
+            await ecomax.dispatch(ATTR_THERMOSTATS_AVAILABLE, MEMORY_THERMOSTATS)
+
+        # Frames are copied, since the decoded data is cached.
+        ecomax.handle_frame(type(frame)(message=frame.message, sender=frame.sender))
+        await ecomax.wait_until_done()
+
+    for device in _sub_devices(ecomax):
+        await device.wait_until_done()
+
+    return ecomax
+
+
+def _sub_devices(ecomax: EcoMAX) -> list[Device]:
+    """Return the mixers and thermostats of the device."""
+    return [
+        *ecomax.get_nowait(ATTR_MIXERS, {}).values(),
+        *ecomax.get_nowait(ATTR_THERMOSTATS, {}).values(),
+    ]
+
+
+async def _retained_memory(frames: list[Frame]) -> tuple[float, float]:
+    """Return the memory in bytes retained per device and per parameter.
+
+    Memory per parameter only includes the allocations made by the
+    parameter classes.
+    """
+    await _setup_device(frames)  # Warm up the caches.
+    gc.collect()
+    tracemalloc.start(TRACEBACK_LIMIT)
+    before = tracemalloc.take_snapshot()
+    devices = [await _setup_device(frames) for _ in range(MEMORY_DEVICES)]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    parameter_filter = [tracemalloc.Filter(True, PARAMETERS_FILE, all_frames=True)]
+    parameters_retained = sum(
+        stat.size_diff
+        for stat in after.filter_traces(parameter_filter).compare_to(
+            before.filter_traces(parameter_filter), "filename"
+        )
+    )
+    parameters = sum(
+        isinstance(value, Parameter)
+        for device in (devices[0], *_sub_devices(devices[0]))
+        for value in device.data.values()
+    )
+    return (
+        retained / len(devices),
+        parameters_retained / len(devices) / parameters if parameters else 0.0,
+    )
+
+
+def _load_messages_by_type(
+    testdata: pathlib.Path,
+) -> dict[FrameType, list[tuple[str, bytearray]]]:
+    """Return the dataset id and message of recorded frames by type."""
+    messages: dict[FrameType, list[tuple[str, bytearray]]] = {}
+    for frame_type, dataset_id, message in load_messages(testdata):
+        messages.setdefault(frame_type, []).append((dataset_id, message))
+
+    return messages
+
+
+def _frame_bytes(messages: dict[FrameType, list[tuple[str, bytearray]]]) -> list[bytes]:
+    """Return the bytes of each recorded frame."""
+    return [
+        get_frame_class(frame_type)(message=message).bytes
+        for frame_type, datasets in messages.items()
+        for _, message in datasets
+    ]
+
+
+def create_measurements(
+    testdata: pathlib.Path = SAMPLE_FRAMES,
+) -> dict[str, Measurement]:
+    """Return the measurements by name."""
+    messages = _load_messages_by_type(testdata)
+    datasets = {
+        (frame_type, dataset_id): message
+        for frame_type, items in messages.items()
+        for dataset_id, message in items
+    }
+    device_frames = [
+        get_frame_class(frame_type)(
+            message=datasets[frame_type, dataset_id], sender=DeviceType.ECOMAX
+        )
+        for frame_type, dataset_id in MEMORY_DATASETS
+    ]
+    retained_memory = cache(lambda: asyncio.run(_retained_memory(device_frames)))
+    return {
+        "FrameDecoder.copied_bytes": partial(
+            _measure_copied_bytes, _frame_bytes(messages)
+        ),
+        "AsyncProtocol.write_latency": lambda: asyncio.run(_write_latency(False)),
+        "AsyncProtocol.write_latency_full_duplex": lambda: asyncio.run(
+            _write_latency(True)
+        ),
+        "EcoMAX.retained_bytes": lambda: retained_memory()[0],
+        "Parameter.retained_bytes": lambda: retained_memory()[1],
+    }
+
+
+def create_benchmarks(
+    testdata: pathlib.Path = SAMPLE_FRAMES,
+) -> dict[str, Benchmark]:
+    """Return the benchmarks by name."""
+    messages = _load_messages_by_type(testdata)
+    frames: list[Frame] = [
+        get_frame_class(frame_type)(message=message)
+        for frame_type, datasets in messages.items()
+        for _, message in datasets
+    ]
+    frame_bytes = [frame.bytes for frame in frames]
+    benchmarks: dict[str, Benchmark] = {
+        "bcc": _sync(partial(_call_all, [partial(bcc, data) for data in frame_bytes])),
+        "FrameDecoder.feed": _bench_frame_decoder(frame_bytes),
+        "FrameReader.read": _bench_frame_reader(frame_bytes),
+        "Frame.bytes": _sync(lambda: [frame.bytes for frame in frames]),
+    }
+    benchmarks.update(_structure_benchmarks(messages))
+    benchmarks["EventManager.dispatch"] = _bench_dispatch()
+    benchmarks["EcoMAX.handle_frame"] = _bench_handle_frame(
+        [message for _, message in messages[FrameType.MESSAGE_SENSOR_DATA]]
+    )
+    benchmarks.update(
+        (f"filters.{name}", _bench_filter(factory)) for name, factory in FILTERS.items()
+    )
+    return benchmarks
+
+
+def run_benchmark(
+    name: str,
+    benchmark: Benchmark,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> BenchmarkResult:
+    """Run the benchmark and return the best result.
+
+    The number of operations is doubled until the run takes at least
+    the minimum time, then the run is repeated.
+    """
+    number = 1
+    while (elapsed := benchmark(number)) < min_time:
+        number *= 2
+
+    best = min([elapsed, *(benchmark(number) for _ in range(repeat - 1))])
+    return BenchmarkResult(name, number, best / number)
+
+
+def compare(
+    results: Sequence[BenchmarkResult | MeasurementResult], baseline: dict[str, Any]
+) -> list[Comparison]:
+    """Compare the results against the baseline."""
+    baseline_results = baseline.get("results", {})
+    baseline_measurements = baseline.get("measurements", {})
+    comparisons = []
+    for result in results:
+        if isinstance(result, MeasurementResult):
+            if result.name in baseline_measurements:
+                comparisons.append(
+                    Comparison(
+                        result.name,
+                        baseline_measurements[result.name]["value"],
+                        result.value,
+                    )
+                )
+        elif result.name in baseline_results:
+            comparisons.append(
+                Comparison(
+                    result.name,
+                    baseline_results[result.name]["time_per_op"],
+                    result.time_per_op,
+                )
+            )
+
+    return comparisons
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pyplumio bench", description="Run the micro-benchmarks."
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="only run benchmarks which name contains this string",
+    )
+    parser.add_argument(
+        "--testdata",
+        type=pathlib.Path,
+        default=SAMPLE_FRAMES,
+        help="sample frames file or test data directory with the recorded frames",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help="minimum time in seconds for each run",
+    )
+    parser.add_argument(
+        "-o", "--output", type=pathlib.Path, help="write the results to this file"
+    )
+    parser.add_argument(
+        "--baseline", type=pathlib.Path, help="compare against these results"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown in percents reported as a regression",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and return the exit status.
+
+    Exit status is 1 if any benchmark regressed past the threshold.
+    """
+    args = _parse_args(argv)
+    if not args.testdata.exists():
+        print(f"Recorded frames not found in {args.testdata}", file=sys.stderr)
+        return 2
+
+    logging.disable(logging.CRITICAL)
+    try:
+        results = [
+            run_benchmark(name, benchmark, args.repeat, args.min_time)
+            for name, benchmark in create_benchmarks(args.testdata).items()
+            if args.filter in name
+        ]
+        measurements = [
+            MeasurementResult(name, measurement())
+            for name, measurement in create_measurements(args.testdata).items()
+            if args.filter in name
+        ]
+    finally:
+        logging.disable(logging.NOTSET)
+
+    report: dict[str, Any] = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "results": {
+            result.name: {
+                "number": result.number,
+                "time_per_op": result.time_per_op,
+                "ops_per_second": result.ops_per_second,
+            }
+            for result in results
+        },
+        "measurements": {
+            measurement.name: {"value": measurement.value}
+            for measurement in measurements
+        },
+    }
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fp:
+            comparisons = compare([*results, *measurements], json.load(fp))
+
+        regressions = [c.name for c in comparisons if c.change > args.threshold]
+        report["comparison"] = {
+            comparison.name: {
+                "baseline": comparison.baseline,
+                "current": comparison.current,
+                "change": comparison.change,
+                "regression": comparison.name in regressions,
+            }
+            for comparison in comparisons
+        }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    for name in regressions:
+        change = report["comparison"][name]["change"]
+        print(f"Regression: {name} is {change:.1f}% slower", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "Measurement",
+    "MeasurementResult",
+    "compare",
+    "create_benchmarks",
+    "create_measurements",
+    "load_messages",
+    "main",
+    "run_benchmark",
+]
@@ -0,0 +1,268 @@
+"""Contains raw stream capture recorder and reader."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from enum import IntEnum, unique
+import gzip
+import os
+import struct
+import time
+from typing import Any, BinaryIO, Final, Literal, NamedTuple
+
+from pyplumio.exceptions import PyPlumIOError
+from pyplumio.helpers.task_manager import TaskManager
+
+CAPTURE_MAGIC: Final = b"PYPLUMIO-CAPTURE\x01"
+GZIP_MAGIC: Final = b"\x1f\x8b"
+
+DEFAULT_FLUSH_INTERVAL: Final = 1.0
+DEFAULT_BATCH_SIZE: Final = 65536
+
+struct_capture_header: Final = struct.Struct("<d")
+struct_record_header: Final = struct.Struct("<dBI")
+
+
+class CaptureError(PyPlumIOError):
+    """Raised on invalid capture file."""
+
+
+@unique
+class Direction(IntEnum):
+    """Contains a stream directions."""
+
+    RECEIVED = 0
+    SENT = 1
+
+
+class CaptureRecord(NamedTuple):
+    """Represents a captured chunk of bytes.
+
+    Timestamp is the number of seconds since the capture start.
+    """
+
+    timestamp: float
+    direction: Direction
+    data: bytes
+
+
+def _open(
+    path: str | os.PathLike[str], mode: Literal["rb", "wb"], compress: bool = False
+) -> BinaryIO | gzip.GzipFile:
+    """Open the capture file, compressed or not."""
+    if mode == "rb":
+        with open(path, "rb") as file:
+            compress = file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+    return gzip.open(path, mode) if compress else open(path, mode)  # noqa: SIM115
+
+
+def read_capture(path: str | os.PathLike[str]) -> Iterator[CaptureRecord]:
+    """Yield records from the capture file."""
+    with _open(path, "rb") as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise CaptureError(f"Not a capture file: {path}")
+
+        file.read(struct_capture_header.size)
+        while header := file.read(struct_record_header.size):
+            if len(header) < struct_record_header.size:
+                raise CaptureError(f"Truncated capture file: {path}")
+
+            timestamp, direction, length = struct_record_header.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                raise CaptureError(f"Truncated capture file: {path}")
+
+            yield CaptureRecord(timestamp, Direction(direction), data)
+
+
+class CaptureRecorder(TaskManager):
+    """Represents a capture recorder.
+
+    Recording a chunk only appends it to the pending batch. Batches
+    are written to the file in the executor every flush interval or
+    once the batch size is exceeded, so recording never blocks the
+    event loop on disk I/O.
+    """
+
+    __slots__ = (
+        "path",
+        "compress",
+        "flush_interval",
+        "batch_size",
+        "_file",
+        "_started_at",
+        "_pending",
+        "_pending_size",
+        "_flush_requested",
+        "_flush_timer",
+        "_lock",
+    )
+
+    path: str | os.PathLike[str]
+    compress: bool
+    flush_interval: float
+    batch_size: int
+
+    _file: BinaryIO | gzip.GzipFile | None
+    _started_at: float
+    _pending: list[bytes]
+    _pending_size: int
+    _flush_requested: bool
+    _flush_timer: asyncio.TimerHandle | None
+    _lock: asyncio.Lock
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        compress: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize a new capture recorder."""
+        super().__init__()
+        self.path = path
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._file = None
+        self._started_at = 0.0
+        self._pending = []
+        self._pending_size = 0
+        self._flush_requested = False
+        self._flush_timer = None
+        self._lock = asyncio.Lock()
+
+    def _open_file(self) -> BinaryIO | gzip.GzipFile:
+        """Open the capture file and write the header."""
+        file = _open(self.path, "wb", self.compress)
+        file.write(CAPTURE_MAGIC + struct_capture_header.pack(time.time()))
+        return file
+
+    async def start(self) -> None:
+        """Open the capture file and start writing in the background."""
+        if self._file is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._file = await loop.run_in_executor(None, self._open_file)
+        self._started_at = time.monotonic()
+        self._flush_timer = loop.call_later(self.flush_interval, self._on_flush_timer)
+
+    def record(self, direction: Direction, data: bytes) -> None:
+        """Add the chunk of bytes to the pending batch."""
+        if self._file is None or not data:
+            return
+
+        self._pending.append(
+            struct_record_header.pack(
+                time.monotonic() - self._started_at, direction, len(data)
+            )
+        )
+        self._pending.append(bytes(data))
+        self._pending_size += len(data)
+        if self._pending_size >= self.batch_size:
+            self._request_flush()
+
+    def _on_flush_timer(self) -> None:
+        """Request the flush and schedule the next one."""
+        self._flush_timer = asyncio.get_running_loop().call_later(
+            self.flush_interval, self._on_flush_timer
+        )
+        self._request_flush()
+
+    def _request_flush(self) -> None:
+        """Write the pending batch in the background."""
+        if self._pending and not self._flush_requested:
+            self._flush_requested = True
+            self.create_task(self.flush(), name="capture_flush_task")
+
+    async def flush(self) -> None:
+        """Write the pending batch to the file.
+
+        Batches are written one at a time, in the order they were
+        recorded.
+        """
+        async with self._lock:
+            self._flush_requested = False
+            if not self._pending or self._file is None:
+                return
+
+            batch = b"".join(self._pending)
+            self._pending.clear()
+            self._pending_size = 0
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._file.write, batch
+            )
+
+    async def close(self) -> None:
+        """Write the pending batch and close the capture file."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        await self.wait_until_done()
+        await self.flush()
+        async with self._lock:
+            if self._file is not None:
+                file, self._file = self._file, None
+                await asyncio.get_running_loop().run_in_executor(None, file.close)
+
+
+class RecordingStreamReader:
+    """Represents a stream reader that records the received bytes."""
+
+    __slots__ = ("_reader", "_recorder")
+
+    _reader: asyncio.StreamReader
+    _recorder: CaptureRecorder
+
+    def __init__(self, reader: asyncio.StreamReader, recorder: CaptureRecorder) -> None:
+        """Initialize a new recording stream reader."""
+        self._reader = reader
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the underlying stream reader."""
+        return getattr(self._reader, name)
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read and record up to n bytes."""
+        data = await self._reader.read(n)
+        self._recorder.record(Direction.RECEIVED, data)
+        return data
+
+
+class RecordingStreamWriter:
+    """Represents a stream writer that records the sent bytes."""
+
+    __slots__ = ("_writer", "_recorder")
+
+    _writer: asyncio.StreamWriter
+    _recorder: CaptureRecorder
+
+    def __init__(self, writer: asyncio.StreamWriter, recorder: CaptureRecorder) -> None:
+        """Initialize a new recording stream writer."""
+        self._writer = writer
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the underlying stream writer."""
+        return getattr(self._writer, name)
+
+    def write(self, data: bytes) -> None:
+        """Record and write the data."""
+        self._recorder.record(Direction.SENT, data)
+        self._writer.write(data)
+
+
+__all__ = [
+    "CaptureError",
+    "CaptureRecord",
+    "CaptureRecorder",
+    "Direction",
+    "read_capture",
+    "RecordingStreamReader",
+    "RecordingStreamWriter",
+]
@@ -0,0 +1,248 @@
+"""Contains a frame decoder and encoder classes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+from typing import Final, NamedTuple, SupportsIndex
+
+from pyplumio.const import DeviceType
+from pyplumio.devices import is_known_device_type
+from pyplumio.exceptions import (
+    ChecksumError,
+    ProtocolError,
+    ReadError,
+    UnknownDeviceError,
+)
+from pyplumio.frames import (
+    BCC_INDEX,
+    DELIMITER_SIZE,
+    FRAME_START,
+    FRAME_TYPE_SIZE,
+    HEADER_SIZE,
+    Frame,
+    bcc,
+    get_frame_class,
+    struct_header,
+)
+
+MIN_FRAME_LENGTH: Final = 10
+MAX_FRAME_LENGTH: Final = 1000
+
+DEFAULT_BUFFER_SIZE: Final = 5000
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Header(NamedTuple):
+    """Represents a frame header."""
+
+    frame_length: int
+    recipient: int
+    sender: int
+    econet_type: int
+    econet_version: int
+
+
+class FrameDecoder:
+    """Represents a frame decoder.
+
+    The decoder doesn't perform any I/O. Received bytes are fed into
+    the decoder, which returns all complete frames found in them.
+
+    Bytes are kept in a preallocated buffer with read and write
+    cursors. Decoding a frame only advances the read cursor, and unread
+    bytes are moved to the beginning of the buffer only when there is
+    no space left to append new data.
+    """
+
+    __slots__ = ("_buffer", "_view", "_start", "_end", "_error")
+
+    _buffer: bytearray
+    _view: memoryview
+    _start: int
+    _end: int
+    _error: ProtocolError | None
+
+    def __init__(self, size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """Initialize a new frame decoder."""
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._error = None
+
+    def __len__(self) -> int:
+        """Return the number of unread bytes in the buffer."""
+        return self._end - self._start
+
+    def feed(self, data: bytes | bytearray) -> list[Frame]:
+        """Append the data and return all complete frames."""
+        self.extend(data)
+        return self.decode()
+
+    def decode(self) -> list[Frame]:
+        """Return all complete frames from the buffer.
+
+        Frames intended for other recipients are skipped. If a frame
+        fails to decode, the frames before it are returned and the
+        error is raised on the next call.
+        """
+        if error := self._error:
+            self._error = None
+            raise error
+
+        frames: list[Frame] = []
+        while header := self._read_header():
+            try:
+                frame = self._read_frame(header)
+            except ProtocolError as e:
+                if not frames:
+                    raise
+
+                self._error = e
+                break
+
+            if frame:
+                frames.append(frame)
+
+        return frames
+
+    def _read_header(self) -> Header | None:
+        """Locate a frame header in the buffer.
+
+        Returns None if the buffer doesn't contain a complete frame.
+        """
+        if not self.seek_to(FRAME_START) or len(self) < HEADER_SIZE:
+            return None
+
+        header = Header(
+            *struct_header.unpack_from(self._buffer, self._start)[DELIMITER_SIZE:]
+        )
+        if (
+            MIN_FRAME_LENGTH <= header.frame_length <= MAX_FRAME_LENGTH
+            and len(self) < header.frame_length
+        ):
+            return None
+
+        return header
+
+    def _read_frame(self, header: Header) -> Frame | None:
+        """Read the frame located at the header."""
+        frame_length, recipient, sender, econet_type, econet_version = header
+
+        if frame_length > MAX_FRAME_LENGTH or frame_length < MIN_FRAME_LENGTH:
+            self.consume(HEADER_SIZE)
+            raise ReadError(
+                f"Unexpected frame length ({frame_length}), expected between "
+                f"{MIN_FRAME_LENGTH} and {MAX_FRAME_LENGTH}"
+            )
+
+        frame_bytes = self._view[self._start : self._start + frame_length]
+        checksum = bcc(frame_bytes[:BCC_INDEX])
+        if checksum != frame_bytes[BCC_INDEX]:
+            self.consume(HEADER_SIZE)
+            raise ChecksumError(
+                f"Incorrect frame checksum: calculated {checksum}, "
+                f"expected {frame_bytes[BCC_INDEX]}. Frame data: {frame_bytes.hex()}"
+            )
+
+        # Copy the message out of the buffer before it's consumed.
+        frame_type = frame_bytes[HEADER_SIZE]
+        message = bytearray(frame_bytes[HEADER_SIZE + FRAME_TYPE_SIZE : BCC_INDEX])
+        frame_hex = frame_bytes.hex() if _LOGGER.isEnabledFor(logging.DEBUG) else ""
+        self.consume(frame_length)
+        if recipient not in (DeviceType.ECONET, DeviceType.ALL):
+            _LOGGER.debug(
+                "Skipping frame intended for different recipient (%s)", recipient
+            )
+            return None
+
+        if not is_known_device_type(sender):
+            raise UnknownDeviceError(f"Unknown sender type ({sender})")
+
+        frame = get_frame_class(frame_type)(
+            recipient=DeviceType(recipient),
+            sender=DeviceType(sender),
+            econet_type=econet_type,
+            econet_version=econet_version,
+            message=message,
+        )
+        _LOGGER.debug("Received frame: %s, bytes: %s", frame, frame_hex)
+
+        return frame
+
+    def extend(self, data: bytes | bytearray) -> None:
+        """Append the data to the buffer.
+
+        If the buffer capacity is exceeded, the oldest bytes are
+        discarded.
+        """
+        size = len(data)
+        capacity = len(self._buffer)
+        if size >= capacity:
+            self._view[:] = data[-capacity:]
+            self._start, self._end = 0, capacity
+            return
+
+        if self._end + size > capacity:
+            self._compact(capacity - size)
+
+        self._view[self._end : self._end + size] = data
+        self._end += size
+
+    def _compact(self, size: int) -> None:
+        """Move at most size last unread bytes to the start of the buffer."""
+        start = max(self._start, self._end - size)
+        length = self._end - start
+        self._buffer[:length] = self._buffer[start : self._end]
+        self._start, self._end = 0, length
+
+    def consume(self, size: int) -> None:
+        """Consume the specified number of bytes from the buffer."""
+        self._start = min(self._start + size, self._end)
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def seek_to(self, delimiter: SupportsIndex) -> bool:
+        """Skip unread bytes up to the first occurrence of the delimiter.
+
+        Returns True if the delimiter was found, False otherwise, in
+        which case all unread bytes are discarded.
+        """
+        if self._start == self._end:
+            return False
+
+        index = self._buffer.find(delimiter, self._start, self._end)
+        if index == -1:
+            self._start = self._end = 0
+            return False
+
+        self._start = index
+        return True
+
+    @property
+    def buffer(self) -> memoryview:
+        """Return a view of the unread bytes."""
+        return self._view[self._start : self._end]
+
+
+class FrameEncoder:
+    """Represents a frame encoder.
+
+    The encoder doesn't perform any I/O and returns the bytes to be
+    written to the stream.
+    """
+
+    __slots__ = ()
+
+    def encode(self, frame: Frame) -> bytes:
+        """Return the frame bytes."""
+        return frame.bytes
+
+    def encode_many(self, frames: Iterable[Frame]) -> bytes:
+        """Return the bytes of multiple frames."""
+        return b"".join(frame.bytes for frame in frames)
+
+
+__all__ = ["FrameDecoder", "FrameEncoder", "Header"]
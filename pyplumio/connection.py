@@ -4,25 +4,52 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from contextlib import asynccontextmanager
+from itertools import islice
 import logging
+import os
+import time
 from types import MappingProxyType
-from typing import Any, Final
+from typing import Any, Final, cast
 
 from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE
 import serial_asyncio_fast
 
-from pyplumio.devices import PhysicalDevice
+from pyplumio.capture import (
+    CaptureRecord,
+    CaptureRecorder,
+    Direction,
+    RecordingStreamReader,
+    RecordingStreamWriter,
+    read_capture,
+)
+from pyplumio.devices import PhysicalDevice, load_device_classes
 from pyplumio.exceptions import ConnectionFailedError
+from pyplumio.frames import load_frame_classes
+from pyplumio.helpers.async_cache import acache
 from pyplumio.helpers.task_manager import TaskManager
 from pyplumio.protocol import AsyncProtocol, Protocol
+from pyplumio.stream import WAIT_FOR_READ_SECONDS
 from pyplumio.utils import timeout
 
 _LOGGER = logging.getLogger(__name__)
 
 TRY_CONNECT_FOR_SECONDS: Final = 5
 RECONNECT_AFTER_SECONDS: Final = 20
+REPLAY_BATCH_SIZE: Final = 256
+
+# Longer gaps in the capture are shortened, so the reader doesn't
+# time out while replaying in real time.
+MAX_REPLAY_DELAY: Final = WAIT_FOR_READ_SECONDS / 2
+
+
+@acache
+async def load_classes() -> None:
+    """Load all frame and device classes in the executor."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, load_frame_classes)
+    await loop.run_in_executor(None, load_device_classes)
 
 
 class Connection(ABC, TaskManager):
@@ -31,10 +58,17 @@ class Connection(ABC, TaskManager):
     All specific connection classes MUST be inherited from this class.
     """
 
-    __slots__ = ("_protocol", "_reconnect_on_failure", "_options", "_retries")
+    __slots__ = (
+        "_protocol",
+        "_reconnect_on_failure",
+        "_recorder",
+        "_options",
+        "_retries",
+    )
 
     _protocol: Protocol
     _reconnect_on_failure: bool
+    _recorder: CaptureRecorder | None
     _options: dict[str, Any]
     _retries: int
 
@@ -42,6 +76,8 @@ class Connection(ABC, TaskManager):
         self,
         protocol: Protocol | None = None,
         reconnect_on_failure: bool = True,
+        *,
+        recorder: CaptureRecorder | None = None,
         **options: Any,
     ) -> None:
         """Initialize a new connection."""
@@ -54,6 +90,7 @@ class Connection(ABC, TaskManager):
 
         self._reconnect_on_failure = reconnect_on_failure
         self._protocol = protocol
+        self._recorder = recorder
         self._options = options
         self._retries = 0
 
@@ -74,6 +111,15 @@ class Connection(ABC, TaskManager):
         """Establish connection and initialize the protocol object."""
         try:
             reader, writer = await self._open_connection()
+            if self._recorder:
+                await self._recorder.start()
+                reader = cast(
+                    asyncio.StreamReader, RecordingStreamReader(reader, self._recorder)
+                )
+                writer = cast(
+                    asyncio.StreamWriter, RecordingStreamWriter(writer, self._recorder)
+                )
+
             self.protocol.connection_established(reader, writer)
         except (OSError, TimeoutError) as err:
             raise ConnectionFailedError from err
@@ -105,13 +151,18 @@ class Connection(ABC, TaskManager):
 
         Initialize a connection via connect or reconnect
         routines, depending on '_reconnect_on_failure' property.
+        Frame and device classes are loaded in the executor first,
+        so they aren't imported on the event loop once received.
         """
+        await load_classes()
         await (self._reconnect if self._reconnect_on_failure else self._connect)()
 
     async def close(self) -> None:
         """Close the connection."""
         self.cancel_tasks()
         await self.protocol.shutdown()
+        if self._recorder:
+            await self._recorder.close()
 
     @asynccontextmanager
     async def device(
@@ -128,6 +179,11 @@ class Connection(ABC, TaskManager):
         """Return the protocol object."""
         return self._protocol
 
+    @property
+    def recorder(self) -> CaptureRecorder | None:
+        """Return the capture recorder."""
+        return self._recorder
+
     @property
     def options(self) -> MappingProxyType[str, Any]:
         """Return connection options."""
@@ -156,10 +212,11 @@ class TcpConnection(Connection):
         *,
         protocol: Protocol | None = None,
         reconnect_on_failure: bool = True,
+        recorder: CaptureRecorder | None = None,
         **options: Any,
     ) -> None:
         """Initialize a new TCP connection."""
-        super().__init__(protocol, reconnect_on_failure, **options)
+        super().__init__(protocol, reconnect_on_failure, recorder=recorder, **options)
         self.host = host
         self.port = port
 
@@ -194,10 +251,11 @@ class SerialConnection(Connection):
         *,
         protocol: Protocol | None = None,
         reconnect_on_failure: bool = True,
+        recorder: CaptureRecorder | None = None,
         **options: Any,
     ) -> None:
         """Initialize a new serial connection."""
-        super().__init__(protocol, reconnect_on_failure, **options)
+        super().__init__(protocol, reconnect_on_failure, recorder=recorder, **options)
         self.url = url
         self.baudrate = baudrate
 
@@ -225,4 +283,104 @@ class SerialConnection(Connection):
         )
 
 
-__all__ = ["Connection", "TcpConnection", "SerialConnection"]
+class ReplayStreamWriter:
+    """Represents a stream writer that discards the written data."""
+
+    __slots__ = ("_closing",)
+
+    _closing: bool
+
+    def __init__(self) -> None:
+        """Initialize a new replay stream writer."""
+        self._closing = False
+
+    def write(self, data: bytes) -> None:
+        """Discard the data."""
+
+    async def drain(self) -> None:
+        """Return immediately, there's nothing to drain."""
+
+    def is_closing(self) -> bool:
+        """Return True if the writer is closed."""
+        return self._closing
+
+    def close(self) -> None:
+        """Close the writer."""
+        self._closing = True
+
+    async def wait_closed(self) -> None:
+        """Return immediately, the writer closes instantly."""
+
+
+class ReplayConnection(Connection):
+    """Represents a connection that replays a capture file.
+
+    Received bytes from the capture are fed to the protocol either
+    with their original timing or as fast as possible. In real time,
+    gaps longer than the read timeout are shortened. Written frames
+    are discarded.
+    """
+
+    __slots__ = ("path", "realtime")
+
+    path: str | os.PathLike[str]
+    realtime: bool
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        realtime: bool = False,
+        *,
+        protocol: Protocol | None = None,
+        reconnect_on_failure: bool = False,
+    ) -> None:
+        """Initialize a new replay connection."""
+        super().__init__(protocol, reconnect_on_failure)
+        self.path = path
+        self.realtime = realtime
+
+    def __repr__(self) -> str:
+        """Return a serializable string representation."""
+        return f"ReplayConnection(path={self.path}, realtime={self.realtime})"
+
+    async def _replay(self, reader: asyncio.StreamReader) -> None:
+        """Feed the received bytes from the capture to the reader."""
+        loop = asyncio.get_running_loop()
+        records: Iterator[CaptureRecord] = read_capture(self.path)
+        started_at = time.monotonic()
+        try:
+            while batch := await loop.run_in_executor(
+                None, list, islice(records, REPLAY_BATCH_SIZE)
+            ):
+                for record in batch:
+                    if record.direction != Direction.RECEIVED:
+                        continue
+
+                    if self.realtime:
+                        delay = started_at + record.timestamp - time.monotonic()
+                        if delay > MAX_REPLAY_DELAY:
+                            # Shift the following records by the skipped time.
+                            started_at -= delay - MAX_REPLAY_DELAY
+                            delay = MAX_REPLAY_DELAY
+
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+
+                    reader.feed_data(record.data)
+
+                # Let the protocol process the batch before reading the next one.
+                await asyncio.sleep(0)
+        finally:
+            reader.feed_eof()
+
+    @timeout(TRY_CONNECT_FOR_SECONDS)
+    async def _open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open the connection and return reader and writer objects."""
+        reader = asyncio.StreamReader()
+        self.create_task(self._replay(reader), name="replay_task")
+        return reader, cast(asyncio.StreamWriter, ReplayStreamWriter())
+
+
+__all__ = ["Connection", "TcpConnection", "SerialConnection", "ReplayConnection"]
@@ -5,14 +5,35 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import socket
 import struct
-from typing import ClassVar, Final, Generic, TypeVar
+from typing import ClassVar, Final, Generic, TypeAlias, TypeVar
 
 T = TypeVar("T")
 _DataTypeT = TypeVar("_DataTypeT", bound="DataType")
 
+Buffer: TypeAlias = bytes | bytearray | memoryview
+WritableBuffer: TypeAlias = bytearray | memoryview
+
+
+def _find_null(buffer: Buffer, offset: int) -> int:
+    """Return index of the null byte or the buffer length, if not found.
+
+    Memoryview doesn't support searching, so it's copied. Pass the
+    original buffer with the offset instead.
+    """
+    if isinstance(buffer, memoryview):
+        buffer = buffer.tobytes()
+
+    index = buffer.find(0, offset)
+    return len(buffer) if index < 0 else index
+
 
 class DataType(ABC, Generic[T]):
-    """Represents a data type."""
+    """Represents a data type.
+
+    Data types provide the stateless codec via the unpack_from,
+    pack_into and calcsize class methods, that work on the buffer at
+    the offset without copying it.
+    """
 
     __slots__ = ("_value", "_size")
 
@@ -61,17 +82,30 @@ class DataType(ABC, Generic[T]):
 
         return NotImplemented
 
-    def _slice_to_size(self, buffer: bytes) -> bytes:
-        """Slice the data to data type size."""
-        return buffer if self.size == 0 else buffer[: self.size]
-
     @classmethod
-    def from_bytes(cls: type[_DataTypeT], buffer: bytes, offset: int = 0) -> _DataTypeT:
+    def from_bytes(
+        cls: type[_DataTypeT], buffer: Buffer, offset: int = 0
+    ) -> _DataTypeT:
         """Initialize a new data type from bytes."""
         data_type = cls()
-        data_type.unpack(buffer[offset:])
+        data_type.unpack(buffer, offset)
         return data_type
 
+    @classmethod
+    @abstractmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[T, int]:
+        """Unpack the value at the offset and return it with its size."""
+
+    @classmethod
+    @abstractmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: T) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+
+    @classmethod
+    @abstractmethod
+    def calcsize(cls, value: T) -> int:
+        """Return the size of the packed value."""
+
     def to_bytes(self) -> bytes:
         """Convert data type to bytes."""
         return self.pack()
@@ -86,27 +120,36 @@ class DataType(ABC, Generic[T]):
         """Return the data type size."""
         return self._size
 
-    @abstractmethod
     def pack(self) -> bytes:
         """Pack the data."""
+        buffer = bytearray(self.calcsize(self.value))
+        self.pack_into(buffer, 0, self.value)
+        return bytes(buffer)
 
-    @abstractmethod
-    def unpack(self, buffer: bytes) -> None:
+    def unpack(self, buffer: Buffer, offset: int = 0) -> None:
         """Unpack the data."""
+        self._value, self._size = self.unpack_from(buffer, offset)
 
 
-class Undefined(DataType):
+class Undefined(DataType[None]):
     """Represents an undefined."""
 
     __slots__ = ()
 
-    def pack(self) -> bytes:
-        """Pack the data."""
-        return b""
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[None, int]:
+        """Unpack the value at the offset and return it with its size."""
+        return None, 0
 
-    def unpack(self, _: bytes) -> None:
-        """Unpack the data."""
-        self._value = None
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: None) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        return 0
+
+    @classmethod
+    def calcsize(cls, value: None) -> int:
+        """Return the size of the packed value."""
+        return 0
 
 
 BITARRAY_LAST_INDEX: Final = 7
@@ -138,6 +181,36 @@ class BitArray(DataType[int]):
         self._index = index
         return 0 if self._index == BITARRAY_LAST_INDEX else self._index + 1
 
+    @classmethod
+    def unpack_from(
+        cls, buffer: Buffer, offset: int = 0, index: int = 0
+    ) -> tuple[bool, int]:
+        """Unpack the bit at the offset and return it with its size.
+
+        The size is only non-zero for the last bit in the byte.
+        """
+        return (
+            bool(buffer[offset] & (1 << index)),
+            1 if index == BITARRAY_LAST_INDEX else 0,
+        )
+
+    @classmethod
+    def pack_into(
+        cls, buffer: WritableBuffer, offset: int, value: int, index: int = 0
+    ) -> int:
+        """Pack the bit into the buffer at the offset and return its size."""
+        if value:
+            buffer[offset] |= 1 << index
+        else:
+            buffer[offset] &= ~(1 << index) & 0xFF
+
+        return 1 if index == BITARRAY_LAST_INDEX else 0
+
+    @classmethod
+    def calcsize(cls, value: int) -> int:
+        """Return the size of the byte the bit is packed into."""
+        return 1
+
     def pack(self) -> bytes:
         """Pack the data."""
         if hasattr(self, "_value"):
@@ -145,9 +218,9 @@ class BitArray(DataType[int]):
 
         return b""
 
-    def unpack(self, buffer: bytes) -> None:
+    def unpack(self, buffer: Buffer, offset: int = 0) -> None:
         """Unpack the data."""
-        self._value = UnsignedChar.from_bytes(buffer[:1]).value
+        self._value = UnsignedChar.unpack_from(buffer, offset)[0]
 
     @property
     def value(self) -> bool:
@@ -163,6 +236,10 @@ class BitArray(DataType[int]):
         return 1 if self._index == BITARRAY_LAST_INDEX else 0
 
 
+IPV4_SIZE: Final = 4
+IPV6_SIZE: Final = 16
+
+
 class IPv4(DataType[str]):
     """Represents an IPv4 address."""
 
@@ -171,15 +248,23 @@ class IPv4(DataType[str]):
     @property
     def size(self) -> int:
         """Return the data type size."""
-        return 4
+        return IPV4_SIZE
 
-    def pack(self) -> bytes:
-        """Pack the data."""
-        return socket.inet_aton(self.value)
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[str, int]:
+        """Unpack the value at the offset and return it with its size."""
+        return socket.inet_ntoa(buffer[offset : offset + IPV4_SIZE]), IPV4_SIZE
 
-    def unpack(self, buffer: bytes) -> None:
-        """Unpack the data."""
-        self._value = socket.inet_ntoa(self._slice_to_size(buffer))
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: str) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        buffer[offset : offset + IPV4_SIZE] = socket.inet_aton(value)
+        return IPV4_SIZE
+
+    @classmethod
+    def calcsize(cls, value: str) -> int:
+        """Return the size of the packed value."""
+        return IPV4_SIZE
 
 
 class IPv6(DataType[str]):
@@ -190,15 +275,26 @@ class IPv6(DataType[str]):
     @property
     def size(self) -> int:
         """Return a data type size."""
-        return 16
+        return IPV6_SIZE
 
-    def pack(self) -> bytes:
-        """Pack the data."""
-        return socket.inet_pton(socket.AF_INET6, self.value)
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[str, int]:
+        """Unpack the value at the offset and return it with its size."""
+        return (
+            socket.inet_ntop(socket.AF_INET6, buffer[offset : offset + IPV6_SIZE]),
+            IPV6_SIZE,
+        )
 
-    def unpack(self, buffer: bytes) -> None:
-        """Unpack the data."""
-        self._value = socket.inet_ntop(socket.AF_INET6, self._slice_to_size(buffer))
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: str) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        buffer[offset : offset + IPV6_SIZE] = socket.inet_pton(socket.AF_INET6, value)
+        return IPV6_SIZE
+
+    @classmethod
+    def calcsize(cls, value: str) -> int:
+        """Return the size of the packed value."""
+        return IPV6_SIZE
 
 
 class String(DataType[str]):
@@ -211,14 +307,23 @@ class String(DataType[str]):
         super().__init__(value)
         self._size = len(self.value) + 1
 
-    def pack(self) -> bytes:
-        """Pack the data."""
-        return self.value.encode() + b"\0"
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[str, int]:
+        """Unpack the value at the offset and return it with its size."""
+        end = _find_null(buffer, offset)
+        return str(buffer[offset:end], "utf-8", "replace"), end - offset + 1
 
-    def unpack(self, buffer: bytes) -> None:
-        """Unpack the data."""
-        self._value = buffer.split(b"\0", 1)[0].decode("utf-8", "replace")
-        self._size = len(self.value) + 1
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: str) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        data = value.encode() + b"\0"
+        buffer[offset : offset + len(data)] = data
+        return len(data)
+
+    @classmethod
+    def calcsize(cls, value: str) -> int:
+        """Return the size of the packed value."""
+        return len(value.encode()) + 1
 
 
 class VarBytes(DataType[bytes]):
@@ -231,14 +336,24 @@ class VarBytes(DataType[bytes]):
         super().__init__(value)
         self._size = len(value) + 1
 
-    def pack(self) -> bytes:
-        """Pack the data."""
-        return UnsignedChar(self.size - 1).to_bytes() + self.value
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[bytes, int]:
+        """Unpack the value at the offset and return it with its size."""
+        size = buffer[offset] + 1
+        return bytes(buffer[offset + 1 : offset + size]), size
 
-    def unpack(self, buffer: bytes) -> None:
-        """Unpack the data."""
-        self._size = buffer[0] + 1
-        self._value = buffer[1 : self.size]
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: bytes) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        size = len(value) + 1
+        buffer[offset] = len(value)
+        buffer[offset + 1 : offset + size] = value
+        return size
+
+    @classmethod
+    def calcsize(cls, value: bytes) -> int:
+        """Return the size of the packed value."""
+        return len(value) + 1
 
 
 class VarString(DataType[str]):
@@ -251,31 +366,50 @@ class VarString(DataType[str]):
         super().__init__(value)
         self._size = len(value) + 1
 
-    def pack(self) -> bytes:
-        """Pack the data."""
-        return UnsignedChar(self.size - 1).to_bytes() + self.value.encode()
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[str, int]:
+        """Unpack the value at the offset and return it with its size."""
+        size = buffer[offset] + 1
+        return str(buffer[offset + 1 : offset + size], "utf-8", "replace"), size
 
-    def unpack(self, buffer: bytes) -> None:
-        """Unpack the data."""
-        self._size = buffer[0] + 1
-        self._value = buffer[1 : self.size].decode("utf-8", "replace")
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: str) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        return VarBytes.pack_into(buffer, offset, value.encode())
+
+    @classmethod
+    def calcsize(cls, value: str) -> int:
+        """Return the size of the packed value."""
+        return len(value.encode()) + 1
 
 
 class BuiltInDataType(DataType[T], ABC):
     """Represents a data type that is supported by the struct module."""
 
-    __slots__ = ("_struct",)
+    __slots__ = ()
 
     _struct: ClassVar[struct.Struct]
 
+    @classmethod
+    def unpack_from(cls, buffer: Buffer, offset: int = 0) -> tuple[T, int]:
+        """Unpack the value at the offset and return it with its size."""
+        return cls._struct.unpack_from(buffer, offset)[0], cls._struct.size
+
+    @classmethod
+    def pack_into(cls, buffer: WritableBuffer, offset: int, value: T) -> int:
+        """Pack the value into the buffer at the offset and return its size."""
+        cls._struct.pack_into(buffer, offset, value)
+        return cls._struct.size
+
+    @classmethod
+    def calcsize(cls, value: T) -> int:
+        """Return the size of the packed value."""
+        return cls._struct.size
+
     def pack(self) -> bytes:
         """Pack the data."""
         return self._struct.pack(self.value)
 
-    def unpack(self, buffer: bytes) -> None:
-        """Unpack the data."""
-        self._value = self._struct.unpack_from(buffer)[0]
-
     @property
     def size(self) -> int:
         """Return a data type size."""
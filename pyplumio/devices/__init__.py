@@ -4,22 +4,29 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from contextlib import suppress
 from functools import cache
+import importlib
 import logging
-from typing import Any, ClassVar, TypeVar
+from typing import Any, ClassVar, Final, TypeVar
 
 from pyplumio.const import ATTR_FRAME_ERRORS, DeviceType, FrameType, State
 from pyplumio.exceptions import RequestError, UnknownDeviceError
 from pyplumio.filters import on_change
 from pyplumio.frames import Frame, Request, is_known_frame_type
 from pyplumio.helpers.event_manager import EventManager, event_listener
+from pyplumio.helpers.task_manager import OverflowPolicy
 from pyplumio.parameters import Numeric, Parameter
+from pyplumio.request_tracker import RequestTracker
 from pyplumio.structures.network_info import NetworkInfo
-from pyplumio.utils import create_instance, to_camelcase
+from pyplumio.utils import to_camelcase
 
 _LOGGER = logging.getLogger(__name__)
 
+SET_MANY_CONCURRENCY: Final = 5
+SET_NOWAIT_LIMIT: Final = 32
+
 
 @cache
 def is_known_device_type(device_type: int) -> bool:
@@ -48,6 +55,27 @@ def get_device_handler(device_type: int) -> str:
     return f"devices.{type_name.lower()}.{type_name}"
 
 
+@cache
+def get_device_class(device_type: int) -> type[PhysicalDevice]:
+    """Return handler class for the device type."""
+    module_name, class_name = get_device_handler(device_type).rsplit(".", 1)
+    try:
+        device_class: type[PhysicalDevice] = getattr(
+            importlib.import_module(f"pyplumio.{module_name}"), class_name
+        )
+    except (ImportError, AttributeError) as e:
+        raise UnknownDeviceError(f"Unsupported device type ({device_type})") from e
+
+    return device_class
+
+
+def load_device_classes() -> None:
+    """Load handler classes for all supported device types."""
+    for device_type in DeviceType:
+        with suppress(UnknownDeviceError):
+            get_device_class(device_type)
+
+
 class Device(ABC, EventManager):
     """Represents a device."""
 
@@ -59,6 +87,7 @@ class Device(ABC, EventManager):
         """Initialize a new device."""
         super().__init__()
         self._write_queue = write_queue
+        self.create_group("set", SET_NOWAIT_LIMIT, OverflowPolicy.COALESCE)
 
     def queue_send(self, frame: Frame) -> None:
         """Send frame to the write queue."""
@@ -118,10 +147,69 @@ class Device(ABC, EventManager):
             retrying and doesn't block, defaults to `None`
         :type timeout: float, optional
         """
-        self.create_task(self.set(name, value, retries, timeout))
+        self.create_group_task(
+            "set", self.set(name, value, retries, timeout), name=f"set_{name}"
+        )
+
+    async def set_many(
+        self,
+        values: Mapping[str, Numeric | State | bool],
+        concurrency: int = SET_MANY_CONCURRENCY,
+        retries: int = 0,
+        timeout: float = 5.0,
+    ) -> dict[str, bool]:
+        """Set multiple parameter values.
+
+        All values are validated before any request is sent. Requests
+        are then sent without waiting for the previous ones to be
+        confirmed, keeping at most `concurrency` of them unconfirmed
+        at a time, so that the next parameters frame from the device
+        confirms them all.
+
+        :param values: New values for the parameters by their names
+        :type values: Mapping[str, int | float | bool | Literal["on", "off"]]
+        :param concurrency: Maximum number of unconfirmed requests,
+            defaults to 5
+        :type concurrency: int, optional
+        :param retries: Try setting each parameter for this amount of
+            times, defaults to 0 (disabled)
+        :type retries: int, optional
+        :param timeout: Wait this amount of seconds for confirmation
+            of each parameter, defaults to 5.0
+        :type timeout: float, optional
+        :return: Results of the parameter updates by their names,
+            `True` if parameter was successfully set, `False`
+            otherwise.
+        :rtype: dict[str, bool]
+        :raise ValueError: when a new value is outside of allowed range
+        :raise TypeError: when found data is not valid parameter
+        """
+        parameters: dict[str, Parameter] = {}
+        for name, value in values.items():
+            parameter = self.get_nowait(name, None)
+            if not isinstance(parameter, Parameter):
+                raise TypeError(
+                    f"The parameter '{name}' is not valid or does not exist."
+                )
+
+            parameter.validate(value)
+            parameters[name] = parameter
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _set(parameter: Parameter, value: Numeric | State | bool) -> bool:
+            """Set a parameter value, once there is a free slot."""
+            async with semaphore:
+                return await parameter.set(value, retries=retries, timeout=timeout)
+
+        results = await asyncio.gather(
+            *(_set(parameters[name], value) for name, value in values.items())
+        )
+        return dict(zip(parameters, results, strict=True))
 
     async def shutdown(self) -> None:
-        """Cancel device tasks."""
+        """Cancel device tasks and close the streams."""
+        self.close_streams()
         self.cancel_tasks()
         await self.wait_until_done()
 
@@ -133,20 +221,25 @@ class PhysicalDevice(Device, ABC):
     logical devices associated with them via parent property.
     """
 
-    __slots__ = ("address", "_network_info", "_frame_versions")
+    __slots__ = ("address", "_network_info", "_frame_versions", "_request_tracker")
 
     address: ClassVar[int]
 
     _network_info: NetworkInfo
     _frame_versions: dict[int, int]
+    _request_tracker: RequestTracker | None
 
     def __init__(
-        self, write_queue: asyncio.Queue[Frame], network_info: NetworkInfo
+        self,
+        write_queue: asyncio.Queue[Frame],
+        network_info: NetworkInfo,
+        request_tracker: RequestTracker | None = None,
     ) -> None:
         """Initialize a new physical device."""
         super().__init__(write_queue)
         self._network_info = network_info
         self._frame_versions = {}
+        self._request_tracker = request_tracker
 
     @event_listener(filter=on_change)
     async def on_event_frame_versions(self, versions: dict[int, int]) -> None:
@@ -158,12 +251,7 @@ class PhysicalDevice(Device, ABC):
                 and self.supports_frame_type(frame_type)
                 and not self.has_frame_version(frame_type, version)
             ):
-                request_frame_type = (
-                    FrameType.REQUEST_ECOMAX_PARAMETERS
-                    if frame_type == FrameType.REQUEST_ECOMAX_PARAMETER_CHANGES
-                    else frame_type
-                )
-                await self._request_frame_version(request_frame_type, version)
+                await self._request_frame_version(frame_type, version)
                 self._frame_versions[frame_type] = version
 
     async def _request_frame_version(
@@ -171,7 +259,10 @@ class PhysicalDevice(Device, ABC):
     ) -> None:
         """Request frame version from the device."""
         _LOGGER.debug("Updating frame %s to version %i", repr(frame_type), version)
-        request = await Request.create(frame_type, recipient=self.address)
+        if frame_type == FrameType.REQUEST_ECOMAX_PARAMETER_CHANGES:
+            frame_type = FrameType.REQUEST_ECOMAX_PARAMETERS
+
+        request = Request.create_nowait(frame_type, recipient=self.address)
         self.queue_send(request)
 
     def has_frame_version(self, frame_type: FrameType | int, version: int) -> bool:
@@ -181,6 +272,10 @@ class PhysicalDevice(Device, ABC):
             and self._frame_versions[frame_type] == version
         )
 
+    def get_frame_version(self, frame_type: FrameType | int) -> int | None:
+        """Return the last known frame version."""
+        return self._frame_versions.get(frame_type)
+
     def supports_frame_type(self, frame_type: int) -> bool:
         """Check if frame type is supported by the device."""
         return frame_type not in self.data.get(ATTR_FRAME_ERRORS, [])
@@ -189,8 +284,7 @@ class PhysicalDevice(Device, ABC):
         """Handle frame received from the device."""
         frame.assign_to(self)
         if frame.data is not None:
-            for name, value in frame.data.items():
-                self.dispatch_nowait(name, value)
+            self.dispatch_many_nowait(frame.data)
 
     async def request(
         self, name: str, frame_type: FrameType, retries: int = 3, timeout: float = 3.0
@@ -198,15 +292,22 @@ class PhysicalDevice(Device, ABC):
         """Send request and wait for a value to become available.
 
         If value is not available before timeout, retry request.
+        Timeout applies to both the response and the value.
         """
         _LOGGER.info("Requesting '%s' with %s", name, repr(frame_type))
-        request = await Request.create(frame_type, recipient=self.address)
+        request = Request.create_nowait(frame_type, recipient=self.address)
+        tracker = self._request_tracker if hasattr(request, "response") else None
         initial_retries = retries
         while retries > 0:
             try:
-                self.queue_send(request)
-                return await self.get(name, timeout=timeout)
+                return await asyncio.wait_for(
+                    self._send_request(name, request, tracker), timeout=timeout
+                )
             except TimeoutError:
+                if tracker:
+                    # Response is missing, send the request again on retry.
+                    tracker.discard(request)
+
                 retries -= 1
 
         raise RequestError(
@@ -215,10 +316,40 @@ class PhysicalDevice(Device, ABC):
             frame_type=frame_type,
         )
 
+    async def _send_request(
+        self, name: str, request: Request, tracker: RequestTracker | None
+    ) -> Any:
+        """Send the request and wait for a value to become available.
+
+        With the request tracker, the request isn't sent if the same
+        request is already waiting for the response.
+        """
+        if tracker is None:
+            self.queue_send(request)
+        else:
+            if not tracker.is_pending(request):
+                self.queue_send(request)
+
+            await asyncio.shield(tracker.expect(request))
+
+        return await self.get(name)
+
     @classmethod
     async def create(cls, device_type: DeviceType, **kwargs: Any) -> PhysicalDevice:
         """Create a physical device handler object."""
-        return await create_instance(get_device_handler(device_type), cls=cls, **kwargs)
+        return cls.create_nowait(device_type, **kwargs)
+
+    @classmethod
+    def create_nowait(cls, device_type: DeviceType, **kwargs: Any) -> PhysicalDevice:
+        """Create a physical device handler object without waiting."""
+        device_class = get_device_class(device_type)
+        if not issubclass(device_class, cls):
+            raise TypeError(
+                f"Expected subclass of '{cls.__name__}', but got "
+                f"'{device_class.__name__}' for device type ({device_type})"
+            )
+
+        return device_class(**kwargs)
 
 
 class LogicalDevice(Device, ABC):
@@ -259,6 +390,10 @@ __all__ = [
     "PhysicalDevice",
     "LogicalDevice",
     "device_hander",
+    "get_device_class",
     "get_device_handler",
     "is_known_device_type",
+    "load_device_classes",
+    "SET_MANY_CONCURRENCY",
+    "SET_NOWAIT_LIMIT",
 ]
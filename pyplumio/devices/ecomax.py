@@ -9,10 +9,12 @@ import time
 from typing import Any, Final, NamedTuple
 
 from pyplumio.const import (
+    ATTR_COUNT,
     ATTR_FRAME_ERRORS,
     ATTR_PASSWORD,
     ATTR_SENSORS,
     ATTR_SETUP,
+    ATTR_START,
     STATE_OFF,
     STATE_ON,
     DeviceState,
@@ -27,15 +29,18 @@ from pyplumio.exceptions import RequestError
 from pyplumio.filters import on_change
 from pyplumio.frames import Frame, Request
 from pyplumio.helpers.event_manager import event_listener
+from pyplumio.helpers.task_manager import OverflowPolicy
 from pyplumio.parameters import ParameterValues
 from pyplumio.parameters.ecomax import (
     ECOMAX_CONTROL_PARAMETER,
     THERMOSTAT_PROFILE_PARAMETER,
     EcomaxNumber,
+    EcomaxParameter,
     EcomaxSwitch,
     EcomaxSwitchDescription,
     get_ecomax_parameter_types,
 )
+from pyplumio.request_tracker import RequestTracker
 from pyplumio.structures.alerts import ATTR_TOTAL_ALERTS
 from pyplumio.structures.ecomax_parameters import (
     ATTR_ECOMAX_CONTROL,
@@ -50,7 +55,7 @@ from pyplumio.structures.schedules import (
     SCHEDULE_PARAMETERS,
     SCHEDULES,
     Schedule,
-    ScheduleDay,
+    ScheduleEditor,
     ScheduleNumber,
     ScheduleSwitch,
     ScheduleSwitchDescription,
@@ -128,16 +133,29 @@ WAIT_FOR_SETUP_SECONDS: Final = 60.0
 class EcoMAX(PhysicalDevice):
     """Represents an ecoMAX controller."""
 
-    __slots__ = ("_fuel_meter",)
+    __slots__ = (
+        "_ecomax_parameters",
+        "_fuel_meter",
+        "_schedule_editor",
+    )
 
+    _ecomax_parameters: dict[int, EcomaxParameter]
     _fuel_meter: FuelMeter
+    _schedule_editor: ScheduleEditor
 
     def __init__(
-        self, write_queue: asyncio.Queue[Frame], network_info: NetworkInfo
+        self,
+        write_queue: asyncio.Queue[Frame],
+        network_info: NetworkInfo,
+        request_tracker: RequestTracker | None = None,
     ) -> None:
         """Initialize a new ecoMAX controller."""
-        super().__init__(write_queue, network_info)
+        super().__init__(write_queue, network_info, request_tracker)
+        self._ecomax_parameters = {}
         self._fuel_meter = FuelMeter()
+        self._schedule_editor = ScheduleEditor(self)
+        # Change the state one request at a time, in the called order.
+        self.create_group("state", 1, OverflowPolicy.WAIT)
 
     def handle_frame(self, frame: Frame) -> None:
         """Handle frame received from the ecoMAX device."""
@@ -184,9 +202,39 @@ class EcoMAX(PhysicalDevice):
     ) -> None:
         """Request frame version from the device."""
         setup_done = self.get_nowait(ATTR_SETUP, False)
-        if setup_done or frame_type not in REQUIRED_TYPES:
+        if frame_type == FrameType.REQUEST_ECOMAX_PARAMETER_CHANGES:
+            if setup_done:
+                self._request_parameter_changes(version)
+        elif setup_done or frame_type not in REQUIRED_TYPES:
             await super()._request_frame_version(frame_type, version)
 
+    def _request_parameter_changes(self, version: int) -> None:
+        """Request ecoMAX parameters that were changed.
+
+        Frame version only tells that parameters were changed, so the
+        range of parameters with pending updates is requested only
+        when the number of changes since the last version matches
+        the number of pending updates. Otherwise, all parameters are
+        requested, so the changes made on the panel aren't missed.
+        """
+        _LOGGER.debug("Updating ecoMAX parameter changes to version %i", version)
+        indexes = [
+            index
+            for index, parameter in self._ecomax_parameters.items()
+            if parameter.pending
+        ]
+        previous = self.get_frame_version(FrameType.REQUEST_ECOMAX_PARAMETER_CHANGES)
+        data: dict[str, Any] = {}
+        if indexes and previous is not None and version - previous == len(indexes):
+            start = min(indexes)
+            data = {ATTR_START: start, ATTR_COUNT: max(indexes) - start + 1}
+
+        self.queue_send(
+            Request.create_nowait(
+                FrameType.REQUEST_ECOMAX_PARAMETERS, recipient=self.address, **data
+            )
+        )
+
     async def _set_ecomax_state(self, state: State) -> bool:
         """Try to set the ecoMAX control state."""
         try:
@@ -206,11 +254,16 @@ class EcoMAX(PhysicalDevice):
 
     def turn_on_nowait(self) -> None:
         """Turn on the ecoMAX controller without waiting."""
-        self.create_task(self.turn_on())
+        self.create_group_task("state", self.turn_on())
 
     def turn_off_nowait(self) -> None:
         """Turn off the ecoMAX controller without waiting."""
-        self.create_task(self.turn_off())
+        self.create_group_task("state", self.turn_off())
+
+    @property
+    def schedule_editor(self) -> ScheduleEditor:
+        """Return the schedule editor."""
+        return self._schedule_editor
 
     async def shutdown(self) -> None:
         """Shutdown tasks for the ecoMAX controller and sub-devices."""
@@ -218,6 +271,7 @@ class EcoMAX(PhysicalDevice):
         thermostats: dict[str, Thermostat] = self.get_nowait(ATTR_THERMOSTATS, {})
         devices = (mixers | thermostats).values()
         await asyncio.gather(*(device.shutdown() for device in devices))
+        self._schedule_editor.close()
         await super().shutdown()
 
     @event_listener
@@ -261,6 +315,15 @@ class EcoMAX(PhysicalDevice):
         def _ecomax_parameter_events() -> Generator[Coroutine[Any, Any, None]]:
             """Get dispatch calls for ecoMAX parameter events."""
             for index, values in parameters:
+                parameter = self._ecomax_parameters.get(index)
+                if (
+                    parameter is not None
+                    and not parameter.pending
+                    and parameter.values == values
+                ):
+                    # Parameter is unchanged since the last update.
+                    continue
+
                 try:
                     description = parameter_types[index]
                 except IndexError:
@@ -280,12 +343,11 @@ class EcoMAX(PhysicalDevice):
                     if isinstance(description, EcomaxSwitchDescription)
                     else EcomaxNumber
                 )
-                yield self.dispatch(
-                    description.name,
-                    handler.create_or_update(
-                        device=self, description=description, values=values, index=index
-                    ),
+                parameter = handler.create_or_update(
+                    device=self, description=description, values=values, index=index
                 )
+                self._ecomax_parameters[index] = parameter
+                yield self.dispatch(description.name, parameter)
 
         await asyncio.gather(*_ecomax_parameter_events())
         return True
@@ -358,9 +420,7 @@ class EcoMAX(PhysicalDevice):
     async def on_event_sensors(self, sensors: dict[str, Any]) -> bool:
         """Update ecoMAX sensors and dispatch the events."""
         _LOGGER.debug("Received device sensors")
-        await asyncio.gather(
-            *(self.dispatch(name, value) for name, value in sensors.items())
-        )
+        await self.dispatch_many(sensors)
         return True
 
     @event_listener
@@ -414,21 +474,17 @@ class EcoMAX(PhysicalDevice):
 
     @event_listener
     async def on_event_schedules(
-        self, schedules: list[tuple[int, list[list[bool]]]]
+        self, schedules: list[tuple[int, bytes]]
     ) -> dict[str, Schedule]:
         """Update schedules."""
         _LOGGER.debug("Received device schedules")
+        editor = self._schedule_editor
+        for index, schedule in schedules:
+            editor.update(SCHEDULES[index], schedule)
+
         return {
-            SCHEDULES[index]: Schedule(
-                name=SCHEDULES[index],
-                device=self,
-                monday=ScheduleDay.from_iterable(schedule[1]),
-                tuesday=ScheduleDay.from_iterable(schedule[2]),
-                wednesday=ScheduleDay.from_iterable(schedule[3]),
-                thursday=ScheduleDay.from_iterable(schedule[4]),
-                friday=ScheduleDay.from_iterable(schedule[5]),
-                saturday=ScheduleDay.from_iterable(schedule[6]),
-                sunday=ScheduleDay.from_iterable(schedule[0]),
+            SCHEDULES[index]: Schedule.from_bytes(
+                SCHEDULES[index], self, schedule, editor=editor
             )
             for index, schedule in schedules
         }
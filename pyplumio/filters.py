@@ -86,7 +86,7 @@ def is_close(
     old: _ComparableT, new: _ComparableT, *, tolerance: float | None = DEFAULT_TOLERANCE
 ) -> bool:
     """Check if value is significantly changed."""
-    if isinstance(new, Parameter) and new.update_pending.is_set():
+    if isinstance(new, Parameter) and new.pending:
         return False
 
     if tolerance and isinstance(old, SupportsFloat) and isinstance(new, SupportsFloat):
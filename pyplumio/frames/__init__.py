@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from contextlib import suppress
 from functools import cache, reduce
+import importlib
 import struct
 from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar
 
 from pyplumio.const import DeviceType, FrameType
 from pyplumio.exceptions import UnknownFrameError
-from pyplumio.utils import create_instance, ensure_dict, to_camelcase
+from pyplumio.utils import ensure_dict, to_camelcase
 
 if TYPE_CHECKING:
     from pyplumio.structures import Structure
@@ -36,7 +38,7 @@ if TYPE_CHECKING:
     from pyplumio.devices import PhysicalDevice
 
 
-def bcc(buffer: bytes) -> int:
+def bcc(buffer: bytes | bytearray | memoryview) -> int:
     """Return a block check character."""
     return reduce(lambda x, y: x ^ y, buffer)
 
@@ -62,6 +64,27 @@ def get_frame_handler(frame_type: int) -> str:
     return f"frames.{module.lower()}s.{type_name}{module.capitalize()}"
 
 
+@cache
+def get_frame_class(frame_type: int) -> type[Frame]:
+    """Return handler class for the frame type."""
+    module_name, class_name = get_frame_handler(frame_type).rsplit(".", 1)
+    try:
+        frame_class: type[Frame] = getattr(
+            importlib.import_module(f"pyplumio.{module_name}"), class_name
+        )
+    except (ImportError, AttributeError) as e:
+        raise UnknownFrameError(f"Unsupported frame type ({frame_type})") from e
+
+    return frame_class
+
+
+def load_frame_classes() -> None:
+    """Load handler classes for all supported frame types."""
+    for frame_type in FrameType:
+        with suppress(UnknownFrameError):
+            get_frame_class(frame_type)
+
+
 _FrameT = TypeVar("_FrameT", bound="Frame")
 
 
@@ -231,7 +254,19 @@ class Frame(ABC):
     @classmethod
     async def create(cls: type[_FrameT], frame_type: int, **kwargs: Any) -> _FrameT:
         """Create a frame handler object from frame type."""
-        return await create_instance(get_frame_handler(frame_type), cls=cls, **kwargs)
+        return cls.create_nowait(frame_type, **kwargs)
+
+    @classmethod
+    def create_nowait(cls: type[_FrameT], frame_type: int, **kwargs: Any) -> _FrameT:
+        """Create a frame handler object from frame type without waiting."""
+        frame_class = get_frame_class(frame_type)
+        if not issubclass(frame_class, cls):
+            raise TypeError(
+                f"Expected subclass of '{cls.__name__}', but got "
+                f"'{frame_class.__name__}' for frame type ({frame_type})"
+            )
+
+        return frame_class(**kwargs)
 
     @abstractmethod
     def create_message(self, data: dict[str, Any]) -> bytearray:
@@ -393,6 +428,8 @@ __all__ = [
     "contains",
     "expect_response",
     "frame_handler",
+    "get_frame_class",
     "get_frame_handler",
     "is_known_frame_type",
+    "load_frame_classes",
 ]
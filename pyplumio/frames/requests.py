@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, cast
 
 from pyplumio.const import (
@@ -20,8 +21,7 @@ from pyplumio.const import (
 )
 from pyplumio.exceptions import FrameDataError
 from pyplumio.frames import Request, expect_response, frame_handler, responses
-from pyplumio.structures.schedules import SCHEDULES
-from pyplumio.utils import join_bits
+from pyplumio.structures.schedules import SCHEDULES, Schedule, ScheduleDay
 
 
 @frame_handler(FrameType.REQUEST_ALERTS)
@@ -182,12 +182,18 @@ class SetScheduleRequest(Request):
             message += schedule_type.to_bytes(length=1, byteorder="little")
             message += int(data[ATTR_SWITCH]).to_bytes(length=1, byteorder="little")
             message += int(data[ATTR_PARAMETER]).to_bytes(length=1, byteorder="little")
-            schedule = cast(list[list[bool]], data[ATTR_SCHEDULE])
+            schedule = cast(Schedule | Iterable[Iterable[bool]], data[ATTR_SCHEDULE])
         except (KeyError, ValueError) as e:
             raise FrameDataError from e
 
-        return bytearray(message) + bytearray(
-            join_bits(day[i : i + 8]) for day in schedule for i in range(0, len(day), 8)
+        if isinstance(schedule, Schedule):
+            return bytearray(message + schedule.to_bytes())
+
+        return bytearray(message) + b"".join(
+            (
+                day if isinstance(day, ScheduleDay) else ScheduleDay.from_iterable(day)
+            ).to_bytes()
+            for day in schedule
         )
 
 
@@ -1,52 +1,283 @@
 """Contains a simple async cache for caching results of async functions."""
 
-from collections.abc import Awaitable, Callable, Coroutine
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
 from functools import wraps
+import time
 from types import MappingProxyType
-from typing import Any, ParamSpec, TypeVar, cast
+from typing import Any, Final, NamedTuple, ParamSpec, Protocol, TypeVar, cast, overload
+import warnings
+from weakref import WeakKeyDictionary
 
 T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
 P = ParamSpec("P")
 
+DEFAULT_MAXSIZE: Final = 128
+
+# Separates positional and keyword arguments in the cache key.
+_KWARGS_MARK: Final = (object(),)
+
+
+class CacheInfo(NamedTuple):
+    """Represents the cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class CachedFunction(Protocol[P, T_co]):
+    """Represents an async function decorated with acache."""
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Coroutine[Any, Any, T_co]:
+        """Call the function or return the cached result."""
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> CachedFunction[P, T_co]: ...
+
+    @overload
+    def __get__(
+        self, instance: object, owner: type | None = None
+    ) -> Callable[..., Coroutine[Any, Any, T_co]]: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        """Return the function bound to the instance."""
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics."""
+
+    def cache_clear(self) -> None:
+        """Remove all entries from the cache."""
+
 
 class AsyncCache:
-    """A simple cache for asynchronous functions."""
+    """A simple cache for asynchronous functions.
+
+    The least recently used entry is evicted when the cache is full,
+    and entries older than the time to live are recomputed. Concurrent
+    calls for the same key await a single computation.
+    """
 
-    __slots__ = ("_cache",)
+    __slots__ = (
+        "_cache",
+        "_expires",
+        "_pending",
+        "hits",
+        "misses",
+        "maxsize",
+        "ttl",
+    )
 
-    _cache: dict[str, Any]
+    _cache: OrderedDict[Hashable, Any]
+    _expires: dict[Hashable, float]
+    _pending: dict[Hashable, asyncio.Future[Any]]
+    hits: int
+    misses: int
+    maxsize: int | None
+    ttl: float | None
 
-    def __init__(self) -> None:
+    def __init__(
+        self, maxsize: int | None = DEFAULT_MAXSIZE, ttl: float | None = None
+    ) -> None:
         """Initialize the cache."""
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expires = {}
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+        self.ttl = ttl
 
-    async def get(self, key: str, coro: Callable[..., Awaitable[Any]]) -> Any:
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._cache)
+
+    async def get(self, key: Hashable, coro: Callable[[], Awaitable[Any]]) -> Any:
         """Get a value from the cache or compute and store it."""
-        if key not in self.cache:
-            self._cache[key] = await coro()
+        if key in self._cache and not self._is_expired(key):
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        while (future := self._pending.get(key)) is not None:
+            try:
+                value = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+                # Computing call was cancelled, so one of the waiting
+                # calls computes the value instead.
+                continue
+
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await coro()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark exception as retrieved when there are no waiters.
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self.set(key, value)
+        finally:
+            del self._pending[key]
+
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache."""
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if self.ttl is not None:
+            self._expires[key] = time.monotonic() + self.ttl
+
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            oldest, _ = self._cache.popitem(last=False)
+            self._expires.pop(oldest, None)
+
+    def _is_expired(self, key: Hashable) -> bool:
+        """Check if the entry has expired and remove it."""
+        if self.ttl is None or self._expires[key] > time.monotonic():
+            return False
 
-        return self._cache[key]
+        del self._cache[key]
+        del self._expires[key]
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._cache.clear()
+        self._expires.clear()
+        self.hits = self.misses = 0
+
+    @property
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
 
     @property
-    def cache(self) -> MappingProxyType[str, Any]:
+    def cache(self) -> MappingProxyType[Hashable, Any]:
         """Return the internal cache dictionary."""
         return MappingProxyType(self._cache)
 
 
-# Create a global cache instance
-async_cache = AsyncCache()
+def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """Return a hashable cache key from the call arguments."""
+    if not kwargs:
+        return args
+
+    return args + _KWARGS_MARK + tuple(kwargs.items())
+
+
+@overload
+def acache(func: Callable[P, Awaitable[T]], /) -> CachedFunction[P, T]: ...
+
+
+@overload
+def acache(
+    *,
+    maxsize: int | None = ...,
+    ttl: float | None = ...,
+    per_instance: bool = ...,
+) -> Callable[[Callable[P, Awaitable[T]]], CachedFunction[P, T]]: ...
+
+
+def acache(
+    func: Callable[P, Awaitable[T]] | None = None,
+    /,
+    *,
+    maxsize: int | None = DEFAULT_MAXSIZE,
+    ttl: float | None = None,
+    per_instance: bool = False,
+) -> Any:
+    """Cache the result of an async function.
+
+    Each decorated function gets its own cache. With per_instance set,
+    the first argument is treated as an instance, which gets its own
+    cache that is discarded together with the instance.
+
+    Cache statistics are available via cache_info() and caches can
+    be emptied via cache_clear() on the decorated function.
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> CachedFunction[P, T]:
+        caches: WeakKeyDictionary[Any, AsyncCache] = WeakKeyDictionary()
+        shared_cache = AsyncCache(maxsize, ttl)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if not per_instance:
+                key = make_key(args, kwargs)
+                return cast(
+                    T, await shared_cache.get(key, lambda: func(*args, **kwargs))
+                )
+
+            instance = args[0]
+            if (cache := caches.get(instance)) is None:
+                cache = caches[instance] = AsyncCache(maxsize, ttl)
+
+            key = make_key(args[1:], kwargs)
+            return cast(T, await cache.get(key, lambda: func(*args, **kwargs)))
+
+        def cache_info() -> CacheInfo:
+            """Return the cache statistics."""
+            if not per_instance:
+                return shared_cache.info
+
+            infos = [cache.info for cache in caches.values()]
+            return CacheInfo(
+                hits=sum(info.hits for info in infos),
+                misses=sum(info.misses for info in infos),
+                maxsize=maxsize,
+                currsize=sum(info.currsize for info in infos),
+            )
+
+        def cache_clear() -> None:
+            """Remove all entries from the cache."""
+            shared_cache.clear()
+            caches.clear()
+
+        setattr(wrapper, "cache_info", cache_info)
+        setattr(wrapper, "cache_clear", cache_clear)
+        return cast(CachedFunction[P, T], wrapper)
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
 
+_async_cache = AsyncCache(maxsize=None)
 
-def acache(func: Callable[P, Awaitable[T]]) -> Callable[P, Coroutine[Any, Any, T]]:
-    """Cache the result of an async function."""
 
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        func_name = f"{func.__module__}.{func.__qualname__}"
-        key = f"{func_name}:{args}:{kwargs}"
-        return cast(T, await async_cache.get(key, lambda: func(*args, **kwargs)))
+def __getattr__(name: str) -> Any:
+    """Return the deprecated module attributes."""
+    if name == "async_cache":
+        warnings.warn(
+            "async_cache is deprecated, use acache decorator or AsyncCache instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _async_cache
 
-    return wrapper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["acache", "async_cache"]
+__all__ = ["acache", "AsyncCache", "CacheInfo", "CachedFunction", "make_key"]
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Generator
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator, Iterable, Mapping
+from enum import Enum, unique
 import inspect
 import logging
+import time
 from types import MappingProxyType
-from typing import Any, Generic, NewType, TypeAlias, TypeVar, overload
+from typing import Any, Final, Generic, NewType, TypeAlias, TypeVar, overload
 
-from pyplumio.helpers.task_manager import TaskManager
+from pyplumio.helpers.task_manager import OverflowPolicy, TaskManager
 
 EventCallback: TypeAlias = Callable[..., Coroutine[Any, Any, Any]]
 _FilterFunc: TypeAlias = Callable[[EventCallback], Any]
@@ -57,26 +60,245 @@ def event_listener(name: Any = None, filter: Any = None) -> Any:
 
 _EventDataT = TypeVar("_EventDataT")
 _DefaultT = TypeVar("_DefaultT")
+_StreamT = TypeVar("_StreamT", bound="_Stream[Any]")
 
 StopPropagationType = NewType("StopPropagationType", object)
 StopPropagation = StopPropagationType(object())
 
+STREAM_MAXSIZE: Final = 32
+
+# Number of dispatches to run at once, while others wait for a free
+# slot. Some of the callbacks wait for other events during the setup,
+# so the limit must leave the room for these.
+DISPATCH_LIMIT: Final = 64
+
+
+@unique
+class StreamMode(Enum):
+    """Contains the stream buffer modes."""
+
+    DROP_OLDEST = "drop_oldest"
+    LATEST = "latest"
+
+
+class _Stream(Generic[_EventDataT]):
+    """Represents a base for the event streams.
+
+    Values are buffered per stream, so slow consumers never hold up
+    the dispatch. In the latest mode only the newest value of each
+    event is kept, otherwise the oldest value is dropped once the
+    buffer is full.
+    """
+
+    __slots__ = ("names", "mode", "_closed", "_latest", "_manager", "_queue", "_waiter")
+
+    names: tuple[str, ...]
+    mode: StreamMode
+    _closed: bool
+    _latest: dict[str, _EventDataT]
+    _manager: EventManager[_EventDataT]
+    _queue: deque[tuple[str, _EventDataT]]
+    _waiter: asyncio.Future[None] | None
+
+    def __init__(
+        self,
+        manager: EventManager[_EventDataT],
+        names: Iterable[str],
+        mode: StreamMode = StreamMode.LATEST,
+        maxsize: int = STREAM_MAXSIZE,
+    ) -> None:
+        """Initialize a new stream."""
+        if maxsize < 1:
+            raise ValueError(f"Stream size must be positive, got {maxsize}")
+
+        self.names = tuple(dict.fromkeys(names))
+        self.mode = mode
+        self._closed = False
+        self._latest = {}
+        self._manager = manager
+        self._queue = deque(maxlen=maxsize)
+        self._waiter = None
+
+    def __enter__(self: _StreamT) -> _StreamT:
+        """Return the stream."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the stream."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of buffered values."""
+        return len(self._latest) + len(self._queue)
+
+    def put(self, name: str, value: _EventDataT) -> None:
+        """Put the value into the buffer without waiting."""
+        if self._closed:
+            return
+
+        if self.mode is StreamMode.LATEST:
+            # Move the event to the end, so events are read in order.
+            self._latest.pop(name, None)
+            self._latest[name] = value
+        else:
+            self._queue.append((name, value))
+
+        self._wakeup()
+
+    def close(self) -> None:
+        """Close the stream and stop the iteration."""
+        if not self._closed:
+            self._closed = True
+            self._manager.remove_stream(self)
+            self._latest.clear()
+            self._queue.clear()
+            self._wakeup()
+
+    def _wakeup(self) -> None:
+        """Wake up the waiting consumer."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _get(self) -> tuple[str, _EventDataT]:
+        """Get the next event name and value."""
+        while not self._closed:
+            if self._latest:
+                name = next(iter(self._latest))
+                return name, self._latest.pop(name)
+
+            if self._queue:
+                return self._queue.popleft()
+
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        raise StopAsyncIteration
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the stream is closed."""
+        return self._closed
+
+
+class ValueStream(_Stream[_EventDataT]):
+    """Represents a stream of the event values."""
+
+    __slots__ = ()
+
+    def __aiter__(self) -> ValueStream[_EventDataT]:
+        """Return the stream iterator."""
+        return self
+
+    async def __anext__(self) -> _EventDataT:
+        """Return the next value."""
+        _, value = await self._get()
+        return value
+
+
+class EventStream(_Stream[_EventDataT]):
+    """Represents a stream of the event names and values."""
+
+    __slots__ = ()
+
+    def __aiter__(self) -> EventStream[_EventDataT]:
+        """Return the stream iterator."""
+        return self
+
+    async def __anext__(self) -> tuple[str, _EventDataT]:
+        """Return the next event name and value."""
+        return await self._get()
+
+
+class _BackgroundCallback(Generic[_EventDataT]):
+    """Represents a callback, that is awaited in the background.
+
+    Values are queued, so the callback never holds up the dispatch.
+    Once the queue is full, the oldest value is dropped.
+    """
+
+    __slots__ = ("callback", "_manager", "_queue", "_task")
+
+    callback: EventCallback
+    _manager: EventManager[_EventDataT]
+    _queue: deque[_EventDataT]
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        manager: EventManager[_EventDataT],
+        callback: EventCallback,
+        maxsize: int = STREAM_MAXSIZE,
+    ) -> None:
+        """Initialize a new background callback."""
+        if maxsize < 1:
+            raise ValueError(f"Queue size must be positive, got {maxsize}")
+
+        self.callback = callback
+        self._manager = manager
+        self._queue = deque(maxlen=maxsize)
+        self._task = None
+
+    def put(self, value: _EventDataT) -> None:
+        """Queue the value and start the worker, if it isn't running."""
+        self._queue.append(value)
+        if self._task is None:
+            self._task = self._manager.create_task(self._run())
+
+    def clear(self) -> None:
+        """Clear the queued values."""
+        self._queue.clear()
+
+    async def _run(self) -> None:
+        """Await the callback with queued values."""
+        try:
+            while self._queue:
+                value = self._queue.popleft()
+                try:
+                    await self._manager.call(self.callback, value)
+                except Exception as e:
+                    _LOGGER.exception(
+                        "Error in event listener %s: %s", self.callback.__name__, e
+                    )
+        finally:
+            self._task = None
+
 
 class EventManager(TaskManager, Generic[_EventDataT]):
     """Represents an event manager."""
 
-    __slots__ = ("_data", "_events", "_callbacks")
-
+    __slots__ = (
+        "callback_budget",
+        "_background",
+        "_callbacks",
+        "_data",
+        "_events",
+        "_streams",
+    )
+
+    callback_budget: float | None
+    _background: dict[str, list[_BackgroundCallback[_EventDataT]]]
+    _callbacks: dict[str, list[EventCallback]]
     _data: dict[str, _EventDataT]
     _events: dict[str, asyncio.Event]
-    _callbacks: dict[str, list[EventCallback]]
+    _streams: dict[str, list[_Stream[_EventDataT]]]
 
-    def __init__(self) -> None:
-        """Initialize a new event manager."""
+    def __init__(self, callback_budget: float | None = None) -> None:
+        """Initialize a new event manager.
+
+        Callbacks, that take longer than the budget in seconds, are
+        reported in the log.
+        """
         super().__init__()
+        self.callback_budget = callback_budget
+        self._background = {}
+        self._callbacks = {}
         self._data = {}
         self._events = {}
-        self._callbacks = {}
+        self._streams = {}
+        self.create_group("dispatch", DISPATCH_LIMIT, OverflowPolicy.WAIT)
         self._register_event_listeners()
 
     def __getattr__(self, name: str) -> _EventDataT:
@@ -151,23 +373,45 @@ class EventManager(TaskManager, Generic[_EventDataT]):
         except KeyError:
             return default
 
-    def subscribe(self, name: str, callback: _EventCallbackT) -> _EventCallbackT:
+    def subscribe(
+        self,
+        name: str,
+        callback: _EventCallbackT,
+        background: bool = False,
+        maxsize: int = STREAM_MAXSIZE,
+    ) -> _EventCallbackT:
         """Subscribe a callback to the event.
 
+        Callbacks are awaited one by one and can transform the value
+        or stop the propagation. Background callbacks are awaited
+        concurrently, after the value is stored, and their result
+        is ignored.
+
         :param name: Event name or ID
         :type name: str
         :param callback: A coroutine callback function, that will be
             awaited on the with the event data as an argument.
         :type callback: EventCallback
+        :param background: Await the callback in the background,
+            defaults to `False`
+        :type background: bool, optional
+        :param maxsize: Number of values to queue for the background
+            callback, defaults to `32`
+        :type maxsize: int, optional
         :return: A reference to the callback, that can be used
             with `EventManager.unsubscribe()`.
         :rtype: EventCallback
         """
-        callbacks = self._callbacks.setdefault(name, [])
         _LOGGER.debug(
             "Registered listener '%s' for event '%s'", callback.__name__, name
         )
-        callbacks.append(callback)
+        if background:
+            self._background.setdefault(name, []).append(
+                _BackgroundCallback(self, callback, maxsize)
+            )
+        else:
+            self._callbacks.setdefault(name, []).append(callback)
+
         return callback
 
     def subscribe_once(self, name: str, callback: EventCallback) -> EventCallback:
@@ -208,14 +452,122 @@ class EventManager(TaskManager, Generic[_EventDataT]):
             self._callbacks[name].remove(callback)
             return True
 
+        for background_callback in self._background.get(name, ()):
+            if background_callback.callback == callback:
+                background_callback.clear()
+                self._background[name].remove(background_callback)
+                return True
+
         return False
 
+    def stream(
+        self,
+        name: str,
+        mode: StreamMode = StreamMode.LATEST,
+        maxsize: int = STREAM_MAXSIZE,
+    ) -> ValueStream[_EventDataT]:
+        """Stream the event values.
+
+        Stream should be closed once it's no longer needed, e. g. by
+        using it as a context manager.
+
+        :param name: Event name or ID
+        :type name: str
+        :param mode: Buffer mode, in the latest mode only the newest
+            value is kept, defaults to `StreamMode.LATEST`
+        :type mode: StreamMode, optional
+        :param maxsize: Number of values to keep in the drop oldest
+            mode, defaults to `32`
+        :type maxsize: int, optional
+        :return: An async iterator over the event values
+        :rtype: ValueStream
+        """
+        return self.add_stream(ValueStream(self, (name,), mode, maxsize))
+
+    def stream_many(
+        self,
+        names: Iterable[str],
+        mode: StreamMode = StreamMode.LATEST,
+        maxsize: int = STREAM_MAXSIZE,
+    ) -> EventStream[_EventDataT]:
+        """Stream the event names and values of multiple events.
+
+        In the latest mode, the newest value of each event is kept.
+
+        :param names: Event names or IDs
+        :type names: Iterable[str]
+        :param mode: Buffer mode, in the latest mode only the newest
+            values are kept, defaults to `StreamMode.LATEST`
+        :type mode: StreamMode, optional
+        :param maxsize: Number of values to keep in the drop oldest
+            mode, defaults to `32`
+        :type maxsize: int, optional
+        :return: An async iterator over the event names and values
+        :rtype: EventStream
+        """
+        return self.add_stream(EventStream(self, names, mode, maxsize))
+
+    def add_stream(self, stream: _StreamT) -> _StreamT:
+        """Add the stream to the events."""
+        for name in stream.names:
+            self._streams.setdefault(name, []).append(stream)
+
+        return stream
+
+    def remove_stream(self, stream: _Stream[_EventDataT]) -> None:
+        """Remove the stream from the events."""
+        for name in stream.names:
+            if streams := self._streams.get(name):
+                if stream in streams:
+                    streams.remove(stream)
+
+                if not streams:
+                    del self._streams[name]
+
+    def close_streams(self) -> None:
+        """Close all streams."""
+        for stream in {
+            id(stream): stream
+            for streams in self._streams.values()
+            for stream in streams
+        }.values():
+            stream.close()
+
+    def _put_streams(self, name: str, value: _EventDataT) -> None:
+        """Put the value into the event streams."""
+        for stream in self._streams[name]:
+            stream.put(name, value)
+
+    def _put_background(self, name: str, value: _EventDataT) -> None:
+        """Queue the value for the background callbacks."""
+        for background_callback in self._background[name]:
+            background_callback.put(value)
+
+    async def call(self, callback: EventCallback, value: _EventDataT) -> Any:
+        """Await the callback and report it, if it exceeds the budget."""
+        if self.callback_budget is None:
+            return await callback(value)
+
+        start = time.perf_counter()
+        try:
+            return await callback(value)
+        finally:
+            if (elapsed := time.perf_counter() - start) > self.callback_budget:
+                _LOGGER.warning(
+                    "Event listener %s took %.3f seconds, exceeding the budget "
+                    "of %.3f seconds",
+                    callback.__name__,
+                    elapsed,
+                    self.callback_budget,
+                )
+
     async def dispatch(self, name: str, value: _EventDataT) -> None:
         """Call registered callbacks and dispatch the event."""
         callbacks = self._callbacks.get(name, [])
+        propagate = True
         for callback in list(callbacks):
             try:
-                result = await callback(value)
+                result = await self.call(callback, value)
             except Exception as e:
                 _LOGGER.exception(
                     "Error in event listener %s: %s", callback.__name__, e
@@ -225,26 +577,71 @@ class EventManager(TaskManager, Generic[_EventDataT]):
             if result is None:
                 continue
             elif result is StopPropagation:
+                propagate = False
                 break
             else:
                 value = result
 
         self._data[name] = value
         self.set_event(name)
+        if name in self._streams:
+            self._put_streams(name, value)
+
+        if propagate and name in self._background:
+            self._put_background(name, value)
 
     def dispatch_nowait(self, name: str, value: _EventDataT) -> None:
         """Call a registered callbacks and dispatch the event without waiting."""
-        self.create_task(self.dispatch(name, value))
+        self.create_group_task("dispatch", self.dispatch(name, value))
+
+    def _dispatch_many(
+        self, data: Mapping[str, _EventDataT]
+    ) -> list[asyncio.Future[Any]]:
+        """Dispatch the events and return tasks that are not done."""
+        tasks = []
+        for name, value in data.items():
+            if self._callbacks.get(name):
+                task = self.create_group_task(
+                    "dispatch", self.dispatch(name, value), eager=True
+                )
+                if task is not None and not task.done():
+                    tasks.append(task)
+            else:
+                self._data[name] = value
+                if name in self._events:
+                    self._events[name].set()
+
+                if name in self._streams:
+                    self._put_streams(name, value)
+
+                if name in self._background:
+                    self._put_background(name, value)
+
+        return tasks
+
+    async def dispatch_many(self, data: Mapping[str, _EventDataT]) -> None:
+        """Dispatch multiple events.
+
+        Events without callbacks are applied in a single pass, while
+        the others are dispatched concurrently.
+        """
+        if tasks := self._dispatch_many(data):
+            await asyncio.gather(*tasks)
+
+    def dispatch_many_nowait(self, data: Mapping[str, _EventDataT]) -> None:
+        """Dispatch multiple events without waiting.
+
+        Events without callbacks are applied immediately.
+        """
+        self._dispatch_many(data)
 
     async def load(self, data: dict[str, _EventDataT]) -> None:
         """Load event data."""
-        await asyncio.gather(
-            *(self.dispatch(name, value) for name, value in data.items())
-        )
+        await self.dispatch_many(data)
 
     def load_nowait(self, data: dict[str, _EventDataT]) -> None:
         """Load event data without waiting."""
-        self.create_task(self.load(data))
+        self.dispatch_many_nowait(data)
 
     def create_event(self, name: str) -> asyncio.Event:
         """Create an event."""
@@ -275,6 +672,11 @@ __all__ = [
     "event_listener",
     "EventCallback",
     "EventManager",
+    "DISPATCH_LIMIT",
+    "EventStream",
+    "STREAM_MAXSIZE",
     "StopPropagation",
     "StopPropagationType",
+    "StreamMode",
+    "ValueStream",
 ]
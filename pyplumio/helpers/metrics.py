@@ -0,0 +1,123 @@
+"""Contains fixed-size metric classes."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import time
+from typing import Final
+
+# Histogram bucket upper bounds in seconds.
+DEFAULT_BUCKETS: Final = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+DEFAULT_RATE_SLOTS: Final = 61
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Represents a histogram snapshot."""
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int
+    sum: float
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the observed values."""
+        return self.sum / self.count if self.count else 0.0
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Represents a histogram with fixed buckets.
+
+    The last bucket counts values greater than the highest bound.
+    """
+
+    bounds: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = field(default=0, init=False)
+    sum: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        """Allocate the buckets."""
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add the value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Return a snapshot of the histogram."""
+        return HistogramSnapshot(self.bounds, tuple(self.counts), self.count, self.sum)
+
+
+class RateCounter:
+    """Represents a sliding window rate counter.
+
+    Values are added to one second slots in a ring, so the counter
+    can report rates over windows up to the number of slots.
+    """
+
+    __slots__ = ("_seconds", "_values")
+
+    _seconds: list[int]
+    _values: list[float]
+
+    def __init__(self, slots: int = DEFAULT_RATE_SLOTS) -> None:
+        """Initialize a new rate counter."""
+        self._seconds = [-1] * slots
+        self._values = [0.0] * slots
+
+    def add(self, value: float = 1, now: float | None = None) -> None:
+        """Add the value to the current slot."""
+        second = int(time.monotonic() if now is None else now)
+        index = second % len(self._seconds)
+        if self._seconds[index] != second:
+            self._seconds[index] = second
+            self._values[index] = 0.0
+
+        self._values[index] += value
+
+    def rate(self, window: int, now: float | None = None) -> float:
+        """Return the rate per second over the last window seconds.
+
+        The current second is not included, as it's not complete yet.
+        """
+        current = int(time.monotonic() if now is None else now)
+        window = min(window, len(self._seconds) - 1)
+        total = sum(
+            value
+            for second, value in zip(self._seconds, self._values, strict=True)
+            if current - window <= second < current
+        )
+        return total / window
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "DEFAULT_RATE_SLOTS",
+    "Histogram",
+    "HistogramSnapshot",
+    "RateCounter",
+]
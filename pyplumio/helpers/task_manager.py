@@ -3,20 +3,286 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Coroutine
-from typing import Any
+from dataclasses import dataclass, field
+from enum import Enum, unique
+from functools import partial
+import logging
+import sys
+import time
+from typing import Any, Final
+
+from pyplumio.helpers.metrics import Histogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@unique
+class OverflowPolicy(Enum):
+    """Contains the task group overflow policies."""
+
+    WAIT = "wait"
+    DROP = "drop"
+    COALESCE = "coalesce"
+
+
+DEFAULT_BACKLOG: Final = 1024
+
+
+@dataclass(slots=True)
+class TaskStats:
+    """Represents the task group statistics."""
+
+    created: int = 0
+    running: int = 0
+    queued: int = 0
+    failed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    duration: Histogram = field(default_factory=Histogram)
+
+
+@dataclass(slots=True, eq=False)
+class _QueuedTask:
+    """Represents a task waiting in the backlog."""
+
+    coro: Coroutine[Any, Any, Any]
+    name: str | None
+    eager: bool
+    future: asyncio.Future[Any]
+
+
+class TaskGroup:
+    """Represents a group of tasks with the limit.
+
+    Tasks above the limit are kept in the backlog as coroutines and
+    the task is only created, once a running task is done. The overflow
+    policy decides what happens with the new task:
+
+    - wait: tasks above the limit wait in the backlog,
+    - drop: tasks above the limit are dropped,
+    - coalesce: task with the same name is cancelled and replaced,
+      while tasks above the limit wait in the backlog.
+
+    Tasks are dropped, if the backlog is full.
+    """
+
+    __slots__ = (
+        "name",
+        "limit",
+        "policy",
+        "backlog",
+        "stats",
+        "_backlog",
+        "_manager",
+        "_named",
+        "_tasks",
+    )
+
+    name: str
+    limit: int | None
+    policy: OverflowPolicy
+    backlog: int
+    stats: TaskStats
+    _backlog: deque[_QueuedTask]
+    _manager: TaskManager
+    _named: dict[str, asyncio.Future[Any]]
+    _tasks: set[asyncio.Task]
+
+    def __init__(
+        self,
+        manager: TaskManager,
+        name: str,
+        limit: int | None = None,
+        policy: OverflowPolicy = OverflowPolicy.WAIT,
+        backlog: int = DEFAULT_BACKLOG,
+    ) -> None:
+        """Initialize a new task group."""
+        if limit is not None and limit < 1:
+            raise ValueError(f"Task group limit must be positive, got {limit}")
+
+        self.name = name
+        self.limit = limit
+        self.policy = policy
+        self.backlog = backlog
+        self.stats = TaskStats()
+        self._backlog = deque()
+        self._manager = manager
+        self._named = {}
+        self._tasks = set()
+
+    def create_task(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        name: str | None = None,
+        eager: bool = False,
+    ) -> asyncio.Future[Any] | None:
+        """Create asyncio task in the group.
+
+        Eager task runs synchronously until the first suspension, see
+        `TaskManager.create_eager_task()`. If the group is full, the
+        future of the task waiting in the backlog is returned instead.
+        Returns `None`, if the task is dropped.
+        """
+        if (
+            self.policy is OverflowPolicy.COALESCE
+            and name is not None
+            and (named := self._named.pop(name, None)) is not None
+        ):
+            named.cancel()
+            self.stats.coalesced += 1
+
+        if not self._is_full():
+            return self._start(coro, name, eager)
+
+        if self.policy is OverflowPolicy.DROP or len(self._backlog) >= self.backlog:
+            coro.close()
+            self.stats.dropped += 1
+            _LOGGER.warning("Task group '%s' is full, dropped the task", self.name)
+            return None
+
+        future = asyncio.get_running_loop().create_future()
+        queued = _QueuedTask(coro, name, eager, future)
+        self._backlog.append(queued)
+        self.stats.queued += 1
+        future.add_done_callback(lambda _: self._discard_queued(queued))
+        self._add_named(name, future)
+        return future
+
+    def _is_full(self) -> bool:
+        """Check whether the group has no room for a new task."""
+        return self.limit is not None and len(self._tasks) >= self.limit
+
+    def _start(
+        self, coro: Coroutine[Any, Any, Any], name: str | None, eager: bool
+    ) -> asyncio.Task:
+        """Create the task for the coroutine."""
+        self.stats.created += 1
+        task = (
+            self._manager.create_eager_task(self._measure(coro), name=name)
+            if eager
+            else self._manager.create_task(self._measure(coro), name=name)
+        )
+        if task.done():
+            return task
+
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        # Close the coroutine, if task was cancelled before it started.
+        task.add_done_callback(lambda _: coro.close())
+        self._add_named(name, task)
+        return task
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Start the tasks from the backlog, once the task is done."""
+        self._tasks.discard(task)
+        while self._backlog and not self._is_full():
+            queued = self._backlog.popleft()
+            self.stats.queued -= 1
+            started = self._start(queued.coro, queued.name, queued.eager)
+            self._add_named(queued.name, started)
+            started.add_done_callback(partial(_chain_future, queued.future))
+            queued.future.add_done_callback(partial(_cancel_task, started))
+
+    def _discard_queued(self, queued: _QueuedTask) -> None:
+        """Discard the task from the backlog, if it was cancelled there."""
+        try:
+            self._backlog.remove(queued)
+        except ValueError:
+            return
+
+        self.stats.queued -= 1
+        queued.coro.close()
+
+    def _cancel_backlog(self) -> None:
+        """Cancel all tasks in the backlog."""
+        while self._backlog:
+            queued = self._backlog.popleft()
+            self.stats.queued -= 1
+            queued.coro.close()
+            queued.future.cancel()
+
+    def _add_named(self, name: str | None, future: asyncio.Future[Any]) -> None:
+        """Store the named task until it's done."""
+        if name is None or future.done():
+            return
+
+        self._named[name] = future
+        future.add_done_callback(partial(self._discard_named, name))
+
+    def _discard_named(self, name: str, future: asyncio.Future[Any]) -> None:
+        """Discard the named task once it's done."""
+        if self._named.get(name) is future:
+            del self._named[name]
+
+    async def _measure(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Await the coroutine and update the statistics."""
+        stats = self.stats
+        stats.running += 1
+        start = time.perf_counter()
+        try:
+            return await coro
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats.failed += 1
+            raise
+        finally:
+            stats.running -= 1
+            stats.duration.observe(time.perf_counter() - start)
+
+    def cancel_tasks(self) -> bool:
+        """Cancel all tasks in the group, including the backlog."""
+        self._cancel_backlog()
+        return all(task.cancel() for task in self._tasks)
+
+    async def wait_until_done(self, return_exceptions: bool = True) -> None:
+        """Wait for all tasks in the group, including the backlog."""
+        await asyncio.gather(*self.pending, return_exceptions=return_exceptions)
+
+    @property
+    def tasks(self) -> set[asyncio.Task]:
+        """Return the tasks in the group."""
+        return self._tasks
+
+    @property
+    def pending(self) -> set[asyncio.Future[Any]]:
+        """Return the tasks and the futures of tasks in the backlog."""
+        return {*self._tasks, *(queued.future for queued in self._backlog)}
+
+
+def _chain_future(future: asyncio.Future[Any], task: asyncio.Task) -> None:
+    """Copy the task result to the future."""
+    if future.done():
+        return
+
+    if task.cancelled():
+        future.cancel()
+    elif (exc := task.exception()) is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(task.result())
+
+
+def _cancel_task(task: asyncio.Task, future: asyncio.Future[Any]) -> None:
+    """Cancel the task, if its future was cancelled."""
+    if future.cancelled():
+        task.cancel()
 
 
 class TaskManager:
     """Represents a task manager."""
 
-    __slots__ = ("_tasks",)
+    __slots__ = ("_groups", "_tasks")
 
+    _groups: dict[str, TaskGroup]
     _tasks: set[asyncio.Task]
 
     def __init__(self) -> None:
         """Initialize a new task manager."""
         super().__init__()
+        self._groups = {}
         self._tasks = set()
 
     def create_task(
@@ -28,13 +294,90 @@ class TaskManager:
         task.add_done_callback(self._tasks.discard)
         return task
 
-    def cancel_tasks(self) -> bool:
-        """Cancel all tasks."""
+    def create_eager_task(
+        self, coro: Coroutine[Any, Any, Any], name: str | None = None
+    ) -> asyncio.Task:
+        """Create asyncio task, that starts running immediately.
+
+        Task runs synchronously until the first suspension and is only
+        stored if it isn't done by then. Eager tasks are available
+        since Python 3.12, otherwise a regular task is created.
+        """
+        if sys.version_info >= (3, 12):
+            task = asyncio.Task(
+                coro, loop=asyncio.get_running_loop(), name=name, eager_start=True
+            )
+            if not task.done():
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            return task
+
+        return self.create_task(coro, name=name)
+
+    def create_group(
+        self,
+        name: str,
+        limit: int | None = None,
+        policy: OverflowPolicy = OverflowPolicy.WAIT,
+        backlog: int = DEFAULT_BACKLOG,
+    ) -> TaskGroup:
+        """Create a task group.
+
+        Group with the same name is replaced, while its tasks are
+        still tracked by the task manager.
+        """
+        group = TaskGroup(self, name, limit, policy, backlog)
+        self._groups[name] = group
+        return group
+
+    def create_group_task(
+        self,
+        group: str,
+        coro: Coroutine[Any, Any, Any],
+        name: str | None = None,
+        eager: bool = False,
+    ) -> asyncio.Future[Any] | None:
+        """Create asyncio task in the group.
+
+        Group is created without the limit, if it doesn't exist.
+        Returns `None`, if the task is dropped.
+        """
+        if (task_group := self._groups.get(group)) is None:
+            task_group = self.create_group(group)
+
+        return task_group.create_task(coro, name=name, eager=eager)
+
+    def cancel_tasks(self, group: str | None = None) -> bool:
+        """Cancel all tasks or tasks in the group."""
+        if group is not None:
+            task_group = self._groups.get(group)
+            return True if task_group is None else task_group.cancel_tasks()
+
+        for task_group in self._groups.values():
+            task_group._cancel_backlog()
+
         return all(task.cancel() for task in self._tasks)
 
-    async def wait_until_done(self, return_exceptions: bool = True) -> None:
-        """Wait for all tasks to complete."""
-        await asyncio.gather(*self._tasks, return_exceptions=return_exceptions)
+    async def wait_until_done(
+        self, return_exceptions: bool = True, group: str | None = None
+    ) -> None:
+        """Wait for all tasks or tasks in the group to complete."""
+        if group is None:
+            futures: set[asyncio.Future[Any]] = set(self._tasks)
+            for task_group in self._groups.values():
+                futures |= task_group.pending
+        elif group in self._groups:
+            futures = self._groups[group].pending
+        else:
+            futures = set()
+
+        await asyncio.gather(*futures, return_exceptions=return_exceptions)
+
+    @property
+    def groups(self) -> dict[str, TaskGroup]:
+        """Return the task groups."""
+        return self._groups
 
     @property
     def tasks(self) -> set[asyncio.Task]:
@@ -42,4 +385,4 @@ class TaskManager:
         return self._tasks
 
 
-__all__ = ["TaskManager"]
+__all__ = ["OverflowPolicy", "TaskGroup", "TaskManager", "TaskStats"]
@@ -0,0 +1,442 @@
+"""Contains an OpenMetrics exporter for the connection statistics."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime
+import logging
+import time
+from typing import Final, NamedTuple
+
+from pyplumio.const import DeviceType, FrameType
+from pyplumio.helpers.metrics import HistogramSnapshot
+from pyplumio.protocol import Statistics
+
+CONTENT_TYPE: Final = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_MAX_AGE: Final = 1.0
+DEFAULT_HOST: Final = "127.0.0.1"
+DEFAULT_PORT: Final = 9650
+
+# Number of connections rendered before yielding to the event loop.
+RENDER_BATCH_SIZE: Final = 20
+
+READ_REQUEST_TIMEOUT: Final = 5.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MetricFamily(NamedTuple):
+    """Represents a metric family."""
+
+    name: str
+    type: str
+    help: str
+
+
+FAMILIES: Final = (
+    MetricFamily("pyplumio_received_frames", "counter", "Received frames."),
+    MetricFamily("pyplumio_received_bytes", "counter", "Received bytes."),
+    MetricFamily("pyplumio_sent_frames", "counter", "Sent frames."),
+    MetricFamily("pyplumio_sent_bytes", "counter", "Sent bytes."),
+    MetricFamily("pyplumio_failed_frames", "counter", "Frames that failed to decode."),
+    MetricFamily("pyplumio_connection_losses", "counter", "Connection loss events."),
+    MetricFamily(
+        "pyplumio_connected_since_seconds", "gauge", "Time the connection was made."
+    ),
+    MetricFamily(
+        "pyplumio_connection_loss_at_seconds", "gauge", "Time the connection was lost."
+    ),
+    MetricFamily(
+        "pyplumio_device_first_seen_seconds", "gauge", "Time the device was found."
+    ),
+    MetricFamily(
+        "pyplumio_device_last_seen_seconds", "gauge", "Time the device was last seen."
+    ),
+    MetricFamily(
+        "pyplumio_frame_type_received_frames", "counter", "Received frames by type."
+    ),
+    MetricFamily(
+        "pyplumio_frame_type_received_bytes", "counter", "Received bytes by type."
+    ),
+    MetricFamily("pyplumio_frame_type_sent_frames", "counter", "Sent frames by type."),
+    MetricFamily("pyplumio_frame_type_sent_bytes", "counter", "Sent bytes by type."),
+    MetricFamily(
+        "pyplumio_frame_decode_seconds",
+        "histogram",
+        "Time spent decoding and handling received frames by type.",
+    ),
+    MetricFamily(
+        "pyplumio_sender_received_frames", "counter", "Received frames by sender."
+    ),
+    MetricFamily(
+        "pyplumio_sender_received_bytes", "counter", "Received bytes by sender."
+    ),
+    MetricFamily(
+        "pyplumio_received_frames_per_second", "gauge", "Received frame rate."
+    ),
+    MetricFamily("pyplumio_received_bytes_per_second", "gauge", "Received byte rate."),
+    MetricFamily("pyplumio_sent_frames_per_second", "gauge", "Sent frame rate."),
+    MetricFamily("pyplumio_sent_bytes_per_second", "gauge", "Sent byte rate."),
+    MetricFamily(
+        "pyplumio_write_queue_queued_frames", "counter", "Frames put in write queue."
+    ),
+    MetricFamily(
+        "pyplumio_write_queue_coalesced_frames",
+        "counter",
+        "Frames replaced by a newer frame in write queue.",
+    ),
+    MetricFamily(
+        "pyplumio_write_queue_max_depth", "gauge", "Highest write queue depth."
+    ),
+    MetricFamily(
+        "pyplumio_write_queue_wait_seconds",
+        "histogram",
+        "Time frames spent in write queue.",
+    ),
+    MetricFamily(
+        "pyplumio_round_trip_seconds",
+        "histogram",
+        "Time until response was received by request type.",
+    ),
+)
+
+
+def _frame_type_name(frame_type: int) -> str:
+    """Return the frame type name."""
+    try:
+        return FrameType(frame_type).name.lower()
+    except ValueError:
+        return str(frame_type)
+
+
+def _device_name(address: int) -> str:
+    """Return the device name."""
+    try:
+        return DeviceType(address).name.lower()
+    except ValueError:
+        return str(address)
+
+
+def _escape(value: str) -> str:
+    """Escape the label value."""
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    """Return the formatted label set."""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Return the formatted sample value."""
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _SampleWriter:
+    """Represents a writer that collects samples by the metric family."""
+
+    __slots__ = ("samples", "_labels")
+
+    samples: dict[str, list[str]]
+    _labels: tuple[tuple[str, str], ...]
+
+    def __init__(self, labels: tuple[tuple[str, str], ...]) -> None:
+        """Initialize a new sample writer."""
+        self.samples = {family.name: [] for family in FAMILIES}
+        self._labels = labels
+
+    def add(
+        self,
+        family: str,
+        value: float,
+        suffix: str = "",
+        labels: tuple[tuple[str, str], ...] = (),
+    ) -> None:
+        """Add the sample to the metric family."""
+        self.samples[family].append(
+            f"{family}{suffix}{_format_labels(self._labels + labels)} "
+            f"{_format_value(value)}"
+        )
+
+    def add_counter(
+        self, family: str, value: float, labels: tuple[tuple[str, str], ...] = ()
+    ) -> None:
+        """Add the counter sample."""
+        self.add(family, value, "_total", labels)
+
+    def add_histogram(
+        self,
+        family: str,
+        histogram: HistogramSnapshot,
+        labels: tuple[tuple[str, str], ...] = (),
+    ) -> None:
+        """Add the histogram samples."""
+        cumulative = 0
+        for bound, count in zip(histogram.bounds, histogram.counts, strict=False):
+            cumulative += count
+            self.add(family, cumulative, "_bucket", labels + (("le", repr(bound)),))
+
+        self.add(family, histogram.count, "_bucket", labels + (("le", "+Inf"),))
+        self.add(family, histogram.count, "_count", labels)
+        self.add(family, histogram.sum, "_sum", labels)
+
+    def add_timestamp(
+        self,
+        family: str,
+        value: datetime | str,
+        labels: tuple[tuple[str, str], ...] = (),
+    ) -> None:
+        """Add the timestamp sample, if it's set."""
+        if isinstance(value, datetime):
+            self.add(family, value.timestamp(), labels=labels)
+
+
+def render_statistics(
+    statistics: Statistics, labels: tuple[tuple[str, str], ...] = ()
+) -> dict[str, list[str]]:
+    """Return the statistics samples by the metric family."""
+    writer = _SampleWriter(labels)
+    writer.add_counter("pyplumio_received_frames", statistics.received_frames)
+    writer.add_counter("pyplumio_received_bytes", statistics.received_bytes)
+    writer.add_counter("pyplumio_sent_frames", statistics.sent_frames)
+    writer.add_counter("pyplumio_sent_bytes", statistics.sent_bytes)
+    writer.add_counter("pyplumio_failed_frames", statistics.failed_frames)
+    writer.add_counter("pyplumio_connection_losses", statistics.connection_losses)
+    writer.add_timestamp("pyplumio_connected_since_seconds", statistics.connected_since)
+    writer.add_timestamp(
+        "pyplumio_connection_loss_at_seconds", statistics.connection_loss_at
+    )
+    for device in statistics.devices:
+        device_labels = (("device", _device_name(device.address)),)
+        writer.add_timestamp(
+            "pyplumio_device_first_seen_seconds", device.first_seen, device_labels
+        )
+        writer.add_timestamp(
+            "pyplumio_device_last_seen_seconds", device.last_seen, device_labels
+        )
+
+    traffic = statistics.traffic.snapshot()
+    for frame_type, counter in traffic.received.items():
+        frame_labels = (("frame_type", _frame_type_name(frame_type)),)
+        writer.add_counter(
+            "pyplumio_frame_type_received_frames", counter.frames, frame_labels
+        )
+        writer.add_counter(
+            "pyplumio_frame_type_received_bytes", counter.bytes, frame_labels
+        )
+        if counter.decode_time:
+            writer.add_histogram(
+                "pyplumio_frame_decode_seconds", counter.decode_time, frame_labels
+            )
+
+    for frame_type, counter in traffic.sent.items():
+        frame_labels = (("frame_type", _frame_type_name(frame_type)),)
+        writer.add_counter(
+            "pyplumio_frame_type_sent_frames", counter.frames, frame_labels
+        )
+        writer.add_counter(
+            "pyplumio_frame_type_sent_bytes", counter.bytes, frame_labels
+        )
+
+    for address, counter in traffic.senders.items():
+        sender_labels = (("sender", _device_name(address)),)
+        writer.add_counter(
+            "pyplumio_sender_received_frames", counter.frames, sender_labels
+        )
+        writer.add_counter(
+            "pyplumio_sender_received_bytes", counter.bytes, sender_labels
+        )
+
+    for direction, rates in (
+        ("received", traffic.received_rates),
+        ("sent", traffic.sent_rates),
+    ):
+        for window, rate in rates.items():
+            window_labels = (("window", f"{window}s"),)
+            writer.add(
+                f"pyplumio_{direction}_frames_per_second",
+                rate.frames_per_second,
+                labels=window_labels,
+            )
+            writer.add(
+                f"pyplumio_{direction}_bytes_per_second",
+                rate.bytes_per_second,
+                labels=window_labels,
+            )
+
+    write_queue = statistics.write_queue
+    writer.add_counter("pyplumio_write_queue_queued_frames", write_queue.queued_frames)
+    writer.add_counter(
+        "pyplumio_write_queue_coalesced_frames", write_queue.coalesced_frames
+    )
+    writer.add("pyplumio_write_queue_max_depth", write_queue.max_depth)
+    writer.add_histogram(
+        "pyplumio_write_queue_wait_seconds", write_queue.wait_times.snapshot()
+    )
+    for frame_type, round_trip in statistics.round_trip_times.items():
+        writer.add_histogram(
+            "pyplumio_round_trip_seconds",
+            round_trip.histogram.snapshot(),
+            (("frame_type", _frame_type_name(frame_type)),),
+        )
+
+    return writer.samples
+
+
+def _fingerprint(statistics: Statistics) -> tuple[float, ...]:
+    """Return the values that change when the statistics change.
+
+    Includes the current second, since transfer rates change with
+    time.
+    """
+    return (
+        int(time.monotonic()),
+        statistics.received_frames,
+        statistics.sent_frames,
+        statistics.failed_frames,
+        statistics.connection_losses,
+        statistics.write_queue.queued_frames,
+        statistics.write_queue.dequeued_frames,
+        statistics.write_queue.coalesced_frames,
+        len(statistics.devices),
+    )
+
+
+class _CachedSamples(NamedTuple):
+    """Represents the cached connection samples."""
+
+    fingerprint: tuple[float, ...]
+    samples: dict[str, list[str]]
+
+
+class OpenMetricsExporter:
+    """Represents an OpenMetrics exporter.
+
+    Renders the statistics of added connections in the OpenMetrics
+    text format. Samples are rendered again only for connections
+    which statistics have changed and the whole exposition is cached
+    for max_age seconds. Rendering yields to the event loop after
+    every batch of connections.
+    """
+
+    __slots__ = ("_statistics", "_cache", "_exposition", "_rendered_at", "max_age")
+
+    _statistics: dict[str, Statistics]
+    _cache: dict[str, _CachedSamples]
+    _exposition: bytes | None
+    _rendered_at: float
+    max_age: float
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """Initialize a new OpenMetrics exporter."""
+        self._statistics = {}
+        self._cache = {}
+        self._exposition = None
+        self._rendered_at = 0.0
+        self.max_age = max_age
+
+    def add(self, name: str, statistics: Statistics) -> None:
+        """Add the connection statistics under the name."""
+        self._statistics[name] = statistics
+        self._exposition = None
+
+    def remove(self, name: str) -> None:
+        """Remove the connection statistics."""
+        self._statistics.pop(name, None)
+        self._cache.pop(name, None)
+        self._exposition = None
+
+    def _get_samples(self, name: str, statistics: Statistics) -> dict[str, list[str]]:
+        """Return the connection samples, rendering them if changed."""
+        fingerprint = _fingerprint(statistics)
+        cached = self._cache.get(name)
+        if cached is None or cached.fingerprint != fingerprint:
+            cached = self._cache[name] = _CachedSamples(
+                fingerprint,
+                render_statistics(statistics, (("connection", name),)),
+            )
+
+        return cached.samples
+
+    async def render(self) -> bytes:
+        """Return the exposition for all connections."""
+        now = time.monotonic()
+        if self._exposition is not None and now - self._rendered_at < self.max_age:
+            return self._exposition
+
+        connection_samples = []
+        for index, (name, statistics) in enumerate(list(self._statistics.items())):
+            if index and index % RENDER_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+
+            connection_samples.append(self._get_samples(name, statistics))
+
+        lines = []
+        for family in FAMILIES:
+            lines.append(f"# TYPE {family.name} {family.type}")
+            lines.append(f"# HELP {family.name} {family.help}")
+            for samples in connection_samples:
+                lines.extend(samples[family.name])
+
+        lines.append("# EOF\n")
+        self._exposition = "\n".join(lines).encode()
+        self._rendered_at = now
+        return self._exposition
+
+
+async def _handle_request(
+    exporter: OpenMetricsExporter,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Respond to the HTTP request."""
+    try:
+        try:
+            request = await asyncio.wait_for(
+                reader.readuntil(b"\r\n\r\n"), timeout=READ_REQUEST_TIMEOUT
+            )
+            method, path, *_ = request.split(b"\r\n", 1)[0].decode().split(" ")
+        except (asyncio.LimitOverrunError, ValueError):
+            # Request is too long or malformed.
+            method, path = "", ""
+
+        if not method or not path:
+            status, content_type, body = "400 Bad Request", "text/plain", b""
+        elif method != "GET":
+            status, content_type, body = "405 Method Not Allowed", "text/plain", b""
+        elif path.split("?", 1)[0] != "/metrics":
+            status, content_type, body = "404 Not Found", "text/plain", b""
+        else:
+            status, content_type, body = "200 OK", CONTENT_TYPE, await exporter.render()
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+    except (OSError, TimeoutError, asyncio.IncompleteReadError) as e:
+        _LOGGER.debug("Failed to handle metrics request: %s", e)
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(
+    exporter: OpenMetricsExporter, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> asyncio.Server:
+    """Start an HTTP server that exposes the metrics on /metrics."""
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_request(exporter, reader, writer), host, port
+    )
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "FAMILIES",
+    "MetricFamily",
+    "OpenMetricsExporter",
+    "render_statistics",
+    "start_metrics_server",
+]
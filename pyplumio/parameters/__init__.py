@@ -8,7 +8,8 @@ from contextlib import suppress
 from copy import copy
 from dataclasses import dataclass, replace
 import logging
-from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypeVar, get_args
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypeVar, cast, get_args
+import warnings
 
 from pyplumio.const import BYTE_UNDEFINED, STATE_OFF, STATE_ON, State, UnitOfMeasurement
 from pyplumio.frames import Request
@@ -71,17 +72,17 @@ class Parameter(ABC):
     __slots__ = (
         "device",
         "description",
-        "_update_done",
-        "_update_pending",
         "_index",
+        "_unpacked",
+        "_update",
         "_values",
     )
 
     device: Device
     description: ParameterDescription
-    _update_done: asyncio.Event
-    _update_pending: asyncio.Event
     _index: int
+    _unpacked: tuple[Any, Any, Any] | None
+    _update: asyncio.Future[None] | None
     _values: ParameterValues
 
     def __init__(
@@ -95,9 +96,8 @@ class Parameter(ABC):
         self.device = device
         self.description = description
         self._index = index
-        self._index = index
-        self._update_done = asyncio.Event()
-        self._update_pending = asyncio.Event()
+        self._unpacked = None
+        self._update = None
         self._values = values if values else ParameterValues(0, 0, 0)
 
     def __repr__(self) -> str:
@@ -188,8 +188,10 @@ class Parameter(ABC):
     def set_nowait(self, value: Any, retries: int = 0, timeout: float = 5.0) -> None:
         """Set a parameter value without waiting."""
         self.validate(value)
-        self.device.create_task(
-            self._attempt_update(self._pack_value(value), retries, timeout)
+        self.device.create_group_task(
+            "set",
+            self._attempt_update(self._pack_value(value), retries, timeout),
+            name=f"set_{self.description.name}",
         )
 
     async def _attempt_update(self, value: int, retries: int, timeout: float) -> bool:
@@ -201,14 +203,15 @@ class Parameter(ABC):
             # Value is unchanged
             return True
 
-        self._values = replace(self._values, value=value)
+        self._set_values(replace(self._values, value=value))
         request = await self.create_request()
         if self.description.optimistic:
             self.device.queue_send(request)
             return True
 
-        self.update_done.clear()
-        self.update_pending.set()
+        if self._update is None:
+            self._update = asyncio.get_running_loop().create_future()
+
         if retries > 0:
             return await self._attempt_update_with_retries(
                 request, retries=retries, timeout=timeout
@@ -234,27 +237,84 @@ class Parameter(ABC):
     async def _send_update_request(self, request: Request, timeout: float) -> bool:
         """Send update request to the remote and confirm the result."""
         self.device.queue_send(request)
+        if (update := self._update) is None:
+            # Parameter was updated in the meantime
+            return True
+
         with suppress(TimeoutError):
             # Wait for the update to be done
-            await asyncio.wait_for(self.update_done.wait(), timeout=timeout)
+            await asyncio.wait_for(asyncio.shield(update), timeout=timeout)
 
-        return self.update_done.is_set()
+        return update.done()
+
+    def _set_values(self, values: ParameterValues) -> None:
+        """Set the parameter values and clear the unpacked ones."""
+        self._values = values
+        self._unpacked = None
+
+    def _get_unpacked(self) -> tuple[Any, Any, Any]:
+        """Return the unpacked value, minimum and maximum values."""
+        if (unpacked := self._unpacked) is None:
+            values = self._values
+            unpacked = self._unpacked = (
+                self._unpack_value(values.value),
+                self._unpack_value(values.min_value),
+                self._unpack_value(values.max_value),
+            )
+
+        return unpacked
 
     def update(self, values: ParameterValues) -> None:
         """Update the parameter values."""
-        self.update_done.set()
-        self.update_pending.clear()
-        self._values = values
+        if self._update is not None:
+            self._update.set_result(None)
+            self._update = None
+
+        self._set_values(values)
+
+    @property
+    def pending(self) -> bool:
+        """Check if parameter update is pending on the device."""
+        return self._update is not None
+
+    def _update_event(self, name: str, done: bool) -> asyncio.Event:
+        """Return an event that follows the pending update.
+
+        The event is set while the update is pending, if done is False,
+        and once the update is done otherwise.
+        """
+        warnings.warn(
+            f"Parameter.{name} is deprecated, use Parameter.pending instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        event = asyncio.Event()
+        if (update := self._update) is None:
+            if done:
+                event.set()
+        elif done:
+            update.add_done_callback(lambda _: event.set())
+        else:
+            event.set()
+            update.add_done_callback(lambda _: event.clear())
+
+        return event
 
     @property
     def update_done(self) -> asyncio.Event:
-        """Check if parameter is updated on the device."""
-        return self._update_done
+        """Check if parameter is updated on the device.
+
+        Deprecated, use the pending property instead.
+        """
+        return self._update_event("update_done", done=True)
 
     @property
     def update_pending(self) -> asyncio.Event:
-        """Check if parameter is updated on the device."""
-        return self._update_pending
+        """Check if parameter update is pending on the device.
+
+        Deprecated, use the pending property instead.
+        """
+        return self._update_event("update_pending", done=False)
 
     @property
     def values(self) -> ParameterValues:
@@ -373,17 +433,17 @@ class Number(Parameter):
     @property
     def value(self) -> Numeric:
         """Return the value."""
-        return self._unpack_value(self.values.value)
+        return cast(Numeric, self._get_unpacked()[0])
 
     @property
     def min_value(self) -> Numeric:
         """Return the minimum allowed value."""
-        return self._unpack_value(self.values.min_value)
+        return cast(Numeric, self._get_unpacked()[1])
 
     @property
     def max_value(self) -> Numeric:
         """Return the maximum allowed value."""
-        return self._unpack_value(self.values.max_value)
+        return cast(Numeric, self._get_unpacked()[2])
 
     @property
     def unit_of_measurement(self) -> UnitOfMeasurement | Literal["%"] | None:
@@ -492,7 +552,7 @@ class Switch(Parameter):
     @property
     def value(self) -> State:
         """Return the value."""
-        return self._unpack_value(self.values.value)
+        return cast(State, self._get_unpacked()[0])
 
     @property
     def min_value(self) -> Literal["off"]:
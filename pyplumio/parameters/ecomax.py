@@ -52,15 +52,15 @@ class EcomaxParameter(Parameter):
 
     async def create_request(self) -> Request:
         """Create a request to change the parameter."""
-        handler = partial(Request.create, recipient=self.device.address)
+        handler = partial(Request.create_nowait, recipient=self.device.address)
         if self.description.name == ATTR_ECOMAX_CONTROL:
-            return await handler(
+            return handler(
                 frame_type=FrameType.REQUEST_ECOMAX_CONTROL,
                 data={ATTR_VALUE: self.values.value},
             )
 
         if self.description.name == ATTR_THERMOSTAT_PROFILE:
-            return await handler(
+            return handler(
                 frame_type=FrameType.REQUEST_SET_THERMOSTAT_PARAMETER,
                 data={
                     ATTR_INDEX: self._index,
@@ -70,7 +70,7 @@ class EcomaxParameter(Parameter):
                 },
             )
 
-        return await handler(
+        return handler(
             frame_type=FrameType.REQUEST_SET_ECOMAX_PARAMETER,
             data={ATTR_INDEX: self._index, ATTR_VALUE: self.values.value},
         )
@@ -46,7 +46,7 @@ class MixerParameter(Parameter):
 
     async def create_request(self) -> Request:
         """Create a request to change the parameter."""
-        return await Request.create(
+        return Request.create_nowait(
             FrameType.REQUEST_SET_MIXER_PARAMETER,
             recipient=self.device.parent.address,
             data={
@@ -61,7 +61,7 @@ class ThermostatParameter(Parameter):
 
     async def create_request(self) -> Request:
         """Create a request to change the parameter."""
-        return await Request.create(
+        return Request.create_nowait(
             FrameType.REQUEST_SET_THERMOSTAT_PARAMETER,
             recipient=self.device.parent.address,
             data={
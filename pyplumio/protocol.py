@@ -9,15 +9,17 @@ from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
+import time
 from typing import Any, Final, Literal, TypeAlias
 
 from pyplumio.const import ATTR_CONNECTED, ATTR_SETUP, DeviceType
 from pyplumio.devices import PhysicalDevice
 from pyplumio.exceptions import ProtocolError
-from pyplumio.frames import Frame
+from pyplumio.frames import Frame, Response
 from pyplumio.frames.requests import StartMasterRequest
 from pyplumio.helpers.async_cache import acache
 from pyplumio.helpers.event_manager import EventManager
+from pyplumio.request_tracker import RequestTracker, RoundTripStatistics
 from pyplumio.stream import FrameReader, FrameWriter
 from pyplumio.structures.network_info import (
     EthernetParameters,
@@ -25,6 +27,8 @@ from pyplumio.structures.network_info import (
     WirelessParameters,
 )
 from pyplumio.structures.regulator_data import ATTR_REGDATA
+from pyplumio.traffic import TrafficStatistics
+from pyplumio.write_queue import WriteQueue, WriteQueueStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -136,15 +140,26 @@ class Statistics:
     #: List of statistics for connected devices
     devices: set[DeviceStatistics] = field(default_factory=set)
 
+    #: Write queue statistics. Resets on reconnect.
+    write_queue: WriteQueueStatistics = field(default_factory=WriteQueueStatistics)
+
+    #: Round-trip time statistics by request frame type. Resets on reconnect.
+    round_trip_times: dict[int, RoundTripStatistics] = field(default_factory=dict)
+
+    #: Traffic statistics by frame type and sender. Resets on reconnect.
+    traffic: TrafficStatistics = field(default_factory=TrafficStatistics)
+
     def update_sent(self, frame: Frame) -> None:
         """Update sent frames statistics."""
         self.sent_bytes += frame.length
         self.sent_frames += 1
+        self.traffic.update_sent(frame)
 
     def update_received(self, frame: Frame) -> None:
         """Update received frames statistics."""
         self.received_bytes += frame.length
         self.received_frames += 1
+        self.traffic.update_received(frame)
 
     def update_connection_lost(self) -> None:
         """Update connection lost counter."""
@@ -164,6 +179,9 @@ class Statistics:
         self.received_bytes = 0
         self.received_frames = 0
         self.failed_frames = 0
+        self.write_queue.reset()
+        self.round_trip_times.clear()
+        self.traffic.reset()
 
 
 @dataclass(slots=True, kw_only=True)
@@ -198,27 +216,44 @@ class AsyncProtocol(Protocol, EventManager[PhysicalDevice]):
     - Sends frames from the write queue to the device via frame writer
     - Reads incoming frames via frame reader and processes them
 
+    In full-duplex mode, frames are read and written by separate
+    tasks instead, so queued frames are sent as soon as possible
+    rather than one per received frame. If either task loses the
+    connection, the other one is cancelled.
+
     Each received frame is passed to appropriate device handler for
-    further processing.
+    further processing. Received responses are also matched against
+    the requests that are waiting for them.
     """
 
     _network_info: NetworkInfo
-    _write_queue: asyncio.Queue[Frame]
+    _write_queue: WriteQueue
+    _request_tracker: RequestTracker
     _statistics: Statistics
+    _full_duplex: bool
+    _io_tasks: set[asyncio.Task]
 
     def __init__(
         self,
         ethernet_parameters: EthernetParameters | None = None,
         wireless_parameters: WirelessParameters | None = None,
+        *,
+        full_duplex: bool = False,
     ) -> None:
         """Initialize a new async protocol."""
         super().__init__()
+        self._full_duplex = full_duplex
+        self._io_tasks = set()
         self._network_info = NetworkInfo(
             ethernet=ethernet_parameters or EthernetParameters(status=False),
             wireless=wireless_parameters or WirelessParameters(status=False),
         )
-        self._write_queue = asyncio.Queue()
-        self._statistics = Statistics()
+        self._write_queue = WriteQueue()
+        self._request_tracker = RequestTracker()
+        self._statistics = Statistics(
+            write_queue=self._write_queue.statistics,
+            round_trip_times=self._request_tracker.statistics,
+        )
 
     def connection_established(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
@@ -226,13 +261,26 @@ class AsyncProtocol(Protocol, EventManager[PhysicalDevice]):
         """Start frame producer and consumers."""
         self.reader = FrameReader(reader)
         self.writer = FrameWriter(writer)
+        self.statistics.reset_transfer_statistics()
         self._write_queue.put_nowait(StartMasterRequest(recipient=DeviceType.ECOMAX))
-        self.create_task(
-            self.frame_handler(reader=self.reader, writer=self.writer),
-            name="frame_handler_task",
-        )
+        if self._full_duplex:
+            self._io_tasks = {
+                self.create_task(
+                    self.frame_reader(reader=self.reader), name="frame_reader_task"
+                ),
+                self.create_task(
+                    self.frame_writer(writer=self.writer), name="frame_writer_task"
+                ),
+            }
+        else:
+            self._io_tasks = {
+                self.create_task(
+                    self.frame_handler(reader=self.reader, writer=self.writer),
+                    name="frame_handler_task",
+                )
+            }
+
         self._mark_connected()
-        self.statistics.reset_transfer_statistics()
 
     def _mark_connected(self) -> None:
         """Mark connection as connected."""
@@ -246,6 +294,7 @@ class AsyncProtocol(Protocol, EventManager[PhysicalDevice]):
         """Mark connection as disconnected."""
         self.connected.clear()
         self.network_info.server_status = False
+        self._request_tracker.clear()
         for device in self.data.values():
             device.dispatch_nowait(ATTR_CONNECTED, False)
 
@@ -265,6 +314,7 @@ class AsyncProtocol(Protocol, EventManager[PhysicalDevice]):
 
     async def shutdown(self) -> None:
         """Shutdown the protocol and close the connection."""
+        self.close_streams()
         self.cancel_tasks()
         self._clear_write_queue()
         await self.wait_until_done()
@@ -278,37 +328,109 @@ class AsyncProtocol(Protocol, EventManager[PhysicalDevice]):
         await self.connected.wait()
         while self.connected.is_set():
             try:
-                frame: Frame | None
-
                 # Handle pending writes.
                 if not self._write_queue.empty():
                     frame = self._write_queue.get_nowait()
                     await writer.write(frame)
                     self._write_queue.task_done()
+                    self._request_tracker.sent(frame)
                     self.statistics.update_sent(frame)
 
-                # Read and process frame.
-                if frame := await reader.read():
-                    self.statistics.update_received(frame)
-                    device = await self._get_device_entry(frame.sender)
-                    device.handle_frame(frame)
+                # Read and process all available frames.
+                await self._process_frames(await reader.read_many())
+
+            except ProtocolError as e:
+                self.statistics.failed_frames += 1
+                _LOGGER.debug("Can't process received frame: %s", e)
+            except (OSError, TimeoutError):
+                self._handle_connection_lost()
+                break
+            except Exception:
+                _LOGGER.exception("Unexpected exception")
+
+    async def frame_reader(self, reader: FrameReader) -> None:
+        """Handle frame reads in full-duplex mode."""
+        await self.connected.wait()
+        while self.connected.is_set():
+            try:
+                await self._process_frames(await reader.read_many())
 
             except ProtocolError as e:
                 self.statistics.failed_frames += 1
                 _LOGGER.debug("Can't process received frame: %s", e)
             except (OSError, TimeoutError):
-                self.statistics.update_connection_lost()
-                self.create_task(self.connection_lost())
+                self._handle_connection_lost()
                 break
             except Exception:
                 _LOGGER.exception("Unexpected exception")
 
-    @acache
+    async def frame_writer(self, writer: FrameWriter) -> None:
+        """Handle frame writes in full-duplex mode."""
+        await self.connected.wait()
+        while self.connected.is_set():
+            frame = await self._write_queue.get()
+            try:
+                await writer.write(frame)
+                self._request_tracker.sent(frame)
+                self.statistics.update_sent(frame)
+            except (OSError, TimeoutError):
+                self._handle_connection_lost()
+                break
+            except Exception:
+                _LOGGER.exception("Unexpected exception")
+            finally:
+                self._write_queue.task_done()
+
+    async def _process_frames(self, frames: list[Frame]) -> None:
+        """Process the received frames.
+
+        Failed frame is skipped, while the rest of the batch is still
+        processed.
+        """
+        for frame in frames:
+            try:
+                await self._process_frame(frame)
+            except ProtocolError as e:
+                self.statistics.failed_frames += 1
+                _LOGGER.debug("Can't process received frame: %s", e)
+            except (OSError, TimeoutError):
+                raise
+            except Exception:
+                self.statistics.failed_frames += 1
+                _LOGGER.exception("Unexpected exception while processing frame")
+
+    async def _process_frame(self, frame: Frame) -> None:
+        """Pass the received frame to the device handler."""
+        self.statistics.update_received(frame)
+        device = await self._get_device_entry(frame.sender)
+        start = time.perf_counter()
+        device.handle_frame(frame)
+        self.statistics.traffic.update_decode_time(
+            frame.frame_type, time.perf_counter() - start
+        )
+        if isinstance(frame, Response):
+            self._request_tracker.resolve(frame)
+
+    def _handle_connection_lost(self) -> None:
+        """Cancel other frame handling tasks and close the connection."""
+        self.statistics.update_connection_lost()
+        current_task = asyncio.current_task()
+        for task in self._io_tasks:
+            if task is not current_task:
+                task.cancel()
+
+        self._io_tasks = set()
+        self.create_task(self.connection_lost())
+
+    @acache(per_instance=True)
     async def _get_device_entry(self, device_type: DeviceType) -> PhysicalDevice:
         """Return the device entry."""
         name = device_type.name.lower()
-        device = await PhysicalDevice.create(
-            device_type, write_queue=self._write_queue, network_info=self._network_info
+        device = PhysicalDevice.create_nowait(
+            device_type,
+            write_queue=self._write_queue,
+            network_info=self._network_info,
+            request_tracker=self._request_tracker,
         )
         device.dispatch_nowait(ATTR_CONNECTED, True)
         device.dispatch_nowait(ATTR_SETUP, True)
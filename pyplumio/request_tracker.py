@@ -0,0 +1,218 @@
+"""Contains a request tracker class."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import time
+from typing import Final, TypeAlias
+
+from pyplumio.const import DeviceType
+from pyplumio.frames import Frame, Request, Response
+from pyplumio.helpers.metrics import Histogram
+
+_RequestKey: TypeAlias = tuple[int, type[Response]]
+
+# Number of requests of the same type that can wait for the response.
+PENDING_LIMIT: Final = 16
+
+# Sent requests without waiters are forgotten after this amount of
+# seconds, so a lost response doesn't shift the following ones.
+PENDING_EXPIRY: Final = 10.0
+
+
+@dataclass(slots=True, kw_only=True)
+class RoundTripStatistics:
+    """Represents a round-trip time statistics for a request type."""
+
+    #: Number of requests that received a response
+    count: int = 0
+
+    #: Total round-trip time in seconds
+    total: float = 0.0
+
+    #: Shortest round-trip time in seconds
+    min: float = 0.0
+
+    #: Longest round-trip time in seconds
+    max: float = 0.0
+
+    #: Last round-trip time in seconds
+    last: float = 0.0
+
+    #: Histogram of round-trip times in seconds
+    histogram: Histogram = field(default_factory=Histogram)
+
+    def update(self, round_trip_time: float) -> None:
+        """Update the statistics with a new round-trip time."""
+        self.min = min(self.min, round_trip_time) if self.count else round_trip_time
+        self.max = max(self.max, round_trip_time)
+        self.last = round_trip_time
+        self.total += round_trip_time
+        self.count += 1
+        self.histogram.observe(round_trip_time)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean round-trip time in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass(slots=True)
+class _PendingRequest:
+    """Represents a request that is waiting for the response."""
+
+    request: Request
+    sent_at: float | None = None
+    future: asyncio.Future[Response] | None = None
+
+
+class RequestTracker:
+    """Represents a request tracker.
+
+    Tracks requests that were sent, but haven't received a response
+    yet, by the recipient and the expected response type. Requests of
+    the same type are queued in the order they were sent, since the
+    device responds to them in order, i. e. to the pipelined parameter
+    writes. When the response is received, the oldest request is
+    resolved and the round-trip time is recorded for the request
+    frame type.
+    """
+
+    __slots__ = ("_pending", "_statistics")
+
+    _pending: dict[_RequestKey, deque[_PendingRequest]]
+    _statistics: dict[int, RoundTripStatistics]
+
+    def __init__(self) -> None:
+        """Initialize a new request tracker."""
+        self._pending = {}
+        self._statistics = {}
+
+    def __len__(self) -> int:
+        """Return the number of pending requests."""
+        return sum(len(queue) for queue in self._pending.values())
+
+    def _queue(self, request: Request) -> deque[_PendingRequest]:
+        """Return the queue of pending requests of the same type."""
+        key = (request.recipient, request.response)
+        if (queue := self._pending.get(key)) is None:
+            queue = self._pending[key] = deque(maxlen=PENDING_LIMIT)
+
+        return queue
+
+    def is_pending(self, request: Request) -> bool:
+        """Check if the request is waiting for the response."""
+        return (request.recipient, request.response) in self._pending
+
+    def expect(self, request: Request) -> asyncio.Future[Response]:
+        """Return a future that is resolved with the response.
+
+        Requests to the same recipient that expect the same response
+        share the future, which is resolved with the next response.
+        """
+        queue = self._queue(request)
+        if not queue:
+            queue.append(_PendingRequest(request))
+
+        pending = queue[0]
+        if pending.future is None:
+            pending.future = asyncio.get_running_loop().create_future()
+
+        return pending.future
+
+    def sent(self, frame: Frame) -> None:
+        """Record the send time for the request."""
+        if isinstance(frame, Request) and hasattr(frame, "response"):
+            queue = self._queue(frame)
+            now = time.monotonic()
+            for pending in queue:
+                if pending.sent_at is None:
+                    # Request was expected before it was sent.
+                    pending.sent_at = now
+                    return
+
+            queue.append(_PendingRequest(frame, sent_at=now))
+
+    def _pop(self, key: _RequestKey) -> _PendingRequest | None:
+        """Remove the oldest pending request, skipping the expired ones."""
+        if (queue := self._pending.get(key)) is None:
+            return None
+
+        if len(queue) > 1:
+            expired = time.monotonic() - PENDING_EXPIRY
+            while len(queue) > 1:
+                pending = queue[0]
+                if pending.future is not None or (
+                    pending.sent_at is not None and pending.sent_at > expired
+                ):
+                    break
+
+                queue.popleft()
+
+        pending = queue.popleft()
+        if not queue:
+            del self._pending[key]
+
+        return pending
+
+    def resolve(self, response: Response) -> bool:
+        """Resolve the pending request with the response.
+
+        Returns True if the response matched a pending request, False
+        otherwise.
+        """
+        response_type = type(response)
+        pending = self._pop((response.sender, response_type))
+        if pending is None:
+            pending = self._pop((DeviceType.ALL, response_type))
+
+        if pending is None:
+            return False
+
+        if not pending.request.validate_response(response):
+            # Response doesn't belong to the request, keep it pending.
+            self._queue(pending.request).appendleft(pending)
+            return False
+
+        if pending.sent_at is not None:
+            frame_type = pending.request.frame_type
+            statistics = self._statistics.setdefault(frame_type, RoundTripStatistics())
+            statistics.update(time.monotonic() - pending.sent_at)
+
+        if pending.future is not None and not pending.future.done():
+            pending.future.set_result(response)
+
+        return True
+
+    def discard(self, request: Request) -> None:
+        """Forget the pending request.
+
+        Other pending requests of the same type are kept.
+        """
+        key = (request.recipient, request.response)
+        if (queue := self._pending.get(key)) is None:
+            return
+
+        remaining = [pending for pending in queue if pending.request is not request]
+        if remaining:
+            queue.clear()
+            queue.extend(remaining)
+        else:
+            del self._pending[key]
+
+    def clear(self) -> None:
+        """Forget all pending requests.
+
+        Waiters aren't resolved and will time out.
+        """
+        self._pending.clear()
+
+    @property
+    def statistics(self) -> dict[int, RoundTripStatistics]:
+        """Return the round-trip time statistics by request frame type."""
+        return self._statistics
+
+
+__all__ = ["PENDING_EXPIRY", "PENDING_LIMIT", "RequestTracker", "RoundTripStatistics"]
@@ -77,16 +77,12 @@ class AlertsStructure(StructureDecoder):
         offset = self._offset
         code = message[offset]
         offset += 1
-        from_seconds = UnsignedInt.from_bytes(message, offset)
-        offset += from_seconds.size
-        to_seconds = UnsignedInt.from_bytes(message, offset)
-        offset += to_seconds.size
-        from_dt = seconds_to_datetime(from_seconds.value)
-        to_dt = (
-            None
-            if to_seconds.value == MAX_UINT32
-            else seconds_to_datetime(to_seconds.value)
-        )
+        from_seconds, size = UnsignedInt.unpack_from(message, offset)
+        offset += size
+        to_seconds, size = UnsignedInt.unpack_from(message, offset)
+        offset += size
+        from_dt = seconds_to_datetime(from_seconds)
+        to_dt = None if to_seconds == MAX_UINT32 else seconds_to_datetime(to_seconds)
         with suppress(ValueError):
             code = AlertType(code)
 
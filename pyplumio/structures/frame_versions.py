@@ -24,12 +24,12 @@ class FrameVersionsStructure(StructureDecoder):
         """Unpack frame versions."""
         frame_type = message[self._offset]
         self._offset += 1
-        version = UnsignedShort.from_bytes(message, self._offset)
-        self._offset += version.size
+        version, size = UnsignedShort.unpack_from(message, self._offset)
+        self._offset += size
         with suppress(ValueError):
             frame_type = FrameType(frame_type)
 
-        return frame_type, version.value
+        return frame_type, version
 
     def decode(
         self, message: bytearray, offset: int = 0, data: dict[str, Any] | None = None
@@ -97,19 +97,19 @@ class NetworkInfoStructure(Structure):
                 {
                     ATTR_NETWORK_INFO: NetworkInfo(
                         ethernet=EthernetParameters(
-                            ip=IPv4.from_bytes(message, offset).value,
-                            netmask=IPv4.from_bytes(message, offset + 4).value,
-                            gateway=IPv4.from_bytes(message, offset + 8).value,
+                            ip=IPv4.unpack_from(message, offset)[0],
+                            netmask=IPv4.unpack_from(message, offset + 4)[0],
+                            gateway=IPv4.unpack_from(message, offset + 8)[0],
                             status=bool(message[offset + 13]),
                         ),
                         wireless=WirelessParameters(
-                            ip=IPv4.from_bytes(message, offset + 13).value,
-                            netmask=IPv4.from_bytes(message, offset + 17).value,
-                            gateway=IPv4.from_bytes(message, offset + 21).value,
+                            ip=IPv4.unpack_from(message, offset + 13)[0],
+                            netmask=IPv4.unpack_from(message, offset + 17)[0],
+                            gateway=IPv4.unpack_from(message, offset + 21)[0],
                             encryption=EncryptionType(int(message[offset + 26])),
                             signal_quality=int(message[offset + 27]),
                             status=bool(message[offset + 28]),
-                            ssid=VarString.from_bytes(message, offset + 33).value,
+                            ssid=VarString.unpack_from(message, offset + 33)[0],
                         ),
                         server_status=bool(message[offset + 25]),
                     )
@@ -86,14 +86,14 @@ class ProductInfoStructure(StructureDecoder):
         """Decode bytes and return message data and offset."""
         product_type, product_id = struct.unpack_from("<BH", message)
         offset += 3
-        uid = VarBytes.from_bytes(message, offset)
-        offset += uid.size
-        logo = UnsignedShort.from_bytes(message, offset)
-        offset += logo.size
-        image = UnsignedShort.from_bytes(message, offset)
-        offset += image.size
-        model_name = VarString.from_bytes(message, offset)
-        offset += model_name.size
+        uid, size = VarBytes.unpack_from(message, offset)
+        offset += size
+        logo, size = UnsignedShort.unpack_from(message, offset)
+        offset += size
+        image, size = UnsignedShort.unpack_from(message, offset)
+        offset += size
+        model_name, size = VarString.unpack_from(message, offset)
+        offset += size
 
         return (
             ensure_dict(
@@ -102,10 +102,10 @@ class ProductInfoStructure(StructureDecoder):
                     ATTR_PRODUCT: ProductInfo(
                         type=ProductType(product_type),
                         id=product_id,
-                        uid=unpack_uid(uid.value),
-                        logo=logo.value,
-                        image=image.value,
-                        model=format_model_name(model_name.value),
+                        uid=unpack_uid(uid),
+                        logo=logo,
+                        image=image,
+                        model=format_model_name(model_name),
                     )
                 },
             ),
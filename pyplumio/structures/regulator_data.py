@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+import struct
 from typing import Any, Final
 
-from pyplumio.data_types import BitArray, DataType
+from pyplumio.data_types import (
+    BITARRAY_LAST_INDEX,
+    BitArray,
+    BuiltInDataType,
+    DataType,
+    Undefined,
+)
 from pyplumio.structures import StructureDecoder
 from pyplumio.structures.frame_versions import FrameVersionsStructure
 from pyplumio.structures.regulator_data_schema import ATTR_REGDATA_SCHEMA
@@ -15,29 +23,167 @@ ATTR_REGDATA: Final = "regdata"
 REGDATA_VERSION: Final = "1.0"
 
 
-class RegulatorDataStructure(StructureDecoder):
-    """Represents a regulator data structure."""
+PLAN_CACHE_SIZE: Final = 8
 
-    __slots__ = ("_offset", "_bitarray_index")
 
-    _offset: int
-    _bitarray_index: int
+class _StructRun:
+    """Represents a run of fixed-size fields decoded with a single struct.
+
+    Bit array fields share the byte they were read from and are
+    extracted from it with the precomputed masks.
+    """
+
+    __slots__ = ("unpacker", "fields", "param_ids")
+
+    unpacker: struct.Struct
+    fields: tuple[tuple[int, int | None, int], ...]
+    param_ids: tuple[int, ...] | None
+
+    def __init__(self, fmt: str, fields: list[tuple[int, int | None, int]]) -> None:
+        """Initialize a new struct run."""
+        self.unpacker = struct.Struct(f"<{fmt}")
+        self.fields = tuple(fields)
+
+        # Fields of a run without bit arrays and undefined values
+        # map directly to the unpacked values.
+        self.param_ids = (
+            tuple(param_id for param_id, _, _ in fields)
+            if all(index is not None and not mask for _, index, mask in fields)
+            else None
+        )
+
+    def unpack(self, message: bytearray, offset: int, regdata: dict[int, Any]) -> int:
+        """Unpack the fields and return the next offset."""
+        values = self.unpacker.unpack_from(message, offset)
+        if self.param_ids is not None:
+            regdata.update(zip(self.param_ids, values, strict=True))
+        else:
+            for param_id, index, mask in self.fields:
+                if index is None:
+                    regdata[param_id] = None
+                elif mask:
+                    regdata[param_id] = bool(values[index] & mask)
+                else:
+                    regdata[param_id] = values[index]
+
+        return offset + self.unpacker.size
+
+
+class _VariableField:
+    """Represents a field decoded by its data type."""
+
+    __slots__ = ("param_id", "data_type")
+
+    param_id: int
+    data_type: type[DataType]
+
+    def __init__(self, param_id: int, data_type: type[DataType]) -> None:
+        """Initialize a new variable field."""
+        self.param_id = param_id
+        self.data_type = data_type
+
+    def unpack(self, message: bytearray, offset: int, regdata: dict[int, Any]) -> int:
+        """Unpack the field and return the next offset."""
+        regdata[self.param_id], size = self.data_type.unpack_from(message, offset)
+        return offset + size
+
+
+class RegulatorDataPlan:
+    """Represents a regulator data decode plan compiled from the schema.
+
+    Runs of fixed-size fields are decoded with a single struct and
+    the values are stored in the schema order.
+    """
+
+    __slots__ = ("steps", "partial_bitarray")
+
+    steps: tuple[_StructRun | _VariableField, ...]
+    partial_bitarray: bool
 
-    def _unpack_regulator_data(self, message: bytearray, data_type: DataType) -> Any:
-        """Unpack a regulator data sensor."""
-        if not isinstance(data_type, BitArray) and self._bitarray_index > 0:
-            # Current data type is not bitarray, but previous was, thus
-            # we skip a single byte that was left from the bitarray
-            # and reset bitarray index.
-            self._offset += 1
-            self._bitarray_index = 0
+    def __init__(self, fingerprint: tuple[tuple[int, type[DataType]], ...]) -> None:
+        """Compile a new decode plan."""
+        steps: list[_StructRun | _VariableField] = []
+        fmt = ""
+        fields: list[tuple[int, int | None, int]] = []
+        bitarray_index = 0
+        for param_id, data_type in fingerprint:
+            if data_type is BitArray:
+                if bitarray_index == 0:
+                    fmt += "B"
 
-        data_type.unpack(message[self._offset :])
-        if isinstance(data_type, BitArray):
-            self._bitarray_index = data_type.next(self._bitarray_index)
+                fields.append((param_id, len(fmt) - 1, 1 << bitarray_index))
+                bitarray_index = (
+                    0 if bitarray_index == BITARRAY_LAST_INDEX else bitarray_index + 1
+                )
+                continue
 
-        self._offset += data_type.size
-        return data_type.value
+            # The byte left from the bit array is already in the run.
+            bitarray_index = 0
+            if data_type is Undefined:
+                fields.append((param_id, None, 0))
+            elif issubclass(data_type, BuiltInDataType):
+                fmt += data_type()._struct.format.lstrip("<")
+                fields.append((param_id, len(fmt) - 1, 0))
+            else:
+                if fields:
+                    steps.append(_StructRun(fmt, fields))
+                    fmt, fields = "", []
+
+                steps.append(_VariableField(param_id, data_type))
+
+        if fields:
+            steps.append(_StructRun(fmt, fields))
+
+        self.steps = tuple(steps)
+
+        # The byte of the unfinished bit array is not included in
+        # the offset.
+        self.partial_bitarray = bitarray_index > 0
+
+    def decode(self, message: bytearray, offset: int) -> tuple[dict[int, Any], int]:
+        """Decode the regulator data and return it with the offset."""
+        regdata: dict[int, Any] = {}
+        for step in self.steps:
+            offset = step.unpack(message, offset, regdata)
+
+        return regdata, offset - self.partial_bitarray
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile(fingerprint: tuple[tuple[int, type[DataType]], ...]) -> RegulatorDataPlan:
+    """Compile the decode plan for the schema fingerprint."""
+    return RegulatorDataPlan(fingerprint)
+
+
+# Plans for the recently seen schema objects by their ids. Schemas
+# are kept referenced, so their ids are not reused.
+_plans: dict[int, tuple[list[tuple[int, DataType]], RegulatorDataPlan]] = {}
+
+
+def get_decode_plan(schema: list[tuple[int, DataType]]) -> RegulatorDataPlan:
+    """Return the decode plan for the schema.
+
+    Plans are cached by the schema fingerprint, that consists of
+    parameter ids and their data types, so the plan is only compiled
+    again when the schema changes.
+    """
+    if (entry := _plans.get(id(schema))) is not None and entry[0] is schema:
+        return entry[1]
+
+    plan = _compile(tuple((param_id, type(dt)) for param_id, dt in schema))
+    if len(_plans) >= PLAN_CACHE_SIZE:
+        del _plans[next(iter(_plans))]
+
+    _plans[id(schema)] = (schema, plan)
+    return plan
+
+
+class RegulatorDataStructure(StructureDecoder):
+    """Represents a regulator data structure."""
+
+    __slots__ = ("_offset",)
+
+    _offset: int
 
     def decode(
         self, message: bytearray, offset: int = 0, data: dict[str, Any] | None = None
@@ -56,13 +202,17 @@ class RegulatorDataStructure(StructureDecoder):
         device = self.frame.handler
         schema: list[tuple[int, DataType]]
         if device and (schema := device.get_nowait(ATTR_REGDATA_SCHEMA, [])):
-            self._bitarray_index = 0
-            data[ATTR_REGDATA] = {
-                param_id: self._unpack_regulator_data(message, data_type)
-                for param_id, data_type in schema
-            }
+            data[ATTR_REGDATA], self._offset = get_decode_plan(schema).decode(
+                message, self._offset
+            )
 
         return data, self._offset
 
 
-__all__ = ["ATTR_REGDATA", "REGDATA_VERSION", "RegulatorDataStructure"]
+__all__ = [
+    "ATTR_REGDATA",
+    "get_decode_plan",
+    "REGDATA_VERSION",
+    "RegulatorDataPlan",
+    "RegulatorDataStructure",
+]
@@ -21,17 +21,17 @@ class RegulatorDataSchemaStructure(StructureDecoder):
     def _unpack_block(self, message: bytearray) -> tuple[int, DataType]:
         """Unpack a block."""
         param_type = message[self._offset]
-        param_id = UnsignedShort.from_bytes(message, self._offset + 1)
-        self._offset += param_id.size + 1
-        return param_id.value, DATA_TYPES[param_type]()
+        param_id, size = UnsignedShort.unpack_from(message, self._offset + 1)
+        self._offset += size + 1
+        return param_id, DATA_TYPES[param_type]()
 
     def decode(
         self, message: bytearray, offset: int = 0, data: dict[str, Any] | None = None
     ) -> tuple[dict[str, Any], int]:
         """Decode bytes and return message data and offset."""
-        blocks = UnsignedShort.from_bytes(message, offset)
-        self._offset = offset + blocks.size
-        if blocks.value == 0:
+        blocks, size = UnsignedShort.unpack_from(message, offset)
+        self._offset = offset + size
+        if blocks == 0:
             return ensure_dict(data), self._offset
 
         return (
@@ -39,7 +39,7 @@ class RegulatorDataSchemaStructure(StructureDecoder):
                 data,
                 {
                     ATTR_REGDATA_SCHEMA: [
-                        self._unpack_block(message) for _ in range(blocks.value)
+                        self._unpack_block(message) for _ in range(blocks)
                     ]
                 },
             ),
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable, Iterator, MutableMapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime as dt
 from functools import lru_cache
-from typing import Annotated, Any, Final, TypeAlias, get_args
+from typing import Annotated, Any, Final, TypeAlias, cast, get_args
 
 from pyplumio.const import (
     ATTR_PARAMETER,
@@ -31,7 +32,7 @@ from pyplumio.parameters import (
     unpack_parameter,
 )
 from pyplumio.structures import StructureDecoder
-from pyplumio.utils import ensure_dict, split_byte
+from pyplumio.utils import ensure_dict
 
 ATTR_SCHEDULES: Final = "schedules"
 ATTR_SCHEDULE_PARAMETERS: Final = "schedule_parameters"
@@ -39,6 +40,7 @@ ATTR_SCHEDULE_SWITCH: Final = "schedule_switch"
 ATTR_SCHEDULE_PARAMETER: Final = "schedule_parameter"
 
 SCHEDULE_SIZE: Final = 42  # 6 bytes per day, 7 days total
+SCHEDULE_BITS: Final = SCHEDULE_SIZE * 8
 
 SCHEDULES: tuple[str, ...] = (
     "heating",
@@ -98,9 +100,17 @@ class ScheduleParameter(Parameter):
     description: ScheduleParameterDescription
 
     async def create_request(self) -> Request:
-        """Create a request to change the parameter."""
+        """Create a request to change the parameter.
+
+        If the schedule has an editor, the request is created by the
+        editor, so it carries the schedule known to the device.
+        """
         schedule_name = self.description.name.split("_schedule_", 1)[0]
-        return await Request.create(
+        schedules: dict[str, Schedule] = self.device.data[ATTR_SCHEDULES]
+        if (editor := schedules[schedule_name].editor) is not None:
+            return editor.create_request(schedule_name)
+
+        return Request.create_nowait(
             FrameType.REQUEST_SET_SCHEDULE,
             recipient=self.device.address,
             data=collect_schedule_data(schedule_name, self.device),
@@ -161,6 +171,7 @@ MIDNIGHT: Final = Time("00:00")
 MIDNIGHT_DT = dt.datetime.strptime(MIDNIGHT, TIME_FORMAT)
 
 STEP = dt.timedelta(minutes=30)
+STEP_MINUTES: Final = STEP.seconds // 60
 
 
 def get_time(
@@ -171,13 +182,35 @@ def get_time(
     return f"{time_dt.hour:02d}:{time_dt.minute:02d}"
 
 
-@lru_cache(maxsize=10)
+INTERVALS: Final = 48  # Half-hour intervals per day
+SCHEDULE_DAY_SIZE: Final = 6  # 48 bits per day
+
+# Each day is stored as the 48-bit integer, where the first interval
+# is the most significant bit, same as on the wire.
+FULL_DAY: Final = (1 << INTERVALS) - 1
+
+TIMES: tuple[Time, ...] = tuple(get_time(index) for index in range(INTERVALS))
+
+_TIME_INDEXES: Final = {time: index for index, time in enumerate(TIMES)}
+_TIME_BITS: Final = tuple(1 << (INTERVALS - 1 - index) for index in range(INTERVALS))
+
+
 def get_time_range(start: Time, end: Time, step: dt.timedelta = STEP) -> list[Time]:
     """Get a time range.
 
     Start and end boundaries should be specified in %H:%M format.
     Both are inclusive.
     """
+    if step != STEP or start not in _TIME_INDEXES or end not in _TIME_INDEXES:
+        return _get_time_range(start, end, step)
+
+    start_index, end_index = get_interval_range(start, end)
+    return list(TIMES[start_index : end_index + 1])
+
+
+@lru_cache(maxsize=10)
+def _get_time_range(start: Time, end: Time, step: dt.timedelta = STEP) -> list[Time]:
+    """Get a time range with the arbitrary step."""
     start_dt = dt.datetime.strptime(start, TIME_FORMAT)
     end_dt = dt.datetime.strptime(end, TIME_FORMAT)
 
@@ -197,55 +230,117 @@ def get_time_range(start: Time, end: Time, step: dt.timedelta = STEP) -> list[Ti
     return [get_time(index, start=start_dt, step=step) for index in range(int(steps))]
 
 
+def get_interval(time: Time) -> int:
+    """Return an interval index for the time in %H:%M format."""
+    if (index := _TIME_INDEXES.get(time)) is not None:
+        return index
+
+    time_dt = dt.datetime.strptime(time, TIME_FORMAT)
+    index, remainder = divmod(
+        dt.timedelta(hours=time_dt.hour, minutes=time_dt.minute), STEP
+    )
+    if remainder:
+        raise ValueError(
+            f"Invalid time: {time} is not a multiple of {STEP_MINUTES} minutes."
+        )
+
+    return index
+
+
+def get_interval_range(start: Time, end: Time) -> tuple[int, int]:
+    """Return inclusive interval indexes for the time range.
+
+    Midnight as the end boundary is the end of the day.
+    """
+    start_index = get_interval(start)
+    end_index = INTERVALS - 1 if end == MIDNIGHT else get_interval(end)
+    if end_index <= start_index:
+        raise ValueError(
+            f"Invalid time range: start time ({start}) must be earlier "
+            f"than end time ({end})."
+        )
+
+    return start_index, end_index
+
+
+def _to_bool(state: State | bool) -> bool:
+    """Return the boolean value for the state."""
+    if state in get_args(State):
+        state = True if state == STATE_ON else False
+    if isinstance(state, bool):
+        return state
+
+    raise TypeError(f"Expected boolean value or one of: {', '.join(get_args(State))}.")
+
+
 class ScheduleDay(MutableMapping):
-    """Represents a single day of schedule."""
+    """Represents a single day of schedule.
+
+    Interval states are stored in a single 48-bit integer and interval
+    ranges are set by bit masks.
+    """
 
-    __slots__ = ("_schedule",)
+    __slots__ = ("_bits", "_mask")
 
-    _schedule: dict[Time, bool]
+    _bits: int
+    _mask: int
 
-    def __init__(self, schedule: dict[Time, bool]) -> None:
+    def __init__(self, schedule: dict[Time, bool] | None = None) -> None:
         """Initialize a new schedule day."""
-        self._schedule = schedule
+        self._bits = 0
+        self._mask = 0
+        if schedule:
+            self.update(schedule)
 
     def __repr__(self) -> str:
         """Return serializable representation of the class."""
-        return f"ScheduleDay({self._schedule})"
+        return f"ScheduleDay({self.schedule})"
 
     def __len__(self) -> int:
         """Return a schedule length."""
-        return self._schedule.__len__()
+        return self._mask.bit_count()
 
     def __iter__(self) -> Iterator[Time]:
         """Return an iterator."""
-        return self._schedule.__iter__()
+        if self._mask == FULL_DAY:
+            return iter(TIMES)
+
+        return (time for time, bit in zip(TIMES, _TIME_BITS) if self._mask & bit)
+
+    def _get_bit(self, time: Time) -> int:
+        """Return the bit for the time in the schedule."""
+        index = _TIME_INDEXES.get(time)
+        if index is None or not self._mask & _TIME_BITS[index]:
+            raise KeyError(time)
+
+        return _TIME_BITS[index]
 
     def __getitem__(self, time: Time) -> State:
         """Return a schedule item."""
-        state = self._schedule.__getitem__(time)
-        return STATE_ON if state else STATE_OFF
+        return STATE_ON if self._bits & self._get_bit(time) else STATE_OFF
 
     def __delitem__(self, time: Time) -> None:
         """Delete a schedule item."""
-        self._schedule.__delitem__(time)
+        bit = self._get_bit(time)
+        self._mask &= ~bit
+        self._bits &= ~bit
 
     def __setitem__(self, time: Time, state: State | bool) -> None:
         """Set a schedule item."""
-        if state in get_args(State):
-            state = True if state == STATE_ON else False
-        if isinstance(state, bool):
-            self._schedule.__setitem__(time, state)
-        else:
-            raise TypeError(
-                f"Expected boolean value or one of: {', '.join(get_args(State))}."
-            )
+        state = _to_bool(state)
+        bit = _TIME_BITS[get_interval(time)]
+        self._mask |= bit
+        self._bits = self._bits | bit if state else self._bits & ~bit
 
     def set_state(
         self, state: State | bool, start: Time = MIDNIGHT, end: Time = MIDNIGHT
     ) -> None:
         """Set a schedule interval state."""
-        for time in get_time_range(start, end):
-            self.__setitem__(time, state)
+        start_index, end_index = get_interval_range(start, end)
+        state = _to_bool(state)
+        mask = ((1 << (end_index - start_index + 1)) - 1) << (INTERVALS - 1 - end_index)
+        self._mask |= mask
+        self._bits = self._bits | mask if state else self._bits & ~mask
 
     def set_on(self, start: Time = MIDNIGHT, end: Time = MIDNIGHT) -> None:
         """Set a schedule interval state to 'on'."""
@@ -258,17 +353,102 @@ class ScheduleDay(MutableMapping):
     @property
     def schedule(self) -> dict[Time, bool]:
         """Return the schedule."""
-        return self._schedule
+        return {
+            time: bool(self._bits & bit)
+            for time, bit in zip(TIMES, _TIME_BITS)
+            if self._mask & bit
+        }
+
+    @property
+    def bits(self) -> int:
+        """Return the interval states as the 48-bit integer.
+
+        Intervals that are not in the schedule are off.
+        """
+        return self._bits & self._mask
+
+    @classmethod
+    def from_int(cls: type[ScheduleDay], bits: int) -> ScheduleDay:
+        """Make schedule day from the 48-bit integer."""
+        schedule_day = cls()
+        schedule_day._bits = bits & FULL_DAY
+        schedule_day._mask = FULL_DAY
+        return schedule_day
+
+    @classmethod
+    def from_bytes(cls: type[ScheduleDay], buffer: bytes) -> ScheduleDay:
+        """Make schedule day from bytes."""
+        return cls.from_int(int.from_bytes(buffer[:SCHEDULE_DAY_SIZE], "big"))
 
     @classmethod
     def from_iterable(cls: type[ScheduleDay], intervals: Iterable[bool]) -> ScheduleDay:
         """Make schedule day from iterable."""
-        return cls({get_time(index): state for index, state in enumerate(intervals)})
+        schedule_day = cls()
+        for bit, state in zip(_TIME_BITS, intervals):
+            schedule_day._mask |= bit
+            if state:
+                schedule_day._bits |= bit
+
+        return schedule_day
+
+    def active_ranges(self) -> list[tuple[Time, Time]]:
+        """Return time ranges, when the schedule is on.
+
+        Start boundary is inclusive and end boundary is exclusive,
+        with midnight being the end of the day.
+        """
+        ranges: list[tuple[Time, Time]] = []
+        bits = self.bits
+        while bits:
+            # The run of ones starts at the highest bit and ends
+            # at the highest zero bit below it.
+            start = bits.bit_length()
+            zeros = ~bits & ((1 << start) - 1)
+            end = zeros.bit_length()
+            ranges.append(
+                (TIMES[INTERVALS - start], TIMES[(INTERVALS - end) % INTERVALS])
+            )
+            bits &= (1 << end) - 1
+
+        return ranges
+
+    def to_bytes(self) -> bytes:
+        """Return the schedule day as bytes."""
+        return self.bits.to_bytes(SCHEDULE_DAY_SIZE, "big")
+
+
+WEEKDAYS: tuple[str, ...] = (
+    "sunday",
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+)
+
+FULL_WEEK: Final = (1 << SCHEDULE_BITS) - 1
+
+
+def _get_weekday(date: dt.date) -> int:
+    """Return the weekday index, starting with sunday."""
+    return (date.weekday() + 1) % 7
+
+
+def _get_position(time_dt: dt.datetime) -> int:
+    """Return the interval position in the weekly schedule."""
+    return (
+        _get_weekday(time_dt) * INTERVALS + (time_dt.hour * 60 + time_dt.minute) // 30
+    )
 
 
 @dataclass(slots=True)
 class Schedule(Iterable):
-    """Represents a weekly schedule."""
+    """Represents a weekly schedule.
+
+    On the wire the schedule is a 336-bit block of seven days,
+    starting with sunday.
+    """
 
     name: str
     device: PhysicalDevice
@@ -281,6 +461,8 @@ class Schedule(Iterable):
     friday: ScheduleDay
     saturday: ScheduleDay
 
+    editor: ScheduleEditor | None = field(default=None, repr=False, compare=False)
+
     def __iter__(self) -> Iterator[ScheduleDay]:
         """Return list of days."""
         return (
@@ -293,15 +475,343 @@ class Schedule(Iterable):
             self.saturday,
         ).__iter__()
 
+    def _get_day(self, day: str | dt.date) -> ScheduleDay:
+        """Return the schedule day by the weekday name or date."""
+        if isinstance(day, dt.date):
+            day = WEEKDAYS[_get_weekday(day)]
+        elif day not in WEEKDAYS:
+            raise ValueError(f"Invalid weekday: {day}.")
+
+        return cast(ScheduleDay, getattr(self, day))
+
+    def is_active(self, at: dt.datetime) -> bool:
+        """Return whether the schedule is on at the specified time."""
+        return bool(self.bits >> (SCHEDULE_BITS - 1 - _get_position(at)) & 1)
+
+    def next_transition(self, after: dt.datetime) -> dt.datetime | None:
+        """Return the time of the next schedule state change.
+
+        Returns None, if the schedule state never changes.
+        """
+        position = _get_position(after)
+        shift = SCHEDULE_BITS - 1 - position
+        bits = self.bits
+        if not bits >> shift & 1:
+            # Look for the first interval that is on.
+            changes = bits
+        else:
+            # Look for the first interval that is off.
+            changes = ~bits & FULL_WEEK
+
+        if not changes:
+            return None
+
+        if following := changes & ((1 << shift) - 1):
+            intervals = shift - following.bit_length() + 1
+        else:
+            # Wrap around to the next week.
+            intervals = shift + SCHEDULE_BITS - changes.bit_length() + 1
+
+        start = after.replace(minute=0, second=0, microsecond=0)
+        return start + STEP * (after.minute // STEP_MINUTES + intervals)
+
+    def active_ranges(self, day: str | dt.date) -> list[tuple[Time, Time]]:
+        """Return time ranges for the weekday name or date, when schedule is on.
+
+        Start boundary is inclusive and end boundary is exclusive,
+        with midnight being the end of the day.
+        """
+        return self._get_day(day).active_ranges()
+
+    @property
+    def bits(self) -> int:
+        """Return the weekly schedule as the 336-bit integer."""
+        block = 0
+        for day in self:
+            block = (block << INTERVALS) | day.bits
+
+        return block
+
+    @classmethod
+    def from_bytes(
+        cls: type[Schedule],
+        name: str,
+        device: PhysicalDevice,
+        buffer: bytes,
+        editor: ScheduleEditor | None = None,
+    ) -> Schedule:
+        """Make weekly schedule from bytes."""
+        block = int.from_bytes(buffer[:SCHEDULE_SIZE], "big")
+        sunday, monday, tuesday, wednesday, thursday, friday, saturday = (
+            ScheduleDay.from_int(block >> shift)
+            for shift in range(SCHEDULE_BITS - INTERVALS, -1, -INTERVALS)
+        )
+        return cls(
+            name=name,
+            device=device,
+            sunday=sunday,
+            monday=monday,
+            tuesday=tuesday,
+            wednesday=wednesday,
+            thursday=thursday,
+            friday=friday,
+            saturday=saturday,
+            editor=editor,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Return the weekly schedule as bytes."""
+        return self.bits.to_bytes(SCHEDULE_SIZE, "big")
+
+    def create_request(self) -> Request:
+        """Create a request to set the weekly schedule."""
+        return Request.create_nowait(
+            FrameType.REQUEST_SET_SCHEDULE,
+            recipient=self.device.address,
+            data=collect_schedule_data(self.name, self.device) | {ATTR_SCHEDULE: self},
+        )
+
     async def commit(self) -> None:
-        """Commit a weekly schedule to the device."""
-        self.device.queue_send(
-            await Request.create(
-                FrameType.REQUEST_SET_SCHEDULE,
-                recipient=self.device.address,
-                data=collect_schedule_data(self.name, self.device),
+        """Commit a weekly schedule to the device.
+
+        If schedule has an editor, the commit is deferred to the editor,
+        that only sends it, if the schedule differs from the device.
+        """
+        if self.editor is not None:
+            self.editor.add(self)
+        else:
+            self.device.queue_send(self.create_request())
+
+
+SCHEDULE_COMMIT_DELAY: Final = 0.5
+
+
+@dataclass(slots=True)
+class _Transaction:
+    """Represents a schedule editor transaction."""
+
+    states: dict[str, bytes]
+    added: dict[str, Schedule] = field(default_factory=dict)
+
+
+class ScheduleEditor:
+    """Represents a schedule editor.
+
+    Editor collects the schedule commits and sends them in a single
+    batch after a short delay. Only schedules that differ from the
+    last known device state are sent and each of them is confirmed by
+    the next schedules response.
+    """
+
+    __slots__ = (
+        "device",
+        "delay",
+        "_confirmations",
+        "_pending",
+        "_snapshots",
+        "_timer",
+        "_transactions",
+    )
+
+    device: PhysicalDevice
+    delay: float
+    _confirmations: dict[str, tuple[bytes, int | None, asyncio.Future[bool]]]
+    _pending: dict[str, Schedule]
+    _snapshots: dict[str, bytes]
+    _timer: asyncio.TimerHandle | None
+    _transactions: list[_Transaction]
+
+    def __init__(
+        self, device: PhysicalDevice, delay: float = SCHEDULE_COMMIT_DELAY
+    ) -> None:
+        """Initialize a new schedule editor."""
+        self.device = device
+        self.delay = delay
+        self._confirmations = {}
+        self._pending = {}
+        self._snapshots = {}
+        self._timer = None
+        self._transactions = []
+
+    def __enter__(self) -> ScheduleEditor:
+        """Start the transaction.
+
+        Commits are deferred until the transaction ends, when the
+        schedules committed or changed in it are committed.
+        """
+        self._transactions.append(
+            _Transaction(
+                {name: schedule.to_bytes() for name, schedule in self._schedules()}
             )
         )
+        self._cancel_timer()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Commit the transaction.
+
+        If the block has raised, the schedules committed or changed in
+        it are restored to the state they had when it started.
+        """
+        transaction = self._transactions.pop()
+        touched = dict(transaction.added)
+        for name, schedule in self._schedules():
+            if schedule.to_bytes() != transaction.states.get(name):
+                touched.setdefault(name, schedule)
+
+        if exc_type is not None:
+            for name, schedule in touched.items():
+                if buffer := transaction.states.get(name, self._snapshots.get(name)):
+                    self._restore(schedule, buffer)
+        elif self._transactions:
+            self._transactions[-1].added.update(touched)
+        else:
+            self._pending.update(touched)
+            self.commit()
+
+    def _schedules(self) -> Iterator[tuple[str, Schedule]]:
+        """Return the device schedules."""
+        schedules: dict[str, Schedule] = self.device.get_nowait(ATTR_SCHEDULES, {})
+        return iter(schedules.items())
+
+    def _restore(self, schedule: Schedule, buffer: bytes) -> None:
+        """Restore the schedule days from bytes."""
+        restored = Schedule.from_bytes(schedule.name, schedule.device, buffer)
+        for day in WEEKDAYS:
+            setattr(schedule, day, getattr(restored, day))
+
+    def _cancel_timer(self) -> None:
+        """Cancel the commit timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        """Commit the pending schedules, once the delay has passed."""
+        self._timer = None
+        self.commit()
+
+    def add(self, schedule: Schedule) -> None:
+        """Add the schedule to the next batch."""
+        if self._transactions:
+            self._transactions[-1].added[schedule.name] = schedule
+        else:
+            self._pending[schedule.name] = schedule
+            self._cancel_timer()
+            self._timer = asyncio.get_running_loop().call_later(
+                self.delay, self._on_timer
+            )
+
+    def is_changed(self, schedule: Schedule) -> bool:
+        """Check if schedule differs from the last known device state."""
+        return schedule.to_bytes() != self._snapshots.get(schedule.name)
+
+    def commit(self) -> list[str]:
+        """Send the pending schedules and return names of the sent ones."""
+        self._cancel_timer()
+        pending, self._pending = self._pending, {}
+        version = self.device.get_frame_version(FrameType.REQUEST_SCHEDULES)
+        committed: list[str] = []
+        for name, schedule in pending.items():
+            buffer = schedule.to_bytes()
+            pending_buffer = None
+            if (confirmation := self._confirmations.get(name)) and not (
+                confirmation[2].done()
+            ):
+                pending_buffer = confirmation[0]
+
+            if buffer in (self._snapshots.get(name), pending_buffer):
+                # Schedule is unchanged or already waits for confirmation.
+                continue
+
+            self._expect(name, buffer, version)
+            self.device.queue_send(schedule.create_request())
+            committed.append(name)
+
+        return committed
+
+    def _expect(self, name: str, buffer: bytes, version: int | None) -> None:
+        """Replace the confirmation of the schedule."""
+        if confirmation := self._confirmations.get(name):
+            confirmation[2].cancel()
+
+        future = asyncio.get_running_loop().create_future()
+        self._confirmations[name] = (buffer, version, future)
+
+    def create_request(self, name: str) -> Request:
+        """Create a request to change the schedule switch or parameter.
+
+        The request carries the pending commit of the schedule, which
+        is sent with it, or the last known device state otherwise, so
+        the uncommitted changes aren't sent along.
+        """
+        snapshot = self._snapshots.get(name)
+        if (schedule := self._pending.pop(name, None)) is not None:
+            if (buffer := schedule.to_bytes()) != snapshot:
+                self._expect(
+                    name,
+                    buffer,
+                    self.device.get_frame_version(FrameType.REQUEST_SCHEDULES),
+                )
+        elif snapshot is not None:
+            schedule = Schedule.from_bytes(name, self.device, snapshot, editor=self)
+        else:
+            schedules: dict[str, Schedule] = self.device.get_nowait(ATTR_SCHEDULES, {})
+            schedule = schedules[name]
+
+        if not self._pending:
+            self._cancel_timer()
+
+        return schedule.create_request()
+
+    def update(self, name: str, buffer: bytes) -> None:
+        """Update the device state of the schedule.
+
+        Resolves the confirmation if schedule matches the committed one
+        or if the schedules frame version has changed without it.
+        """
+        self._snapshots[name] = buffer
+        if (confirmation := self._confirmations.get(name)) is None:
+            return
+
+        expected, version, future = confirmation
+        if future.done():
+            return
+
+        if buffer == expected:
+            future.set_result(True)
+        elif version != self.device.get_frame_version(FrameType.REQUEST_SCHEDULES):
+            future.set_result(False)
+
+    async def wait_confirmed(self, name: str, timeout: float | None = None) -> bool:
+        """Wait until the last commit of the schedule is confirmed.
+
+        Returns True if the schedule was never committed and False if
+        device has rejected it or the timeout has passed.
+        """
+        if (confirmation := self._confirmations.get(name)) is None:
+            return True
+
+        future = confirmation[2]
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except TimeoutError:
+            return False
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+
+            # Confirmation was cancelled by the new commit or on close.
+            return False
+
+    def close(self) -> None:
+        """Cancel the pending commits and confirmations."""
+        self._cancel_timer()
+        self._pending.clear()
+        for _, _, future in self._confirmations.values():
+            future.cancel()
+
+        self._confirmations.clear()
 
 
 class SchedulesStructure(StructureDecoder):
@@ -311,18 +821,6 @@ class SchedulesStructure(StructureDecoder):
 
     _offset: int
 
-    def _unpack_schedule(self, message: bytearray) -> list[list[bool]]:
-        """Unpack a schedule."""
-        offset = self._offset
-        schedule = [
-            bit
-            for i in range(offset, offset + SCHEDULE_SIZE)
-            for bit in split_byte(message[i])
-        ]
-        self._offset = offset + SCHEDULE_SIZE
-        # Split the schedule. Each day consists of 48 half-hour intervals.
-        return [schedule[i : i + 48] for i in range(0, len(schedule), 48)]
-
     def decode(
         self, message: bytearray, offset: int = 0, data: dict[str, Any] | None = None
     ) -> tuple[dict[str, Any], int]:
@@ -333,27 +831,29 @@ class SchedulesStructure(StructureDecoder):
         except IndexError:
             return ensure_dict(data, {ATTR_SCHEDULES: []}), offset
 
-        schedules: list[tuple[int, list[list[bool]]]] = []
+        schedules: list[tuple[int, bytes]] = []
         parameters: list[tuple[int, ParameterValues]] = []
 
-        self._offset = offset + 3
+        offset += 3
         for _ in range(start, start + end):
-            index = message[self._offset]
+            index = message[offset]
             switch = ParameterValues(
-                value=message[self._offset + 1], min_value=0, max_value=1
+                value=message[offset + 1], min_value=0, max_value=1
             )
-            parameter = unpack_parameter(message, self._offset + 2)
-            self._offset += 5
-            schedules.append((index, self._unpack_schedule(message)))
+            parameter = unpack_parameter(message, offset + 2)
+            offset += 5
+            schedules.append((index, bytes(message[offset : offset + SCHEDULE_SIZE])))
+            offset += SCHEDULE_SIZE
             parameters.append((index * 2, switch))
             if parameter is not None:
                 parameters.append((index * 2 + 1, parameter))
 
+        self._offset = offset
         return (
             ensure_dict(
                 data, {ATTR_SCHEDULES: schedules, ATTR_SCHEDULE_PARAMETERS: parameters}
             ),
-            self._offset,
+            offset,
         )
 
 
@@ -362,8 +862,17 @@ __all__ = [
     "ATTR_SCHEDULE_PARAMETERS",
     "ATTR_SCHEDULE_SWITCH",
     "ATTR_SCHEDULE_PARAMETER",
+    "FULL_DAY",
+    "FULL_WEEK",
+    "get_interval",
+    "get_interval_range",
+    "INTERVALS",
     "Schedule",
+    "SCHEDULE_DAY_SIZE",
+    "SCHEDULE_SIZE",
     "ScheduleDay",
+    "SCHEDULE_COMMIT_DELAY",
+    "ScheduleEditor",
     "ScheduleParameterDescription",
     "ScheduleParameter",
     "ScheduleNumberDescription",
@@ -373,4 +882,6 @@ __all__ = [
     "SCHEDULE_PARAMETERS",
     "collect_schedule_data",
     "SchedulesStructure",
+    "TIMES",
+    "WEEKDAYS",
 ]
@@ -1,14 +1,18 @@
 """Contains sensor data decoder."""
 
-from collections.abc import Generator, MutableMapping
-from contextlib import suppress
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 import math
 import struct
 from typing import Any, Final, TypeVar
 
-from pyplumio.const import ATTR_SCHEDULE, BYTE_UNDEFINED, DeviceState, LambdaState
-from pyplumio.data_types import Float, UnsignedInt, UnsignedShort
+from pyplumio.const import (
+    ATTR_SCHEDULE,
+    BYTE_UNDEFINED,
+    EXTRA_DEVICE_STATES,
+    DeviceState,
+    LambdaState,
+)
 from pyplumio.structures import StructureDecoder
 from pyplumio.utils import ensure_dict
 
@@ -155,58 +159,75 @@ class ConnectedModules:
 
 struct_version = struct.Struct("<BBB")
 struct_vendor = struct.Struct("<BB")
+struct_outputs = struct.Struct("<II")
+struct_temperature = struct.Struct("<Bf")
+struct_float = struct.Struct("<f")
+struct_lambda = struct.Struct("<BBH")
+struct_thermostat = struct.Struct("<Bff")
+struct_mixer = struct.Struct("<fBxBx")
+
+# Output states for each value of the outputs byte.
+_OUTPUT_BITS: Final = tuple(
+    tuple(bool(value & (1 << bit)) for bit in range(8)) for value in range(256)
+)
+
+# Enum members by their values, including the extra device states.
+_DEVICE_STATES: Final[dict[int, DeviceState]] = {
+    **EXTRA_DEVICE_STATES,
+    **{state.value: state for state in DeviceState},
+}
+_LAMBDA_STATES: Final[dict[int, LambdaState]] = {
+    state.value: state for state in LambdaState
+}
 
 _DataT = TypeVar("_DataT", bound=MutableMapping)
 
 
 class SensorDataStructure(StructureDecoder):
-    """Represents a sensor data structure."""
+    """Represents a sensor data structure.
+
+    Fields are decoded with the precompiled structs and enums and
+    output states are looked up in the precomputed tables.
+    """
 
     __slots__ = ("_offset",)
 
     _offset: int
 
     def _decode_outputs(self, message: bytearray, data: _DataT) -> _DataT:
-        """Decode outputs from message."""
-        outputs = UnsignedInt.from_bytes(message, self._offset)
-        self._offset += outputs.size
-        for index, output in enumerate(OUTPUTS):
-            data[output] = bool(outputs.value & 2**index)
-
-        return data
-
-    def _decode_output_flags(self, message: bytearray, data: _DataT) -> _DataT:
-        """Decode output flags from message."""
-        output_flags = UnsignedInt.from_bytes(message, self._offset)
-        self._offset += output_flags.size
-        data[ATTR_HEATING_PUMP_FLAG] = bool(output_flags.value & 0x04)
-        data[ATTR_WATER_HEATER_PUMP_FLAG] = bool(output_flags.value & 0x08)
-        data[ATTR_CIRCULATION_PUMP_FLAG] = bool(output_flags.value & 0x10)
-        data[ATTR_SOLAR_PUMP_FLAG] = bool(output_flags.value & 0x800)
+        """Decode outputs and output flags from message."""
+        outputs, output_flags = struct_outputs.unpack_from(message, self._offset)
+        self._offset += struct_outputs.size
+        data.update(
+            zip(
+                OUTPUTS,
+                _OUTPUT_BITS[outputs & 0xFF] + _OUTPUT_BITS[(outputs >> 8) & 0xFF],
+            )
+        )
+        data[ATTR_HEATING_PUMP_FLAG] = bool(output_flags & 0x04)
+        data[ATTR_WATER_HEATER_PUMP_FLAG] = bool(output_flags & 0x08)
+        data[ATTR_CIRCULATION_PUMP_FLAG] = bool(output_flags & 0x10)
+        data[ATTR_SOLAR_PUMP_FLAG] = bool(output_flags & 0x800)
         return data
 
     def _decode_temperatures(self, message: bytearray, data: _DataT) -> _DataT:
         """Decode temperatures from message."""
-        offset = self._offset
-        temperatures = message[offset]
-        offset += 1
-        for _ in range(temperatures):
-            index = message[offset]
-            offset += 1
-            temp = Float.from_bytes(message, offset)
-            offset += temp.size
-            if (not math.isnan(temp.value)) and 0 <= index < len(TEMPERATURES):
+        offset = self._offset + 1
+        end = offset + message[self._offset] * struct_temperature.size
+        for index, temp in struct_temperature.iter_unpack(
+            memoryview(message)[offset:end]
+        ):
+            if not math.isnan(temp) and index < len(TEMPERATURES):
                 # Temperature exists and index is in the correct range.
-                data[TEMPERATURES[index]] = temp.value
+                data[TEMPERATURES[index]] = temp
 
-        self._offset = offset
+        self._offset = end
         return data
 
     def _decode_statuses(self, message: bytearray, data: _DataT) -> _DataT:
         """Decode statuses from message."""
-        for index, status in enumerate(STATUSES):
-            data[status] = message[self._offset + index]
-
+        offset = self._offset
+        data.update(zip(STATUSES, message[offset : offset + len(STATUSES)]))
         self._offset += len(STATUSES)
         return data
 
@@ -245,140 +266,101 @@ class SensorDataStructure(StructureDecoder):
         self, name: str, message: bytearray, data: _DataT
     ) -> _DataT:
         """Decode float value and increase an offset."""
-        float_value = Float.from_bytes(message, self._offset)
-        self._offset += float_value.size
-        if not math.isnan(float_value.value):
-            data[name] = float_value.value
+        (float_value,) = struct_float.unpack_from(message, self._offset)
+        self._offset += struct_float.size
+        if not math.isnan(float_value):
+            data[name] = float_value
 
         return data
 
     def _decode_modules(self, message: bytearray, data: _DataT) -> _DataT:
         """Decode modules from message."""
         offset = self._offset
-
-        def _module_versions() -> Generator[tuple[str, str | None]]:
-            """Unpack a module version."""
-            nonlocal offset
-            for module in MODULES:
-                if message[offset] != BYTE_UNDEFINED:
-                    version_data = struct_version.unpack_from(message, offset)
-                    version = ".".join(str(i) for i in version_data)
-                    offset += struct_version.size
-                    if module == ATTR_MODULE_A:
-                        vendor_code, vendor_version = struct_vendor.unpack_from(
-                            message, offset
-                        )
-                        version += f".{chr(vendor_code) + str(vendor_version)}"
-                        offset += struct_vendor.size
-                else:
-                    offset += 1
-                    version = None
-
-                yield module, version
-
-        data[ATTR_MODULES] = ConnectedModules(**dict(_module_versions()))
+        versions: dict[str, str | None] = {}
+        for module in MODULES:
+            if message[offset] == BYTE_UNDEFINED:
+                offset += 1
+                versions[module] = None
+                continue
+
+            major, minor, patch = struct_version.unpack_from(message, offset)
+            offset += struct_version.size
+            version = f"{major}.{minor}.{patch}"
+            if module == ATTR_MODULE_A:
+                vendor_code, vendor_version = struct_vendor.unpack_from(message, offset)
+                offset += struct_vendor.size
+                version += f".{chr(vendor_code)}{vendor_version}"
+
+            versions[module] = version
+
+        data[ATTR_MODULES] = ConnectedModules(**versions)
         self._offset = offset
         return data
 
     def _decode_lambda_sensor(self, message: bytearray, data: _DataT) -> _DataT:
         """Decode lambda sensor from message."""
         offset = self._offset
-        lambda_state = message[offset]
-        offset += 1
-        if lambda_state != BYTE_UNDEFINED:
-            lambda_target = message[offset]
-            offset += 1
-            level = UnsignedShort.from_bytes(message, offset)
-            offset += level.size
-            with suppress(ValueError):
-                lambda_state = LambdaState(lambda_state)
-
-            data[ATTR_LAMBDA_STATE] = lambda_state
-            data[ATTR_LAMBDA_TARGET] = lambda_target
-            data[ATTR_LAMBDA_LEVEL] = level.value / 10
+        if message[offset] == BYTE_UNDEFINED:
+            self._offset = offset + 1
+            return data
 
-        self._offset = offset
+        lambda_state, lambda_target, level = struct_lambda.unpack_from(message, offset)
+        data[ATTR_LAMBDA_STATE] = _LAMBDA_STATES.get(lambda_state, lambda_state)
+        data[ATTR_LAMBDA_TARGET] = lambda_target
+        data[ATTR_LAMBDA_LEVEL] = level / 10
+        self._offset = offset + struct_lambda.size
         return data
 
     def _decode_thermostat_sensors(self, message: bytearray, data: _DataT) -> _DataT:
         """Decode thermostat sensors from message."""
-        contact_mask = 1
-        schedule_mask = 1 << 3
         offset = self._offset
+        contacts = message[offset]
+        offset += 1
+        if contacts == BYTE_UNDEFINED:
+            self._offset = offset
+            return data
+
+        thermostats = message[offset]
+        offset += 1
+        thermostat_sensors: dict[int, dict[str, Any]] = {}
+        for index in range(thermostats):
+            state, current_temp, target_temp = struct_thermostat.unpack_from(
+                message, offset
+            )
+            offset += struct_thermostat.size
+            if math.isnan(current_temp) or target_temp <= 0:
+                continue
 
-        def _unpack_thermostat_sensors(contacts: int) -> dict[str, Any] | None:
-            """Unpack sensors for a single thermostat."""
-            nonlocal offset, contact_mask, schedule_mask
-            state = message[offset]
-            offset += 1
-            current_temp = Float.from_bytes(message, offset)
-            offset += current_temp.size
-            target_temp = Float.from_bytes(message, offset)
-            offset += target_temp.size
-            contacts_state = bool(contacts & contact_mask)
-            contact_mask <<= 1
-            schedule_state = bool(contacts & schedule_mask)
-            schedule_mask <<= 1
-
-            if math.isnan(current_temp.value) or target_temp.value <= 0:
-                return None
-
-            return {
+            thermostat_sensors[index] = {
                 ATTR_STATE: state,
-                ATTR_CURRENT_TEMP: current_temp.value,
-                ATTR_TARGET_TEMP: target_temp.value,
-                ATTR_CONTACTS: contacts_state,
-                ATTR_SCHEDULE: schedule_state,
+                ATTR_CURRENT_TEMP: current_temp,
+                ATTR_TARGET_TEMP: target_temp,
+                ATTR_CONTACTS: bool(contacts & (1 << index)),
+                ATTR_SCHEDULE: bool(contacts & (1 << (index + 3))),
             }
 
-        def _thermostat_sensors(contacts: int) -> Generator[tuple[int, dict[str, Any]]]:
-            """Get thermostat sensors."""
-            for index in range(thermostats):
-                if sensors := _unpack_thermostat_sensors(contacts):
-                    yield (index, sensors)
-
-        contacts = message[offset]
-        offset += 1
-        if contacts != BYTE_UNDEFINED:
-            thermostats = message[offset]
-            offset += 1
-            thermostat_sensors = dict(_thermostat_sensors(contacts))
-            data[ATTR_THERMOSTAT_SENSORS] = thermostat_sensors
-            data[ATTR_THERMOSTATS_CONNECTED] = len(thermostat_sensors)
-            data[ATTR_THERMOSTATS_AVAILABLE] = thermostats
-
+        data[ATTR_THERMOSTAT_SENSORS] = thermostat_sensors
+        data[ATTR_THERMOSTATS_CONNECTED] = len(thermostat_sensors)
+        data[ATTR_THERMOSTATS_AVAILABLE] = thermostats
         self._offset = offset
         return data
 
     def _decode_mixer_sensors(self, message: bytearray, data: _DataT) -> _DataT:
         """Decode mixer sensors from message."""
         offset = self._offset
-
-        def _unpack_mixer_sensors() -> dict[str, Any] | None:
-            """Unpack sensors for a single mixer."""
-            nonlocal offset
-            current_temp = Float.from_bytes(message, offset)
-            offset += current_temp.size
-            data = None
-            if not math.isnan(current_temp.value):
-                data = {
-                    ATTR_CURRENT_TEMP: current_temp.value,
-                    ATTR_TARGET_TEMP: message[offset],
-                    ATTR_PUMP: bool(message[offset + 2] & 0x01),
-                }
-
-            offset += 4
-            return data
-
-        def _mixer_sensors(mixers: int) -> Generator[tuple[int, dict[str, Any]]]:
-            """Get mixer sensors."""
-            for index in range(mixers):
-                if sensors := _unpack_mixer_sensors():
-                    yield (index, sensors)
-
         mixers = message[offset]
         offset += 1
-        mixer_sensors = dict(_mixer_sensors(mixers))
+        mixer_sensors: dict[int, dict[str, Any]] = {}
+        for index in range(mixers):
+            current_temp, target_temp, pump = struct_mixer.unpack_from(message, offset)
+            offset += struct_mixer.size
+            if not math.isnan(current_temp):
+                mixer_sensors[index] = {
+                    ATTR_CURRENT_TEMP: current_temp,
+                    ATTR_TARGET_TEMP: target_temp,
+                    ATTR_PUMP: bool(pump & 0x01),
+                }
+
         data[ATTR_MIXER_SENSORS] = mixer_sensors
         data[ATTR_MIXERS_CONNECTED] = len(mixer_sensors)
         data[ATTR_MIXERS_AVAILABLE] = mixers
@@ -390,13 +372,10 @@ class SensorDataStructure(StructureDecoder):
     ) -> tuple[dict[str, Any], int]:
         """Decode bytes and return message data and offset."""
         data = ensure_dict(data)
-        data[ATTR_STATE] = message[offset]
+        state = message[offset]
+        data[ATTR_STATE] = _DEVICE_STATES.get(state, state)
         self._offset = offset + 1
-        with suppress(ValueError):
-            data[ATTR_STATE] = DeviceState(data[ATTR_STATE])
-
         data = self._decode_outputs(message, data)
-        data = self._decode_output_flags(message, data)
         data = self._decode_temperatures(message, data)
         data = self._decode_statuses(message, data)
         data = self._decode_pending_alerts(message, data)
@@ -0,0 +1,164 @@
+"""Contains per frame type traffic statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import time
+from typing import Final, NamedTuple
+
+from pyplumio.frames import Frame
+from pyplumio.helpers.metrics import Histogram, HistogramSnapshot, RateCounter
+
+# Sliding windows in seconds the rates are reported for.
+RATE_WINDOWS: Final = (1, 10, 60)
+
+
+class TrafficSnapshot(NamedTuple):
+    """Represents a traffic counter snapshot."""
+
+    frames: int
+    bytes: int
+    decode_time: HistogramSnapshot | None
+
+
+class RateSnapshot(NamedTuple):
+    """Represents a transfer rate snapshot."""
+
+    frames_per_second: float
+    bytes_per_second: float
+
+
+class TrafficStatisticsSnapshot(NamedTuple):
+    """Represents a traffic statistics snapshot."""
+
+    received: dict[int, TrafficSnapshot]
+    sent: dict[int, TrafficSnapshot]
+    senders: dict[int, TrafficSnapshot]
+    received_rates: dict[int, RateSnapshot]
+    sent_rates: dict[int, RateSnapshot]
+
+
+@dataclass(slots=True)
+class TrafficCounter:
+    """Represents a frame and byte counter."""
+
+    frames: int = 0
+    bytes: int = 0
+    decode_time: Histogram | None = None
+
+    def snapshot(self) -> TrafficSnapshot:
+        """Return a snapshot of the counter."""
+        return TrafficSnapshot(
+            self.frames,
+            self.bytes,
+            self.decode_time.snapshot() if self.decode_time else None,
+        )
+
+
+@dataclass(slots=True)
+class _TransferRate:
+    """Represents frame and byte rates."""
+
+    frames: RateCounter = field(default_factory=RateCounter)
+    bytes: RateCounter = field(default_factory=RateCounter)
+
+    def add(self, length: int, now: float) -> None:
+        """Add the frame of specified length to the rates."""
+        self.frames.add(1, now)
+        self.bytes.add(length, now)
+
+    def snapshot(self, now: float) -> dict[int, RateSnapshot]:
+        """Return the rates for each window."""
+        return {
+            window: RateSnapshot(
+                self.frames.rate(window, now), self.bytes.rate(window, now)
+            )
+            for window in RATE_WINDOWS
+        }
+
+
+class TrafficStatistics:
+    """Represents traffic statistics by frame type and sender.
+
+    Counters are created once for each frame type and sender, after
+    which updates only change the existing counters. Decode time
+    includes the time it takes for the device to handle the frame.
+    """
+
+    __slots__ = ("received", "sent", "senders", "_received_rate", "_sent_rate")
+
+    received: dict[int, TrafficCounter]
+    sent: dict[int, TrafficCounter]
+    senders: dict[int, TrafficCounter]
+    _received_rate: _TransferRate
+    _sent_rate: _TransferRate
+
+    def __init__(self) -> None:
+        """Initialize a new traffic statistics."""
+        self.received = {}
+        self.sent = {}
+        self.senders = {}
+        self._received_rate = _TransferRate()
+        self._sent_rate = _TransferRate()
+
+    def update_received(self, frame: Frame) -> None:
+        """Update received frame statistics."""
+        frame_type, length = frame.frame_type, frame.length
+        if (counter := self.received.get(frame_type)) is None:
+            counter = self.received[frame_type] = TrafficCounter(
+                decode_time=Histogram()
+            )
+
+        counter.frames += 1
+        counter.bytes += length
+        if (sender := self.senders.get(frame.sender)) is None:
+            sender = self.senders[frame.sender] = TrafficCounter()
+
+        sender.frames += 1
+        sender.bytes += length
+        self._received_rate.add(length, time.monotonic())
+
+    def update_decode_time(self, frame_type: int, seconds: float) -> None:
+        """Update decode time for the received frame type."""
+        counter = self.received.get(frame_type)
+        if counter is not None and counter.decode_time is not None:
+            counter.decode_time.observe(seconds)
+
+    def update_sent(self, frame: Frame) -> None:
+        """Update sent frame statistics."""
+        frame_type, length = frame.frame_type, frame.length
+        if (counter := self.sent.get(frame_type)) is None:
+            counter = self.sent[frame_type] = TrafficCounter()
+
+        counter.frames += 1
+        counter.bytes += length
+        self._sent_rate.add(length, time.monotonic())
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        self.received.clear()
+        self.sent.clear()
+        self.senders.clear()
+        self._received_rate = _TransferRate()
+        self._sent_rate = _TransferRate()
+
+    def snapshot(self) -> TrafficStatisticsSnapshot:
+        """Return a snapshot of the statistics."""
+        now = time.monotonic()
+        return TrafficStatisticsSnapshot(
+            received={key: value.snapshot() for key, value in self.received.items()},
+            sent={key: value.snapshot() for key, value in self.sent.items()},
+            senders={key: value.snapshot() for key, value in self.senders.items()},
+            received_rates=self._received_rate.snapshot(now),
+            sent_rates=self._sent_rate.snapshot(now),
+        )
+
+
+__all__ = [
+    "RATE_WINDOWS",
+    "RateSnapshot",
+    "TrafficCounter",
+    "TrafficSnapshot",
+    "TrafficStatistics",
+    "TrafficStatisticsSnapshot",
+]
@@ -0,0 +1,205 @@
+"""Contains a write queue class."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from enum import IntEnum, unique
+import heapq
+import time
+from typing import Final
+
+from pyplumio.const import (
+    ATTR_DEVICE_INDEX,
+    ATTR_INDEX,
+    ATTR_OFFSET,
+    ATTR_TYPE,
+    FrameType,
+)
+from pyplumio.frames import Frame, Response
+from pyplumio.helpers.metrics import Histogram
+
+
+@unique
+class WritePriority(IntEnum):
+    """Contains write priorities, lowest is sent first."""
+
+    RESPONSE = 0
+    WRITE = 1
+    READ = 2
+
+
+# Frame types that change the device state and the data keys that
+# identify the target. Only the latest pending frame for each target
+# is sent.
+COALESCE_KEYS: Final[dict[int, tuple[str, ...]]] = {
+    FrameType.REQUEST_ECOMAX_CONTROL: (),
+    FrameType.REQUEST_SET_ECOMAX_PARAMETER: (ATTR_INDEX,),
+    FrameType.REQUEST_SET_MIXER_PARAMETER: (ATTR_DEVICE_INDEX, ATTR_INDEX),
+    FrameType.REQUEST_SET_THERMOSTAT_PARAMETER: (ATTR_INDEX, ATTR_OFFSET),
+    FrameType.REQUEST_SET_SCHEDULE: (ATTR_TYPE,),
+}
+
+
+def get_priority(frame: Frame) -> WritePriority:
+    """Return the write priority for the frame."""
+    if isinstance(frame, Response):
+        return WritePriority.RESPONSE
+
+    if frame.frame_type in COALESCE_KEYS:
+        return WritePriority.WRITE
+
+    return WritePriority.READ
+
+
+def get_coalesce_key(frame: Frame) -> Hashable | None:
+    """Return the key that identifies the frame target.
+
+    Returns None, if the frame can't be replaced by a newer frame.
+    """
+    if (keys := COALESCE_KEYS.get(frame.frame_type)) is None:
+        return None
+
+    data = frame.data
+    return (frame.frame_type, frame.recipient, *(data.get(key) for key in keys))
+
+
+@dataclass(order=True, slots=True)
+class _QueueEntry:
+    """Represents a write queue entry."""
+
+    priority: int
+    sequence: int
+    frame: Frame = field(compare=False)
+    key: Hashable | None = field(compare=False)
+    queued_at: float = field(compare=False)
+
+
+@dataclass(slots=True, kw_only=True)
+class WriteQueueStatistics:
+    """Represents a write queue statistics."""
+
+    #: Number of frames put into the queue
+    queued_frames: int = 0
+
+    #: Number of frames taken from the queue
+    dequeued_frames: int = 0
+
+    #: Number of frames replaced by a newer frame for the same target
+    coalesced_frames: int = 0
+
+    #: Highest number of frames waiting in the queue
+    max_depth: int = 0
+
+    #: Total time in seconds the dequeued frames spent in the queue
+    total_wait_time: float = 0.0
+
+    #: Longest time in seconds a frame spent in the queue
+    max_wait_time: float = 0.0
+
+    #: Histogram of time in seconds frames spent in the queue
+    wait_times: Histogram = field(default_factory=Histogram)
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Return the mean time in seconds a frame spent in the queue."""
+        if not self.dequeued_frames:
+            return 0.0
+
+        return self.total_wait_time / self.dequeued_frames
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        self.queued_frames = 0
+        self.dequeued_frames = 0
+        self.coalesced_frames = 0
+        self.max_depth = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.wait_times = Histogram()
+
+
+class WriteQueue(asyncio.Queue[Frame]):
+    """Represents a write queue.
+
+    Frames are taken in the order of their priority: responses to the
+    device requests first, then requests that change the device state
+    and then the rest. Frames with the same priority keep the order
+    they were put in.
+
+    If a frame changes the same parameter or schedule as a frame that
+    is still waiting in the queue, the waiting frame is replaced and
+    keeps its place in the queue.
+    """
+
+    _queue: list[_QueueEntry]
+    _pending: dict[Hashable, _QueueEntry]
+    _sequence: int
+    _statistics: WriteQueueStatistics
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize a new write queue."""
+        self._pending = {}
+        self._sequence = 0
+        self._statistics = WriteQueueStatistics()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the underlying heap."""
+        self._queue = []
+
+    def put_nowait(self, item: Frame) -> None:
+        """Put the frame into the queue or replace the pending one."""
+        key = get_coalesce_key(item)
+        if key is not None and (entry := self._pending.get(key)) is not None:
+            entry.frame = item
+            self._statistics.coalesced_frames += 1
+            return
+
+        super().put_nowait(item)
+
+    def _put(self, item: Frame) -> None:
+        """Push the frame to the heap."""
+        entry = _QueueEntry(
+            get_priority(item),
+            self._sequence,
+            item,
+            get_coalesce_key(item),
+            time.monotonic(),
+        )
+        self._sequence += 1
+        if entry.key is not None:
+            self._pending[entry.key] = entry
+
+        heapq.heappush(self._queue, entry)
+        self._statistics.queued_frames += 1
+        self._statistics.max_depth = max(self._statistics.max_depth, len(self._queue))
+
+    def _get(self) -> Frame:
+        """Pop the frame with the highest priority from the heap."""
+        entry = heapq.heappop(self._queue)
+        if entry.key is not None:
+            del self._pending[entry.key]
+
+        wait_time = time.monotonic() - entry.queued_at
+        self._statistics.dequeued_frames += 1
+        self._statistics.total_wait_time += wait_time
+        self._statistics.max_wait_time = max(self._statistics.max_wait_time, wait_time)
+        self._statistics.wait_times.observe(wait_time)
+        return entry.frame
+
+    @property
+    def statistics(self) -> WriteQueueStatistics:
+        """Return the write queue statistics."""
+        return self._statistics
+
+
+__all__ = [
+    "COALESCE_KEYS",
+    "get_coalesce_key",
+    "get_priority",
+    "WritePriority",
+    "WriteQueue",
+    "WriteQueueStatistics",
+]
@@ -1,5 +1,6 @@
 """Contains tests for the ecoMAX device."""
 
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Any, cast
@@ -8,6 +9,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from pyplumio.const import (
+    ATTR_COUNT,
     ATTR_FRAME_ERRORS,
     ATTR_INDEX,
     ATTR_OFFSET,
@@ -16,6 +18,7 @@ from pyplumio.const import (
     ATTR_SENSORS,
     ATTR_SETUP,
     ATTR_SIZE,
+    ATTR_START,
     ATTR_SWITCH,
     ATTR_TYPE,
     ATTR_VALUE,
@@ -27,6 +30,7 @@ from pyplumio.const import (
     State,
     UnitOfMeasurement,
 )
+from pyplumio.devices import SET_NOWAIT_LIMIT
 from pyplumio.devices.ecomax import (
     ATTR_FUEL_BURNED,
     ATTR_MIXERS,
@@ -53,6 +57,7 @@ from pyplumio.frames.responses import (
     SchedulesResponse,
     ThermostatParametersResponse,
 )
+from pyplumio.parameters import ParameterValues
 from pyplumio.parameters.ecomax import PARAMETER_TYPES, EcomaxNumber, EcomaxSwitch
 from pyplumio.structures.ecomax_parameters import ATTR_ECOMAX_CONTROL
 from pyplumio.structures.frame_versions import ATTR_FRAME_VERSIONS
@@ -63,7 +68,6 @@ from pyplumio.structures.schedules import (
     ATTR_SCHEDULE_SWITCH,
     ATTR_SCHEDULES,
     Schedule,
-    ScheduleDay,
     ScheduleNumber,
     ScheduleSwitch,
 )
@@ -158,8 +162,10 @@ async def test_ecomax_control(state: State, ecomax: EcoMAX, caplog) -> None:
 
 
 @pytest.mark.parametrize("state", [STATE_ON, STATE_OFF])
-@patch("pyplumio.devices.ecomax.EcoMAX.create_task")
-def test_ecomax_control_nowait(mock_create_task, ecomax: EcoMAX, state: State) -> None:
+@patch("pyplumio.devices.ecomax.EcoMAX.create_group_task")
+def test_ecomax_control_nowait(
+    mock_create_group_task, ecomax: EcoMAX, state: State
+) -> None:
     """Test ecoMAX control without waiting for result."""
     func = getattr(ecomax, f"turn_{state}_nowait")
     with patch(
@@ -168,7 +174,31 @@ def test_ecomax_control_nowait(mock_create_task, ecomax: EcoMAX, state: State) -
         func()
 
     mock_coro.assert_called_once()
-    mock_create_task.assert_called_once_with(mock_coro.return_value)
+    mock_create_group_task.assert_called_once_with("state", mock_coro.return_value)
+
+
+async def test_ecomax_control_nowait_serialized(ecomax: EcoMAX) -> None:
+    """Test that state changes are applied one by one."""
+    calls = []
+    release = asyncio.Event()
+
+    async def _set_ecomax_state(state: State) -> bool:
+        calls.append(state)
+        await release.wait()
+        return True
+
+    with patch.object(EcoMAX, "_set_ecomax_state", side_effect=_set_ecomax_state):
+        ecomax.turn_on_nowait()
+        ecomax.turn_off_nowait()
+        await asyncio.wait(ecomax.groups["state"].tasks, timeout=0.01)
+
+        # Verify that the next change waits for the previous one.
+        assert calls == [STATE_ON]
+        release.set()
+        await ecomax.wait_until_done(group="state")
+
+    assert calls == [STATE_ON, STATE_OFF]
+    assert ecomax.groups["state"].stats.coalesced == 0
 
 
 @patch("pyplumio.devices.mixer.Mixer.shutdown")
@@ -289,6 +319,175 @@ async def test_ecomax_parameters_event_listener(
     assert request.data[ATTR_VALUE] == 21
 
 
+@patch("asyncio.Queue.put_nowait")
+@class_from_json(
+    EcomaxParametersResponse,
+    "responses/ecomax_parameters.json",
+    arguments=("message",),
+)
+async def test_ecomax_parameters_changes(
+    mock_put_nowait, ecomax: EcoMAX, ecomax_parameters: EcomaxParametersResponse
+) -> None:
+    """Test that only changed ecoMAX parameters are dispatched."""
+    ecomax.handle_frame(ecomax_parameters)
+    await ecomax.wait_until_done()
+    fuzzy_logic = ecomax.get_nowait("fuzzy_logic")
+    callback = AsyncMock(return_value=None)
+    ecomax.subscribe("fuzzy_logic", callback)
+    ecomax.handle_frame(ecomax_parameters)
+    await ecomax.wait_until_done()
+    callback.assert_not_awaited()
+
+    # Test that parameter with the pending update is dispatched.
+    await fuzzy_logic.set(STATE_OFF, timeout=0)
+    await ecomax.on_event_ecomax_parameters([(18, fuzzy_logic.values)])
+    callback.assert_awaited_once_with(fuzzy_logic)
+    assert not fuzzy_logic.pending
+
+    # Test that parameter with the changed values is dispatched.
+    callback.reset_mock()
+    await ecomax.on_event_ecomax_parameters([(18, ParameterValues(1, 0, 1))])
+    callback.assert_awaited_once_with(fuzzy_logic)
+    assert fuzzy_logic == STATE_ON
+
+    # Test that rejected optimistic update is reverted to device values.
+    callback.reset_mock()
+    with patch.object(fuzzy_logic.description, "optimistic", True):
+        await fuzzy_logic.set(STATE_OFF)
+
+    assert fuzzy_logic == STATE_OFF
+    assert not fuzzy_logic.pending
+    await ecomax.on_event_ecomax_parameters([(18, ParameterValues(1, 0, 1))])
+    callback.assert_awaited_once_with(fuzzy_logic)
+    assert fuzzy_logic == STATE_ON
+
+
+@patch("asyncio.Queue.put_nowait")
+@class_from_json(
+    EcomaxParametersResponse,
+    "responses/ecomax_parameters.json",
+    arguments=("message",),
+)
+async def test_request_parameter_changes(
+    mock_put_nowait, ecomax: EcoMAX, ecomax_parameters: EcomaxParametersResponse
+) -> None:
+    """Test requesting the changed ecoMAX parameters."""
+    ecomax.handle_frame(ecomax_parameters)
+    await ecomax.wait_until_done()
+    changes = FrameType.REQUEST_ECOMAX_PARAMETER_CHANGES
+    with patch.object(EcoMAX, "data", {ATTR_SETUP: True}):
+        await ecomax.on_event_frame_versions({changes: 1})
+
+    mock_put_nowait.assert_called_once_with(
+        EcomaxParametersRequest(recipient=DeviceType.ECOMAX)
+    )
+    assert ecomax.get_frame_version(changes) == 1
+
+    # Test that only the range with pending updates is requested.
+    await ecomax.get_nowait("fuzzy_logic").set(STATE_OFF, timeout=0)
+    max_fuzzy_logic_power = ecomax.get_nowait("max_fuzzy_logic_power")
+    await max_fuzzy_logic_power.set(max_fuzzy_logic_power.min_value, timeout=0)
+    mock_put_nowait.reset_mock()
+    with patch.object(EcoMAX, "data", {ATTR_SETUP: True}):
+        await ecomax.on_event_frame_versions({changes: 3})
+
+    mock_put_nowait.assert_called_once_with(
+        EcomaxParametersRequest(
+            recipient=DeviceType.ECOMAX, data={ATTR_START: 18, ATTR_COUNT: 3}
+        )
+    )
+
+    # Test that all parameters are requested, when the number of
+    # changes doesn't match the number of pending updates.
+    for version in (4, 7):
+        mock_put_nowait.reset_mock()
+        with patch.object(EcoMAX, "data", {ATTR_SETUP: True}):
+            await ecomax.on_event_frame_versions({changes: version})
+
+        mock_put_nowait.assert_called_once_with(
+            EcomaxParametersRequest(recipient=DeviceType.ECOMAX)
+        )
+
+
+@patch("asyncio.Queue.put_nowait")
+@class_from_json(
+    EcomaxParametersResponse,
+    "responses/ecomax_parameters.json",
+    arguments=("message",),
+)
+async def test_set_many_ecomax_parameters(
+    mock_put_nowait, ecomax: EcoMAX, ecomax_parameters: EcomaxParametersResponse
+) -> None:
+    """Test setting multiple ecoMAX parameters."""
+    ecomax.handle_frame(ecomax_parameters)
+    await ecomax.wait_until_done()
+    mock_put_nowait.reset_mock()
+    task = asyncio.create_task(
+        ecomax.set_many(
+            {"fuzzy_logic": STATE_OFF, "max_fuzzy_logic_power": 50}, concurrency=2
+        )
+    )
+    await asyncio.wait({task}, timeout=0.01)
+
+    # Verify that requests are sent before either of them is confirmed.
+    assert [call.args[0].data for call in mock_put_nowait.call_args_list] == [
+        {ATTR_INDEX: 18, ATTR_VALUE: 0},
+        {ATTR_INDEX: 20, ATTR_VALUE: 50},
+    ]
+    await ecomax.on_event_ecomax_parameters(
+        [(18, ParameterValues(0, 0, 1)), (20, ParameterValues(50, 0, 100))]
+    )
+    assert await task == {"fuzzy_logic": True, "max_fuzzy_logic_power": True}
+
+
+@patch("asyncio.Queue.put_nowait")
+@class_from_json(
+    EcomaxParametersResponse,
+    "responses/ecomax_parameters.json",
+    arguments=("message",),
+)
+async def test_set_nowait_ecomax_parameters(
+    mock_put_nowait, ecomax: EcoMAX, ecomax_parameters: EcomaxParametersResponse
+) -> None:
+    """Test that no writes are dropped, when setting many parameters."""
+    ecomax.handle_frame(ecomax_parameters)
+    await ecomax.wait_until_done()
+    mock_put_nowait.reset_mock()
+    parameters = {
+        parameter.description.name: parameter
+        for parameter in ecomax.data.values()
+        if isinstance(parameter, EcomaxNumber)
+        and parameter.min_value != parameter.max_value
+    }
+    assert len(parameters) > SET_NOWAIT_LIMIT
+    for name, parameter in parameters.items():
+        ecomax.set_nowait(
+            name,
+            parameter.min_value
+            if parameter.value == parameter.max_value
+            else parameter.max_value,
+        )
+
+    sent: set[int] = set()
+    while len(sent) < len(parameters):
+        await asyncio.wait(ecomax.groups["set"].tasks, timeout=0.01)
+        requests = [call.args[0] for call in mock_put_nowait.call_args_list]
+        mock_put_nowait.reset_mock()
+        assert requests
+
+        # Confirm the updates, so waiting updates can be sent.
+        for request in requests:
+            sent.add(request.data[ATTR_INDEX])
+
+        for parameter in parameters.values():
+            if parameter.pending:
+                parameter.update(parameter.values)
+
+    await ecomax.wait_until_done(group="set")
+    assert ecomax.groups["set"].stats.dropped == 0
+    assert ecomax.groups["set"].stats.created == len(parameters)
+
+
 @class_from_json(
     EcomaxParametersResponse,
     "unknown/unknown_ecomax_parameter.json",
@@ -556,23 +755,7 @@ async def test_ecomax_schedules_event_listener(
         ATTR_SCHEDULE: ecomax.data[ATTR_SCHEDULES]["water_heater"],
     }
 
-    schedule_data = schedules_data[ATTR_SCHEDULES][0][1]
-    for index, weekday in enumerate(
-        (
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-        )
-    ):
-        schedule = getattr(heating_schedule, weekday)
-        assert (
-            schedule.schedule
-            == ScheduleDay.from_iterable(schedule_data[index]).schedule
-        )
+    assert heating_schedule.to_bytes() == schedules_data[ATTR_SCHEDULES][0][1]
 
     # Test that parameter instance is not recreated on subsequent calls.
     ecomax.handle_frame(schedules)
@@ -4,16 +4,29 @@ from __future__ import annotations
 
 import asyncio
 from typing import Literal
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from pyplumio.const import ATTR_FRAME_ERRORS, DeviceType, FrameType
-from pyplumio.devices import Device, PhysicalDevice, device_handler, get_device_handler
+from pyplumio.devices import (
+    SET_NOWAIT_LIMIT,
+    Device,
+    PhysicalDevice,
+    device_handler,
+    get_device_class,
+    get_device_handler,
+    load_device_classes,
+)
+from pyplumio.devices.ecomax import EcoMAX
+from pyplumio.devices.ecoster import EcoSTER
 from pyplumio.exceptions import RequestError, UnknownDeviceError
 from pyplumio.filters import on_change
 from pyplumio.frames import Response
+from pyplumio.frames.requests import AlertsRequest
+from pyplumio.frames.responses import AlertsResponse
 from pyplumio.parameters import Parameter
+from pyplumio.request_tracker import RequestTracker
 from pyplumio.structures.frame_versions import ATTR_FRAME_VERSIONS
 from pyplumio.structures.network_info import NetworkInfo
 from tests.conftest import RAISES
@@ -39,6 +52,43 @@ def test_get_device_handler(
         assert get_device_handler(device_type) == handler
 
 
+@pytest.mark.parametrize(
+    ("device_type", "cls"),
+    [
+        (DeviceType.ECOMAX, EcoMAX),
+        (DeviceType.ECOSTER, EcoSTER),
+        (DeviceType.ECONET, RAISES),
+    ],
+)
+def test_get_device_class(
+    device_type: DeviceType, cls: type[PhysicalDevice] | Literal["raises"]
+) -> None:
+    """Test getting device class by device address."""
+    if cls == RAISES:
+        with pytest.raises(UnknownDeviceError, match="Unsupported device type"):
+            get_device_class(device_type)
+    else:
+        assert get_device_class(device_type) is cls
+
+
+def test_load_device_classes() -> None:
+    """Test loading device classes."""
+    get_device_class.cache_clear()
+    load_device_classes()
+    assert get_device_class.cache_info().currsize == 2
+
+
+async def test_create() -> None:
+    """Test creating a physical device from the device type."""
+    kwargs = {"write_queue": asyncio.Queue(), "network_info": NetworkInfo()}
+    assert isinstance(PhysicalDevice.create_nowait(DeviceType.ECOMAX, **kwargs), EcoMAX)
+    assert isinstance(
+        await PhysicalDevice.create(DeviceType.ECOSTER, **kwargs), EcoSTER
+    )
+    with pytest.raises(TypeError, match="Expected subclass of 'EcoMAX'"):
+        EcoMAX.create_nowait(DeviceType.ECOSTER, **kwargs)
+
+
 class DummyDevice(Device):
     """Represents a dummy device for testing."""
 
@@ -68,13 +118,48 @@ class TestDevice:
         with pytest.raises(TypeError, match="not valid or does not exist"):
             await device.set("foo", "bar")  # type: ignore[arg-type]
 
-    @patch("pyplumio.devices.Device.create_task")
+    @patch("pyplumio.devices.Device.create_group_task")
     @patch("pyplumio.devices.Device.set", new_callable=Mock)
-    def test_set_nowait(self, mock_set, mock_create_task, device: Device) -> None:
+    def test_set_nowait(self, mock_set, mock_create_group_task, device: Device) -> None:
         """Test changing a device parameter without waiting."""
         device.set_nowait("foo", "off")
         mock_set.assert_called_once_with("foo", "off", 0, None)
-        mock_create_task.assert_called_once_with(mock_set.return_value)
+        mock_create_group_task.assert_called_once_with(
+            "set", mock_set.return_value, name="set_foo"
+        )
+        assert device.groups["set"].limit == SET_NOWAIT_LIMIT
+
+    async def test_set_many(self, device: Device) -> None:
+        """Test changing multiple device parameters."""
+        parameters = {
+            "foo": Mock(spec=Parameter, set=AsyncMock(return_value=True)),
+            "bar": Mock(spec=Parameter, set=AsyncMock(return_value=False)),
+        }
+        with patch("pyplumio.devices.Device.get_nowait", side_effect=parameters.get):
+            results = await device.set_many({"foo": 1, "bar": "on"}, retries=2)
+
+        assert results == {"foo": True, "bar": False}
+        parameters["foo"].validate.assert_called_once_with(1)
+        parameters["foo"].set.assert_awaited_once_with(1, retries=2, timeout=5.0)
+        parameters["bar"].set.assert_awaited_once_with("on", retries=2, timeout=5.0)
+
+    async def test_set_many_invalid(self, device: Device) -> None:
+        """Test that nothing is sent when one of the values is invalid."""
+        parameter = Mock(spec=Parameter, set=AsyncMock())
+        with (
+            patch("pyplumio.devices.Device.get_nowait", side_effect=[parameter, None]),
+            pytest.raises(TypeError, match="not valid or does not exist"),
+        ):
+            await device.set_many({"foo": 1, "bar": 2})
+
+        parameter.validate.side_effect = ValueError
+        with (
+            patch("pyplumio.devices.Device.get_nowait", return_value=parameter),
+            pytest.raises(ValueError),
+        ):
+            await device.set_many({"foo": 1})
+
+        parameter.set.assert_not_awaited()
 
     @patch("pyplumio.devices.Device.cancel_tasks")
     @patch("pyplumio.devices.Device.wait_until_done")
@@ -82,7 +167,9 @@ class TestDevice:
         self, wait_until_done, cancel_tasks, device: Device
     ) -> None:
         """Test shutting down the device tasks."""
+        stream = device.stream("test")
         await device.shutdown()
+        assert stream.closed
         cancel_tasks.assert_called_once()
         wait_until_done.assert_awaited_once()
 
@@ -90,7 +177,7 @@ class TestDevice:
 class DummyPhysicalDevice(PhysicalDevice):
     """Represents a dummy physical device."""
 
-    address = 0
+    address = DeviceType.ALL
 
 
 @pytest.fixture(name="physical_device")
@@ -112,7 +199,7 @@ class TestPhysicalDevice:
             ),
         ],
     )
-    @patch("pyplumio.frames.Request.create", autospec=True)
+    @patch("pyplumio.frames.Request.create_nowait", autospec=True)
     @patch("asyncio.Queue.put_nowait")
     async def test_frame_versions_event_listener(
         self,
@@ -125,7 +212,7 @@ class TestPhysicalDevice:
         """Test event listener for frame versions."""
         assert physical_device.has_frame_version(frame_type, 1) is False
         await physical_device.on_event_frame_versions({frame_type: 1})
-        mock_request_create.assert_awaited_once_with(
+        mock_request_create.assert_called_once_with(
             requested_frame_type, recipient=DummyPhysicalDevice.address
         )
         mock_put_nowait.assert_called_once_with(mock_request_create.return_value)
@@ -147,18 +234,21 @@ class TestPhysicalDevice:
         assert physical_device.supports_frame_type(FrameType.REQUEST_ALERTS) is False
 
     @patch("pyplumio.frames.Frame.assign_to")
-    @patch("pyplumio.devices.PhysicalDevice.dispatch_nowait")
+    @patch("pyplumio.devices.PhysicalDevice.dispatch_many_nowait")
     async def test_handle_frame(
-        self, mock_dispatch_nowait, mock_assign_to, physical_device: PhysicalDevice
+        self,
+        mock_dispatch_many_nowait,
+        mock_assign_to,
+        physical_device: PhysicalDevice,
     ) -> None:
         """Test frame handling."""
         frame = Response(data={"test": True})
         physical_device.handle_frame(frame)
         mock_assign_to.assert_called_once_with(physical_device)
-        mock_dispatch_nowait.assert_called_once_with("test", True)
+        mock_dispatch_many_nowait.assert_called_once_with({"test": True})
 
     @patch("pyplumio.devices.PhysicalDevice.get")
-    @patch("pyplumio.frames.Request.create", autospec=True)
+    @patch("pyplumio.frames.Request.create_nowait", autospec=True)
     @patch("asyncio.Queue.put_nowait")
     async def test_request(
         self,
@@ -173,13 +263,13 @@ class TestPhysicalDevice:
             FrameType.REQUEST_ALERTS, recipient=DummyPhysicalDevice.address
         )
         mock_put_nowait.assert_called_once_with(mock_request_create.return_value)
-        mock_get.assert_awaited_once_with("alerts", timeout=3.0)
+        mock_get.assert_awaited_once_with("alerts")
 
     @patch(
         "pyplumio.devices.PhysicalDevice.get",
         side_effect=(TimeoutError, TimeoutError),
     )
-    @patch("pyplumio.frames.Request.create", autospec=True)
+    @patch("pyplumio.frames.Request.create_nowait", autospec=True)
     @patch("asyncio.Queue.put_nowait")
     async def test_request_retry(
         self,
@@ -199,9 +289,73 @@ class TestPhysicalDevice:
         )
         mock_put_nowait.assert_called_with(mock_request_create.return_value)
         assert mock_put_nowait.call_count == 2
-        mock_get.assert_awaited_with("alerts", timeout=3.0)
+        mock_get.assert_awaited_with("alerts")
         assert mock_get.call_count == 2
 
+    @pytest.mark.parametrize("pending", [False, True])
+    @patch("pyplumio.devices.PhysicalDevice.get")
+    @patch("asyncio.Queue.put_nowait")
+    async def test_request_with_tracker(
+        self, mock_put_nowait, mock_get, pending: bool
+    ) -> None:
+        """Test making a request with the request tracker."""
+        request_tracker = RequestTracker()
+        physical_device = DummyPhysicalDevice(
+            asyncio.Queue(), NetworkInfo(), request_tracker=request_tracker
+        )
+        if pending:
+            request_tracker.expect(AlertsRequest(recipient=DummyPhysicalDevice.address))
+
+        asyncio.get_running_loop().call_later(
+            0.01,
+            request_tracker.resolve,
+            AlertsResponse(sender=DummyPhysicalDevice.address),
+        )
+        await physical_device.request("alerts", frame_type=FrameType.REQUEST_ALERTS)
+        mock_get.assert_awaited_once_with("alerts")
+
+        # Verify that the pending request isn't sent again.
+        if pending:
+            mock_put_nowait.assert_not_called()
+        else:
+            mock_put_nowait.assert_called_once()
+            assert isinstance(mock_put_nowait.call_args[0][0], AlertsRequest)
+
+    @patch("asyncio.Queue.put_nowait")
+    async def test_request_with_tracker_retry(self, mock_put_nowait) -> None:
+        """Test retrying a request when the response is missing."""
+        physical_device = DummyPhysicalDevice(
+            asyncio.Queue(), NetworkInfo(), request_tracker=RequestTracker()
+        )
+        with pytest.raises(RequestError, match="Failed to request"):
+            await physical_device.request(
+                "alerts", frame_type=FrameType.REQUEST_ALERTS, retries=2, timeout=0.01
+            )
+
+        assert mock_put_nowait.call_count == 2
+
+    async def test_request_with_tracker_deadline(self) -> None:
+        """Test that the response and the value share the timeout."""
+        request_tracker = RequestTracker()
+        physical_device = DummyPhysicalDevice(
+            asyncio.Queue(), NetworkInfo(), request_tracker=request_tracker
+        )
+        loop = asyncio.get_running_loop()
+        loop.call_later(
+            0.08,
+            request_tracker.resolve,
+            AlertsResponse(sender=DummyPhysicalDevice.address),
+        )
+        start = loop.time()
+        with pytest.raises(RequestError):
+            await physical_device.request(
+                "alerts", frame_type=FrameType.REQUEST_ALERTS, retries=1, timeout=0.1
+            )
+
+        # Verify that the value isn't waited for another timeout.
+        assert loop.time() - start < 0.15
+        assert len(request_tracker) == 0
+
     async def test_device_handler(self) -> None:
         """Test device handler decorator."""
         wrapper = device_handler(DeviceType.ECOMAX)
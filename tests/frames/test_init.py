@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 from tests.conftest import RAISES
 
@@ -10,13 +12,18 @@ from pyplumio.exceptions import UnknownFrameError
 from pyplumio.frames import (
     ECONET_TYPE,
     ECONET_VERSION,
+    Frame,
     Request,
     Response,
     contains,
     frame_handler,
+    get_frame_class,
     get_frame_handler,
+    load_frame_classes,
     struct_header,
 )
+from pyplumio.frames.messages import RegulatorDataMessage
+from pyplumio.frames.requests import StopMasterRequest
 from pyplumio.frames.responses import ProgramVersionResponse
 from pyplumio.structures.network_info import NetworkInfoStructure
 from pyplumio.structures.program_version import ATTR_VERSION, VersionInfo
@@ -87,6 +94,62 @@ def test_get_frame_handler(frame_type: FrameType | int, handler: str) -> None:
         assert get_frame_handler(frame_type) == handler
 
 
+@pytest.mark.parametrize(
+    ("frame_type", "cls"),
+    [
+        (FrameType.REQUEST_STOP_MASTER, StopMasterRequest),
+        (FrameType.MESSAGE_REGULATOR_DATA, RegulatorDataMessage),
+        (FrameType.REQUEST_ECOMAX_PARAMETER_CHANGES, RAISES),
+    ],
+)
+def test_get_frame_class(frame_type: FrameType, cls: type[Frame] | str) -> None:
+    """Test getting a frame class."""
+    if cls == RAISES:
+        with pytest.raises(UnknownFrameError, match="Unsupported frame type"):
+            get_frame_class(frame_type)
+    else:
+        assert get_frame_class(frame_type) is cls
+
+
+def test_get_frame_class_import_error() -> None:
+    """Test getting a frame class from the module that fails to import."""
+    get_frame_class.cache_clear()
+    with (
+        patch("importlib.import_module", side_effect=ImportError),
+        pytest.raises(UnknownFrameError, match="Unsupported frame type"),
+    ):
+        get_frame_class(FrameType.REQUEST_STOP_MASTER)
+
+    assert get_frame_class(FrameType.REQUEST_STOP_MASTER) is StopMasterRequest
+
+
+def test_load_frame_classes() -> None:
+    """Test loading frame classes."""
+    get_frame_class.cache_clear()
+    load_frame_classes()
+    assert get_frame_class.cache_info().currsize > 0
+
+
+def test_create_nowait() -> None:
+    """Test creating a frame from the frame type."""
+    frame = Request.create_nowait(
+        FrameType.REQUEST_STOP_MASTER, recipient=DeviceType.ECOMAX
+    )
+    assert isinstance(frame, StopMasterRequest)
+    assert frame.recipient == DeviceType.ECOMAX
+
+    with pytest.raises(TypeError, match="Expected subclass of 'Request'"):
+        Request.create_nowait(FrameType.RESPONSE_PROGRAM_VERSION)
+
+
+async def test_create() -> None:
+    """Test creating a frame from the frame type with waiting."""
+    frame = await Request.create(
+        FrameType.REQUEST_STOP_MASTER, recipient=DeviceType.ECOMAX
+    )
+    assert isinstance(frame, StopMasterRequest)
+
+
 def test_passing_frame_type(
     frames: tuple[Request, Response], types: tuple[int, int]
 ) -> None:
@@ -5,7 +5,7 @@ from typing import Final
 import pytest
 from tests.conftest import json_test_data, load_json_parameters, load_json_test_data
 
-from pyplumio.const import ATTR_SENSORS
+from pyplumio.const import ATTR_SENSORS, DeviceState
 from pyplumio.devices.ecomax import EcoMAX
 from pyplumio.frames.messages import RegulatorDataMessage, SensorDataMessage
 from pyplumio.structures.frame_versions import ATTR_FRAME_VERSIONS
@@ -58,3 +58,11 @@ async def test_sensor_data_message_with_unknown_state(sensor_data_message) -> No
     sensor_data_message[INDEX_STATE] = 99
     sensor_data = SensorDataMessage(message=sensor_data_message)
     assert sensor_data.data[ATTR_SENSORS][ATTR_STATE] == 99
+
+
+@json_test_data("messages/sensor_data.json", selector="message")
+async def test_sensor_data_message_with_extra_state(sensor_data_message) -> None:
+    """Test a sensor data message with an extra device state."""
+    sensor_data_message[INDEX_STATE] = 12
+    sensor_data = SensorDataMessage(message=sensor_data_message)
+    assert sensor_data.data[ATTR_SENSORS][ATTR_STATE] is DeviceState.STABILIZATION
@@ -1,10 +1,13 @@
 """Contains tests for the simple async cache."""
 
+import asyncio
+import gc
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from pyplumio.helpers.async_cache import AsyncCache, acache
+from pyplumio.helpers import async_cache as async_cache_module
+from pyplumio.helpers.async_cache import AsyncCache, CacheInfo, acache, make_key
 
 
 @pytest.fixture(name="async_cache")
@@ -28,22 +31,162 @@ async def test_async_cache_get(async_cache: AsyncCache):
     cached_result = await async_cache.get(cache_key, mock_coro)
     assert cached_result == "test_value"
     mock_coro.assert_not_called()
+    assert async_cache.info == CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+
+
+async def test_async_cache_maxsize():
+    """Test that the least recently used entry is evicted."""
+    async_cache = AsyncCache(maxsize=2)
+    await async_cache.get("foo", AsyncMock(return_value=1))
+    await async_cache.get("bar", AsyncMock(return_value=2))
+    await async_cache.get("foo", AsyncMock(return_value=1))
+    await async_cache.get("baz", AsyncMock(return_value=3))
+    assert list(async_cache.cache) == ["foo", "baz"]
+    assert len(async_cache) == 2
+
+
+@patch("time.monotonic", side_effect=(0, 5, 11, 11))
+async def test_async_cache_ttl(mock_monotonic):
+    """Test that the expired entry is recomputed."""
+    async_cache = AsyncCache(ttl=10)
+    mock_coro = AsyncMock(side_effect=("old_value", "new_value"))
+    assert await async_cache.get("foo", mock_coro) == "old_value"
+    assert await async_cache.get("foo", mock_coro) == "old_value"
+    assert await async_cache.get("foo", mock_coro) == "new_value"
+    assert mock_coro.await_count == 2
+
+
+async def test_async_cache_single_flight(async_cache: AsyncCache):
+    """Test that concurrent calls await a single computation."""
+    event = asyncio.Event()
+    calls = 0
+
+    async def _compute():
+        nonlocal calls
+        calls += 1
+        await event.wait()
+        return "test_value"
+
+    tasks = [asyncio.create_task(async_cache.get("foo", _compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    event.set()
+    assert await asyncio.gather(*tasks) == ["test_value"] * 3
+    assert calls == 1
+    assert async_cache.info.misses == 1
+    assert async_cache.info.hits == 2
+
+
+async def test_async_cache_single_flight_error(async_cache: AsyncCache):
+    """Test that the error is raised for all concurrent calls."""
+    event = asyncio.Event()
+
+    async def _compute():
+        await event.wait()
+        raise ValueError("test")
+
+    tasks = [asyncio.create_task(async_cache.get("foo", _compute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    event.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "foo" not in async_cache.cache
+
+    # Verify that the error is not cached.
+    assert await async_cache.get("foo", AsyncMock(return_value=1)) == 1
+
+
+async def test_async_cache_single_flight_cancelled(async_cache: AsyncCache):
+    """Test that the waiting call computes the value if the first is cancelled."""
+    event = asyncio.Event()
+    calls = 0
+
+    async def _compute():
+        nonlocal calls
+        calls += 1
+        await event.wait()
+        return "test_value"
+
+    tasks = [asyncio.create_task(async_cache.get("foo", _compute)) for _ in range(3)]
+    await asyncio.wait(tasks, timeout=0.01)
+    tasks[0].cancel()
+    await asyncio.wait(tasks, timeout=0.01)
+    event.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["test_value"] * 2
+    assert calls == 2
+    assert async_cache.cache["foo"] == "test_value"
+
+
+async def test_async_cache_clear(async_cache: AsyncCache):
+    """Test clearing the cache."""
+    await async_cache.get("foo", AsyncMock(return_value=1))
+    async_cache.clear()
+    assert async_cache.info == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_make_key():
+    """Test making a cache key."""
+    assert make_key((1, "foo"), {}) == (1, "foo")
+    assert make_key((1,), {"bar": 2}) != make_key((1, "bar", 2), {})
+    assert hash(make_key((1,), {"bar": 2})) == hash(make_key((1,), {"bar": 2}))
 
 
 async def test_acache():
     """Test an acache decorator."""
-    # Mock function to pass to the decorator.
     mock_coro = AsyncMock(return_value="test_value")
-    mock_coro.__qualname__ = "test_coro"
-
-    # Call the decorator.
-    decorator = acache(mock_coro)
-    with patch("pyplumio.helpers.async_cache.AsyncCache.get") as mock_get:
-        await decorator()
-
-    # Check that get function was execute with correct parameters.
-    mock_get.assert_awaited_once()
-    get_call = mock_get.call_args[0]
-    key, func = get_call
-    assert key == "unittest.mock.test_coro:():{}"
-    assert await func() == "test_value"
+    decorated = acache(mock_coro)
+    assert await decorated(1, foo="bar") == "test_value"
+    assert await decorated(1, foo="bar") == "test_value"
+    mock_coro.assert_awaited_once_with(1, foo="bar")
+    assert decorated.cache_info() == CacheInfo(
+        hits=1, misses=1, maxsize=128, currsize=1
+    )
+    decorated.cache_clear()
+    assert decorated.cache_info().currsize == 0
+
+
+async def test_acache_with_arguments():
+    """Test an acache decorator with arguments."""
+    mock_coro = AsyncMock(side_effect=(1, 2, 3))
+    decorated = acache(maxsize=1)(mock_coro)
+    assert await decorated("foo") == 1
+    assert await decorated("bar") == 2
+    assert await decorated("foo") == 3
+    assert decorated.cache_info().currsize == 1
+
+
+async def test_acache_per_instance():
+    """Test an acache decorator with per instance caches."""
+
+    class Dummy:
+        """Represents a dummy class."""
+
+        @acache(per_instance=True)
+        async def method(self, value: int) -> int:
+            """Return the value."""
+            return value
+
+    dummies = [Dummy(), Dummy()]
+    for dummy in dummies:
+        assert await dummy.method(1) == 1
+        assert await dummy.method(1) == 1
+
+    assert Dummy.method.cache_info() == CacheInfo(
+        hits=2, misses=2, maxsize=128, currsize=2
+    )
+
+    # Verify that the cache is discarded together with the instance.
+    del dummies, dummy
+    gc.collect()
+    assert Dummy.method.cache_info().currsize == 0
+
+
+def test_async_cache_deprecated() -> None:
+    """Test the deprecated module-level cache."""
+    with pytest.warns(DeprecationWarning, match="async_cache is deprecated"):
+        cache = async_cache_module.async_cache
+
+    assert isinstance(cache, AsyncCache)
+    with pytest.raises(AttributeError):
+        async_cache_module.foo  # noqa: B018
@@ -1,12 +1,19 @@
 """Contains tests for the event manager."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
 from pyplumio.filters import Filter
-from pyplumio.helpers.event_manager import EventManager, StopPropagation, event_listener
+from pyplumio.helpers.event_manager import (
+    DISPATCH_LIMIT,
+    EventManager,
+    StopPropagation,
+    StreamMode,
+    event_listener,
+)
 
 
 @pytest.fixture(name="event_manager")
@@ -119,6 +126,103 @@ async def test_load_nowait(event_manager: EventManager) -> None:
     callback2.assert_awaited_once_with("test_value2")
 
 
+async def test_dispatch_many(event_manager: EventManager) -> None:
+    """Test dispatching multiple events."""
+    callback = AsyncMock(return_value=None)
+    event_manager.subscribe("test_key1", callback)
+    event = event_manager.create_event("test_key2")
+    event_manager.dispatch_many_nowait({"test_key1": 1, "test_key2": 2})
+
+    # Verify that events without callbacks are applied immediately.
+    assert event_manager.get_nowait("test_key2") == 2
+    assert event.is_set()
+    await event_manager.wait_until_done()
+    assert event_manager.get_nowait("test_key1") == 1
+    callback.assert_awaited_once_with(1)
+
+    callback.reset_mock()
+    await event_manager.dispatch_many({"test_key1": 3, "test_key3": 4})
+    callback.assert_awaited_once_with(3)
+
+    # Verify that only events with callbacks are run in the group.
+    assert event_manager.groups["dispatch"].stats.created == 2
+    assert event_manager.groups["dispatch"].limit == DISPATCH_LIMIT
+    assert event_manager.get_nowait("test_key1") == 3
+    assert event_manager.get_nowait("test_key3") == 4
+
+
+async def test_stream(event_manager: EventManager) -> None:
+    """Test streaming the event values."""
+    with event_manager.stream("test_key1") as stream:
+        for value in (1, 2, 3):
+            await event_manager.dispatch("test_key1", value)
+
+        # Verify that only the latest value is kept.
+        assert len(stream) == 1
+        assert await anext(stream) == 3
+
+        # Verify that consumer is woken up by the dispatch.
+        task = asyncio.create_task(anext(stream))
+        await asyncio.wait({task}, timeout=0.01)
+        assert not task.done()
+        event_manager.dispatch_many_nowait({"test_key1": 4, "test_key2": 5})
+        assert await task == 4
+
+    assert stream.closed
+    assert not event_manager._streams
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+
+    with pytest.raises(ValueError):
+        event_manager.stream("test_key1", maxsize=0)
+
+
+async def test_stream_drop_oldest(event_manager: EventManager) -> None:
+    """Test streaming the event values with the bounded buffer."""
+    stream = event_manager.stream("test_key1", StreamMode.DROP_OLDEST, maxsize=2)
+    for value in (1, 2, 3):
+        event_manager.dispatch_many_nowait({"test_key1": value})
+
+    assert [await anext(stream), await anext(stream)] == [2, 3]
+
+    # Verify that the waiting consumer stops on close.
+    task = asyncio.create_task(anext(stream))
+    await asyncio.wait({task}, timeout=0.01)
+    event_manager.close_streams()
+    with pytest.raises(StopAsyncIteration):
+        await task
+
+    # Verify that closed stream ignores the values.
+    stream.put("test_key1", 4)
+    assert len(stream) == 0
+
+
+async def test_stream_many(event_manager: EventManager) -> None:
+    """Test streaming multiple events."""
+    callback = AsyncMock(return_value=None)
+    event_manager.subscribe("test_key1", callback)
+    with event_manager.stream_many(("test_key1", "test_key2")) as stream:
+        await event_manager.dispatch_many(
+            {"test_key1": 1, "test_key2": 2, "test_key3": 3}
+        )
+        await event_manager.dispatch("test_key1", 4)
+        assert [item async for item in _take(stream, 2)] == [
+            ("test_key2", 2),
+            ("test_key1", 4),
+        ]
+
+    callback.assert_has_awaits([call(1), call(4)])
+
+
+async def _take(stream: Any, count: int) -> Any:
+    """Take the number of items from the stream."""
+    async for item in stream:
+        yield item
+        count -= 1
+        if not count:
+            break
+
+
 async def test_subscribe(event_manager: EventManager) -> None:
     """Test subscribing to an event."""
     callback = AsyncMock(return_value=True)
@@ -129,6 +233,78 @@ async def test_subscribe(event_manager: EventManager) -> None:
     callback.assert_has_awaits([call("test_value2"), call("test_value3")])
 
 
+async def test_subscribe_background(event_manager: EventManager) -> None:
+    """Test subscribing a callback in the background."""
+    release = asyncio.get_running_loop().create_future()
+    values = []
+
+    async def _slow_callback(value: Any) -> None:
+        await release
+        values.append(value)
+
+    transform = AsyncMock(side_effect=lambda value: value * 10)
+    event_manager.subscribe("test_key1", transform)
+    event_manager.subscribe("test_key1", _slow_callback, background=True, maxsize=2)
+    for value in (1, 2, 3):
+        await event_manager.dispatch("test_key1", value)
+
+    # Verify that slow callback doesn't hold up the dispatch.
+    assert event_manager.get_nowait("test_key1") == 30
+    assert not values
+    release.set_result(None)
+    await event_manager.wait_until_done()
+
+    # Verify that the oldest value is dropped from the full queue.
+    assert values == [20, 30]
+
+    # Verify that background callbacks are skipped on stop propagation.
+    stop = AsyncMock(return_value=StopPropagation)
+    event_manager.subscribe("test_key1", stop)
+    event_manager.unsubscribe("test_key1", transform)
+    await event_manager.dispatch("test_key1", 4)
+    await event_manager.wait_until_done()
+    assert values == [20, 30]
+
+    event_manager.unsubscribe("test_key1", stop)
+    event_manager.dispatch_many_nowait({"test_key1": 5})
+    await event_manager.wait_until_done()
+    assert values == [20, 30, 5]
+
+    assert event_manager.unsubscribe("test_key1", _slow_callback)
+    await event_manager.dispatch("test_key1", 6)
+    await event_manager.wait_until_done()
+    assert values == [20, 30, 5]
+
+
+async def test_subscribe_background_error(event_manager: EventManager, caplog) -> None:
+    """Test background callback error."""
+    callback = AsyncMock(side_effect=(OSError, None))
+    event_manager.subscribe("test_key1", callback, background=True)
+    event_manager.dispatch_many_nowait({"test_key1": 1})
+    event_manager.dispatch_many_nowait({"test_key1": 2})
+    await event_manager.wait_until_done()
+    assert "Error in event listener" in caplog.text
+    callback.assert_has_awaits([call(1), call(2)])
+
+    with pytest.raises(ValueError):
+        event_manager.subscribe("test_key1", callback, background=True, maxsize=0)
+
+
+@patch("time.perf_counter", side_effect=(0.0, 0.05, 0.0, 0.2))
+async def test_callback_budget(
+    mock_perf_counter, event_manager: EventManager, caplog
+) -> None:
+    """Test reporting the callbacks exceeding the budget."""
+    event_manager.callback_budget = 0.1
+    callback = AsyncMock(return_value=None)
+    event_manager.subscribe("test_key1", callback)
+    await event_manager.dispatch("test_key1", 1)
+    assert "exceeding the budget" not in caplog.text
+    await event_manager.dispatch("test_key1", 2)
+    assert "exceeding the budget" in caplog.text
+    assert mock_perf_counter.call_count == 4
+
+
 async def test_subscribe_once(event_manager: EventManager) -> None:
     """Test subscribing to an event once."""
     callback = AsyncMock(return_value=True)
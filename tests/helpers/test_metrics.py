@@ -0,0 +1,36 @@
+"""Contains tests for the metric classes."""
+
+from pyplumio.helpers.metrics import Histogram, RateCounter
+
+
+def test_histogram() -> None:
+    """Test observing values in the histogram."""
+    histogram = Histogram(bounds=(1.0, 2.0))
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.bounds == (1.0, 2.0)
+    assert snapshot.counts == (2, 1, 1)
+    assert snapshot.count == 4
+    assert snapshot.sum == 6.0
+    assert snapshot.mean == 1.5
+    assert Histogram().snapshot().mean == 0.0
+
+
+def test_rate_counter() -> None:
+    """Test the sliding window rate counter."""
+    rate_counter = RateCounter(slots=5)
+    rate_counter.add(1, now=10.2)
+    rate_counter.add(2, now=10.7)
+    rate_counter.add(3, now=11.5)
+    rate_counter.add(4, now=12.1)
+
+    # Current second is not included.
+    assert rate_counter.rate(1, now=12.5) == 3
+    assert rate_counter.rate(2, now=12.5) == 3
+    assert rate_counter.rate(10, now=12.5) == 1.5
+
+    # Old values are discarded when the slot is reused.
+    rate_counter.add(5, now=15.0)
+    assert rate_counter.rate(4, now=16.0) == 2.25
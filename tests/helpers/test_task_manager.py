@@ -1,11 +1,12 @@
 """Contains tests for the task manager helper class."""
 
 import asyncio
+import sys
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from pyplumio.helpers.task_manager import TaskManager
+from pyplumio.helpers.task_manager import OverflowPolicy, TaskManager
 
 
 @pytest.fixture(name="task_manager")
@@ -30,6 +31,26 @@ def test_create_task(task_manager: TaskManager) -> None:
     create_task_mock.assert_called_once_with(mock_coro, name="test_task")
 
 
+async def test_create_eager_task(task_manager: TaskManager) -> None:
+    """Test creating an eager task."""
+    started = []
+
+    async def _coro() -> int:
+        started.append(True)
+        return 1
+
+    task = task_manager.create_eager_task(_coro())
+    if sys.version_info >= (3, 12):
+        # Verify that task completes without being scheduled.
+        assert started
+        assert task.done()
+        assert task not in task_manager.tasks
+    else:
+        assert task in task_manager.tasks
+
+    assert await task == 1
+
+
 def test_cancel_task(task_manager: TaskManager) -> None:
     """Test canceling a task."""
     mock_coro = Mock()
@@ -46,3 +67,173 @@ async def test_wait_until_done(mock_gather, task_manager: TaskManager) -> None:
     """Test waiting until all tasks are done."""
     await task_manager.wait_until_done()
     mock_gather.assert_awaited_once_with(*task_manager.tasks, return_exceptions=True)
+
+
+async def test_group_wait() -> None:
+    """Test running the tasks in the group with the limit."""
+    task_manager = TaskManager()
+    group = task_manager.create_group("test", limit=1)
+    release = asyncio.get_running_loop().create_future()
+
+    async def _coro(value: int) -> int:
+        await release
+        return value
+
+    task1 = group.create_task(_coro(1))
+    task2 = task_manager.create_group_task("test", _coro(2))
+    assert task1 and task2
+    assert group.tasks == {task1}
+    assert group.pending == {task1, task2}
+    await asyncio.wait({task1, task2}, timeout=0.01)
+
+    # Verify that only a single task is created and running.
+    assert group.stats.created == 1
+    assert group.stats.running == 1
+    assert group.stats.queued == 1
+    release.set_result(None)
+    await task_manager.wait_until_done(group="test")
+    assert (await task1, await task2) == (1, 2)
+    assert group.stats.created == 2
+    assert group.stats.running == 0
+    assert group.stats.queued == 0
+    assert group.stats.duration.count == 2
+    assert not group.pending
+
+
+async def test_group_backlog() -> None:
+    """Test the backlog of the full group."""
+    task_manager = TaskManager()
+    group = task_manager.create_group("test", limit=1, backlog=2)
+    release = asyncio.Event()
+    coros = [AsyncMock(), AsyncMock(), AsyncMock()]
+
+    async def _coro() -> None:
+        await release.wait()
+
+    task1 = group.create_task(_coro())
+    task2 = group.create_task(coros[0]())
+    task3 = group.create_task(coros[1]())
+    assert task1 and task2 and task3
+
+    # Verify that the task is dropped, if the backlog is full.
+    assert group.create_task(coros[2]()) is None
+    assert group.stats.queued == 2
+    assert group.stats.dropped == 1
+    assert task_manager.tasks == {task1}
+
+    # Verify that the task cancelled in the backlog is never created.
+    task2.cancel()
+    await asyncio.wait({task2}, timeout=0.01)
+    assert group.stats.queued == 1
+    release.set()
+    await task_manager.wait_until_done()
+    assert task2.cancelled()
+    assert task3.done() and not task3.cancelled()
+    coros[0].assert_not_awaited()
+    coros[1].assert_awaited_once()
+    coros[2].assert_not_awaited()
+    assert group.stats.created == 2
+    assert group.stats.queued == 0
+
+
+async def test_group_backlog_cancel() -> None:
+    """Test canceling the tasks in the backlog."""
+    task_manager = TaskManager()
+    group = task_manager.create_group("test", limit=1)
+    release = asyncio.Event()
+    coro = AsyncMock()
+
+    async def _coro() -> None:
+        await release.wait()
+
+    task1 = group.create_task(_coro())
+    task2 = group.create_task(coro())
+    assert task1 and task2
+    assert task_manager.cancel_tasks()
+    await task_manager.wait_until_done()
+    assert task1.cancelled()
+    assert task2.cancelled()
+    coro.assert_not_awaited()
+    assert group.stats.created == 1
+    assert group.stats.queued == 0
+
+
+async def test_group_drop() -> None:
+    """Test dropping the tasks from the full group."""
+    task_manager = TaskManager()
+    group = task_manager.create_group("test", limit=1, policy=OverflowPolicy.DROP)
+    coro = AsyncMock(side_effect=OSError)
+    assert task_manager.create_group_task("test", coro()) is not None
+    assert task_manager.create_group_task("test", coro()) is None
+    await group.wait_until_done()
+    assert group.stats.created == 1
+    assert group.stats.dropped == 1
+    assert group.stats.failed == 1
+    coro.assert_awaited_once()
+
+
+async def test_group_coalesce() -> None:
+    """Test replacing the tasks with the same name."""
+    task_manager = TaskManager()
+    group = task_manager.create_group("test", limit=1, policy=OverflowPolicy.COALESCE)
+    coro1 = AsyncMock()
+    coro2 = AsyncMock()
+    coro3 = AsyncMock()
+    task1 = group.create_task(coro1(), name="test_task")
+    task2 = group.create_task(coro2(), name="test_task")
+
+    # Verify that the task above the limit waits instead of dropping.
+    task3 = group.create_task(coro3(), name="test_task2")
+    await task_manager.wait_until_done()
+    assert task1 and task1.cancelled()
+    assert task2 and task2.done()
+    assert task3 and task3.done()
+    coro1.assert_not_awaited()
+    coro2.assert_awaited_once()
+    coro3.assert_awaited_once()
+    assert group.stats.coalesced == 1
+    assert group.stats.dropped == 0
+
+
+async def test_group_coalesce_running() -> None:
+    """Test replacing the running task below the limit."""
+    task_manager = TaskManager()
+    group = task_manager.create_group("test", limit=2, policy=OverflowPolicy.COALESCE)
+    release = asyncio.Event()
+
+    async def _coro() -> None:
+        await release.wait()
+
+    task1 = group.create_task(_coro(), name="test_task")
+    assert task1
+    await asyncio.wait({task1}, timeout=0.01)
+    assert group.stats.running == 1
+    task2 = group.create_task(_coro(), name="test_task")
+    release.set()
+    await group.wait_until_done()
+    assert task1.cancelled()
+    assert task2 and task2.done() and not task2.cancelled()
+    assert group.stats.coalesced == 1
+
+
+async def test_group_cancel() -> None:
+    """Test canceling the tasks in the group."""
+    task_manager = TaskManager()
+    release = asyncio.get_running_loop().create_future()
+
+    async def _coro() -> None:
+        await release
+
+    task1 = task_manager.create_group_task("test", _coro())
+    task2 = task_manager.create_task(_coro())
+    assert task_manager.cancel_tasks(group="test")
+    assert task_manager.cancel_tasks(group="unknown")
+    await task_manager.wait_until_done(group="test")
+    assert task1 and task1.cancelled()
+    assert not task2.done()
+    assert task_manager.groups["test"].cancel_tasks()
+    task2.cancel()
+    await task_manager.wait_until_done()
+
+    with pytest.raises(ValueError):
+        task_manager.create_group("test", limit=0)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from math import isclose
 from typing import Any
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -286,18 +286,13 @@ class TestParameter:
             parameter.set_nowait(4, timeout=0)
             await parameter.device.wait_until_done()
         else:
-            mock_update_pending = AsyncMock(spec=asyncio.Event)
-            mock_update_done = AsyncMock(spec=asyncio.Event)
-            mock_update_done.is_set = Mock(return_value=True)
-            with (
-                patch.object(DummyParameter, "update_pending", mock_update_pending),
-                patch.object(DummyParameter, "update_done", mock_update_done),
-            ):
-                result = await parameter.set(4, timeout=0)
+            task = asyncio.create_task(parameter.set(4))
+            await asyncio.wait({task}, timeout=0.01)
+            assert parameter.pending
+            parameter.update(ParameterValues(value=4, min_value=0, max_value=10))
+            assert await task is True
 
-            assert result is True
-            mock_update_done.clear.assert_called_once()
-            mock_update_pending.set.assert_called_once()
+        assert parameter.pending is nowait
 
         assert parameter == 4
         mock_validate.assert_called_once_with(4)
@@ -337,7 +332,7 @@ class TestParameter:
     @patch("asyncio.Queue.put_nowait")
     @pytest.mark.parametrize(
         (
-            "event_side_effect",
+            "confirmations",
             "retries",
             "expected_result",
             "expected_call_count",
@@ -361,7 +356,7 @@ class TestParameter:
         mock_validate,
         parameter: Parameter,
         caplog,
-        event_side_effect: tuple[bool, ...],
+        confirmations: tuple[bool, ...],
         retries: int,
         expected_result: bool,
         expected_call_count: int,
@@ -372,14 +367,17 @@ class TestParameter:
         Checks setting a parameter with and without retries.
         """
         parameter.description = ParameterDescription(name="test_param")
-        mock_update_pending = AsyncMock(spec=asyncio.Event)
-        mock_update_done = AsyncMock(spec=asyncio.Event)
-        mock_update_done.is_set = Mock(side_effect=event_side_effect)
-
-        with (
-            patch.object(DummyParameter, "update_pending", mock_update_pending),
-            patch.object(DummyParameter, "update_done", mock_update_done),
-        ):
+        confirmed = iter(confirmations)
+
+        async def _wait_for(update: asyncio.Future[None], timeout: float) -> None:
+            """Confirm the update or time out."""
+            update.cancel()
+            if not next(confirmed):
+                raise TimeoutError
+
+            parameter.update(parameter.values)
+
+        with patch("asyncio.wait_for", side_effect=_wait_for):
             result = await parameter.set(5, retries=retries)
 
         assert result is expected_result
@@ -394,10 +392,8 @@ class TestParameter:
     @patch.object(DummyParameter, "validate")
     @patch.object(DummyParameter, "create_request", new_callable=AsyncMock)
     @patch("asyncio.Queue.put_nowait")
-    @patch("asyncio.Event.set")
     async def test_set_optimistic(
         self,
-        mock_set,
         mock_put_nowait,
         mock_create_request,
         mock_validate,
@@ -411,24 +407,48 @@ class TestParameter:
         result = await parameter.set(5, retries=3)
         assert result is True
         assert parameter == 5
-        assert parameter.update_pending.is_set() is False
+        assert parameter.pending is False
         mock_validate.assert_called_once_with(5)
         mock_put_nowait.assert_called_once_with(mock_create_request.return_value)
-        mock_set.assert_not_called()
 
-    @pytest.mark.usefixtures("skip_asyncio_events")
     @patch.object(DummyParameter, "create_request", new_callable=AsyncMock)
     async def test_update(self, mock_create_request, parameter: Parameter) -> None:
         """Test update.
 
         Checks updating a parameter.
         """
-        await parameter.set(5)
+        assert await parameter.set(5, timeout=0) is False
         parameter_values = ParameterValues(value=5, min_value=1, max_value=10)
         parameter.update(parameter_values)
         assert parameter.values == parameter_values
+        assert not parameter.pending
         mock_create_request.assert_awaited_once()
 
+    @patch.object(DummyParameter, "create_request", new_callable=AsyncMock)
+    async def test_update_events(
+        self, mock_create_request, parameter: Parameter
+    ) -> None:
+        """Test deprecated update events.
+
+        Checks that update events follow the pending update.
+        """
+        with pytest.warns(DeprecationWarning, match="update_done"):
+            assert parameter.update_done.is_set()
+
+        with pytest.warns(DeprecationWarning, match="update_pending"):
+            assert not parameter.update_pending.is_set()
+
+        assert await parameter.set(5, timeout=0) is False
+        with pytest.warns(DeprecationWarning):
+            update_done = parameter.update_done
+            update_pending = parameter.update_pending
+
+        assert not update_done.is_set()
+        assert update_pending.is_set()
+        parameter.update(ParameterValues(value=5, min_value=1, max_value=10))
+        await asyncio.wait_for(update_done.wait(), timeout=1)
+        assert not update_pending.is_set()
+
     async def test_create_or_update_parameter(self, ecomax: EcoMAX) -> None:
         """Test create_or_update.
 
@@ -476,6 +496,18 @@ class TestNumber:
         assert number.min_value == 0
         assert number.max_value == 5
 
+    def test_values_cached(self, number: Number) -> None:
+        """Test that unpacked values are cached until update."""
+        with patch.object(
+            Number, "_unpack_value", autospec=True, side_effect=lambda _, value: value
+        ) as mock_unpack_value:
+            assert (number.value, number.min_value, number.max_value) == (1, 0, 5)
+            assert number.value == 1
+            assert mock_unpack_value.call_count == 3
+            number.update(ParameterValues(value=2, min_value=0, max_value=5))
+            assert number.value == 2
+            assert mock_unpack_value.call_count == 6
+
     def test_validate(self, number: Number) -> None:
         """Test validate.
 
@@ -0,0 +1,94 @@
+"""Contains tests for the regulator data structure decoder."""
+
+import struct
+
+import pytest
+
+from pyplumio.data_types import (
+    BitArray,
+    DataType,
+    Float,
+    IPv4,
+    String,
+    Undefined,
+    UnsignedChar,
+    UnsignedShort,
+)
+from pyplumio.structures.regulator_data import RegulatorDataPlan, get_decode_plan
+
+
+def test_decode_plan() -> None:
+    """Test decoding the regulator data with the compiled plan."""
+    schema: list[tuple[int, DataType]] = [
+        (1, UnsignedChar()),
+        (2, BitArray()),
+        (3, BitArray()),
+        (4, UnsignedShort()),
+        (5, Undefined()),
+        (6, String()),
+        (7, Float()),
+        (8, IPv4()),
+        (9, BitArray()),
+    ]
+    plan = get_decode_plan(schema)
+
+    # Verify that fixed-size fields around the variable ones are
+    # coalesced into a single struct.
+    assert len(plan.steps) == 5
+    message = bytearray(
+        b"\xff\x01\x03\x02\x02test\x00\x00\x00\x80\x3f\xc0\xa8\x01\x01\x01"
+    )
+    regdata, offset = plan.decode(message, 1)
+    assert regdata == {
+        1: 1,
+        2: True,
+        3: True,
+        4: 514,
+        5: None,
+        6: "test",
+        7: 1.0,
+        8: "192.168.1.1",
+        9: True,
+    }
+    assert list(regdata) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    # Verify that the unfinished bit array byte is not included.
+    assert offset == len(message) - 1
+
+
+def test_decode_plan_bitarray_wraps() -> None:
+    """Test that bit arrays move to the next byte after eight bits."""
+    schema: list[tuple[int, DataType]] = [(index, BitArray()) for index in range(10)]
+    schema.append((10, UnsignedChar()))
+    plan = get_decode_plan(schema)
+    regdata, offset = plan.decode(bytearray([0b10000001, 0b00000010, 0x07]), 0)
+    assert [regdata[index] for index in range(10)] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert regdata[10] == 7
+    assert offset == 3
+
+
+def test_decode_plan_cache() -> None:
+    """Test that plans are only compiled when the schema changes."""
+    schema = [(1, UnsignedChar()), (2, BitArray())]
+    plan = get_decode_plan(schema)
+    assert get_decode_plan(schema) is plan
+    assert get_decode_plan([(1, UnsignedChar()), (2, BitArray())]) is plan
+    assert get_decode_plan([(1, UnsignedShort()), (2, BitArray())]) is not plan
+
+
+def test_decode_plan_truncated_message() -> None:
+    """Test decoding the truncated message."""
+    plan = RegulatorDataPlan(((1, UnsignedShort), (2, UnsignedShort)))
+    with pytest.raises(struct.error, match="unpack_from requires a buffer"):
+        plan.decode(bytearray([0x01, 0x02, 0x03]), 0)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 from typing import Literal, cast
 from unittest.mock import patch
@@ -19,6 +20,8 @@ from pyplumio.const import (
     State,
 )
 from pyplumio.devices.ecomax import EcoMAX
+from pyplumio.frames.requests import SetScheduleRequest
+from pyplumio.structures.frame_versions import ATTR_FRAME_VERSIONS
 from pyplumio.structures.schedules import (
     ATTR_SCHEDULE_PARAMETER,
     ATTR_SCHEDULE_SWITCH,
@@ -29,8 +32,12 @@ from pyplumio.structures.schedules import (
     TIME_FORMAT,
     Schedule,
     ScheduleDay,
+    ScheduleEditor,
+    ScheduleSwitch,
+    ScheduleSwitchDescription,
     Time,
     collect_schedule_data,
+    get_interval,
     get_time,
     get_time_range,
 )
@@ -96,6 +103,24 @@ def test_get_time_invalid() -> None:
         get_time_range(start=Time("01:00"), end=Time("00:30"))
 
 
+@pytest.mark.parametrize(
+    ("time", "expected_index"),
+    [(Time("00:00"), 0), (Time("12:30"), 25), (Time("23:30"), 47), (Time("9:00"), 18)],
+)
+def test_get_interval(time: Time, expected_index: int) -> None:
+    """Test getting the interval index for the time."""
+    assert get_interval(time) == expected_index
+
+
+def test_get_interval_invalid() -> None:
+    """Test getting the interval index for the invalid time."""
+    with pytest.raises(ValueError, match="multiple of 30 minutes"):
+        get_interval(Time("00:15"))
+
+    with pytest.raises(ValueError, match="%H:%M"):
+        get_interval(Time("foo"))
+
+
 @pytest.fixture(name="intervals")
 def fixture_intervals() -> list[Time]:
     """Return time intervals for a schedule day."""
@@ -181,6 +206,29 @@ class TestScheduleDay:
         del schedule_day[MIDNIGHT]
         assert len(schedule_day) == 47
         assert MIDNIGHT not in schedule_day
+        assert Time("00:30") in list(schedule_day)
+        with pytest.raises(KeyError):
+            del schedule_day[MIDNIGHT]
+
+        with pytest.raises(KeyError):
+            schedule_day[Time("00:15")]
+
+        schedule_day[MIDNIGHT] = STATE_OFF
+        assert len(schedule_day) == 48
+        assert ScheduleDay() == ScheduleDay({})
+        assert ScheduleDay({MIDNIGHT: True}).schedule == {MIDNIGHT: True}
+
+    def test_bits(self, schedule_day: ScheduleDay) -> None:
+        """Test converting schedule day to and from bits."""
+        schedule_day.set_on(Time("08:00"), Time("16:30"))
+        assert schedule_day.bits == 0x0000FFFFC000
+        assert schedule_day.to_bytes() == bytes.fromhex("0000FFFFC000")
+        assert ScheduleDay.from_bytes(schedule_day.to_bytes()) == schedule_day
+        assert ScheduleDay.from_int(schedule_day.bits) == schedule_day
+
+        # Verify that intervals that are not in the schedule are off.
+        del schedule_day[Time("08:00")]
+        assert schedule_day.bits == 0x00007FFFC000
 
 
 @pytest.fixture(name="schedule")
@@ -202,10 +250,9 @@ def fixture_schedule(schedule_day: ScheduleDay, ecomax: EcoMAX) -> Schedule:
 @pytest.fixture(name="ecomax_with_schedule")
 async def fixture_ecomax_with_schedule(ecomax: EcoMAX, schedule: Schedule) -> EcoMAX:
     """Return an ecoMAX object with a schedule."""
-    schedule_values = [schedule_day.schedule.values() for schedule_day in schedule]
     ecomax.dispatch_nowait(f"{schedule.name}_{ATTR_SCHEDULE_SWITCH}", 1)
     ecomax.dispatch_nowait(f"{schedule.name}_{ATTR_SCHEDULE_PARAMETER}", 2)
-    ecomax.dispatch_nowait(ATTR_SCHEDULES, ((0, schedule_values),))
+    ecomax.dispatch_nowait(ATTR_SCHEDULES, ((0, schedule.to_bytes()),))
     await ecomax.wait_until_done()
     return ecomax
 
@@ -243,6 +290,58 @@ class TestSchedule:
         schedule_day = cast(ScheduleDay, getattr(schedule, day))
         assert schedule_day[time] == state
 
+    def test_bytes(self, schedule: Schedule, ecomax: EcoMAX) -> None:
+        """Test converting a schedule to and from bytes."""
+        buffer = schedule.to_bytes()
+        assert buffer == bytes(6) + b"\xff" * 6 + bytes(30)
+        assert schedule.bits == int.from_bytes(buffer, "big")
+        assert Schedule.from_bytes("heating", ecomax, buffer) == schedule
+
+    @pytest.mark.parametrize(
+        ("at", "expected_active", "expected_transition"),
+        [
+            # Sunday is off and monday is on.
+            (dt.datetime(2026, 10, 11, 12, 15), False, dt.datetime(2026, 10, 12)),
+            (dt.datetime(2026, 10, 12, 23, 59), True, dt.datetime(2026, 10, 13)),
+            (dt.datetime(2026, 10, 13, 7, 45), False, dt.datetime(2026, 10, 13, 8)),
+            (dt.datetime(2026, 10, 13, 8, 0), True, dt.datetime(2026, 10, 13, 16, 30)),
+            (dt.datetime(2026, 10, 17, 9, 0), False, dt.datetime(2026, 10, 19)),
+        ],
+    )
+    def test_queries(
+        self,
+        at: dt.datetime,
+        expected_active: bool,
+        expected_transition: dt.datetime,
+        schedule: Schedule,
+    ) -> None:
+        """Test querying the schedule state."""
+        schedule.tuesday = ScheduleDay.from_iterable([False] * 48)
+        schedule.tuesday.set_on(Time("08:00"), Time("16:00"))
+        assert schedule.is_active(at) is expected_active
+        assert schedule.next_transition(at) == expected_transition
+
+    def test_next_transition_without_changes(self, schedule: Schedule) -> None:
+        """Test getting the next transition for the constant schedule."""
+        schedule.monday.set_off()
+        assert schedule.next_transition(dt.datetime(2026, 10, 12)) is None
+
+    def test_active_ranges(self, schedule: Schedule) -> None:
+        """Test getting the active time ranges."""
+        schedule.tuesday = ScheduleDay.from_iterable([False] * 48)
+        schedule.tuesday.set_on(Time("00:00"), Time("01:00"))
+        schedule.tuesday.set_on(Time("08:00"), Time("16:00"))
+        schedule.tuesday[Time("23:30")] = STATE_ON
+        assert schedule.active_ranges("tuesday") == [
+            ("00:00", "01:30"),
+            ("08:00", "16:30"),
+            ("23:30", "00:00"),
+        ]
+        assert schedule.active_ranges(dt.date(2026, 10, 12)) == [("00:00", "00:00")]
+        assert schedule.active_ranges("sunday") == []
+        with pytest.raises(ValueError, match="Invalid weekday"):
+            schedule.active_ranges("someday")
+
     def test_iter(self, schedule: Schedule) -> None:
         """Test a schedule."""
         expected_days = [
@@ -257,13 +356,22 @@ class TestSchedule:
         iterated_days = list(iter(schedule))
         assert iterated_days == expected_days
 
-    @patch("pyplumio.structures.schedules.Request.create")
+    async def test_request(
+        self, ecomax_with_schedule: EcoMAX, schedule: Schedule
+    ) -> None:
+        """Test creating a set schedule request from the schedule."""
+        request = SetScheduleRequest(
+            data=collect_schedule_data("heating", ecomax_with_schedule)
+        )
+        assert request.message == bytearray(b"\x01\x00\x01\x02" + schedule.to_bytes())
+
+    @patch("pyplumio.structures.schedules.Request.create_nowait")
     async def test_commit(
         self, mock_request_create, ecomax_with_schedule: EcoMAX, schedule: Schedule
     ) -> None:
         """Test committing a schedule."""
         await schedule.commit()
-        mock_request_create.assert_awaited_once_with(
+        mock_request_create.assert_called_once_with(
             FrameType.REQUEST_SET_SCHEDULE,
             recipient=ecomax_with_schedule.address,
             data={
@@ -273,3 +381,225 @@ class TestSchedule:
                 ATTR_SCHEDULE: schedule,
             },
         )
+
+
+@pytest.fixture(name="editor")
+def fixture_editor(ecomax_with_schedule: EcoMAX) -> ScheduleEditor:
+    """Return the schedule editor."""
+    return ecomax_with_schedule.schedule_editor
+
+
+@pytest.fixture(name="device_schedule")
+def fixture_device_schedule(ecomax_with_schedule: EcoMAX) -> Schedule:
+    """Return the schedule received from the device."""
+    schedules: dict[str, Schedule] = ecomax_with_schedule.get_nowait(ATTR_SCHEDULES)
+    return schedules["heating"]
+
+
+@patch.object(EcoMAX, "queue_send")
+class TestScheduleEditor:
+    """Contains tests for the schedule editor."""
+
+    async def test_commit_changed(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test that only changed schedules are committed."""
+        assert device_schedule.editor is editor
+        await device_schedule.commit()
+        assert editor.commit() == []
+        mock_queue_send.assert_not_called()
+
+        device_schedule.monday.set_off("00:00", "01:00")
+        await device_schedule.commit()
+        mock_queue_send.assert_not_called()
+        assert editor.commit() == ["heating"]
+        mock_queue_send.assert_called_once()
+        request = mock_queue_send.call_args.args[0]
+        assert isinstance(request, SetScheduleRequest)
+        assert request.message[4:] == device_schedule.to_bytes()
+
+        # Verify that the schedule awaiting confirmation is not resent.
+        await device_schedule.commit()
+        assert editor.commit() == []
+        mock_queue_send.assert_called_once()
+
+    async def test_commit_debounced(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test that commits are sent in a batch after the delay."""
+        editor.delay = 0.01
+        device_schedule.monday.set_off("00:00", "01:00")
+        await device_schedule.commit()
+        device_schedule.tuesday.set_on("00:00", "01:00")
+        await device_schedule.commit()
+        mock_queue_send.assert_not_called()
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        loop.call_later(0.05, done.set_result, None)
+        await done
+        mock_queue_send.assert_called_once()
+
+    async def test_transaction(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test committing the schedules in the transaction."""
+        with editor:
+            with editor:
+                device_schedule.monday.set_off("00:00", "01:00")
+
+            mock_queue_send.assert_not_called()
+            device_schedule.sunday.set_off("00:00", "01:00")
+            await device_schedule.commit()
+            mock_queue_send.assert_not_called()
+
+        mock_queue_send.assert_called_once()
+
+    @pytest.mark.parametrize("commit", [False, True])
+    async def test_transaction_failed(
+        self,
+        mock_queue_send,
+        editor: ScheduleEditor,
+        device_schedule: Schedule,
+        commit: bool,
+    ) -> None:
+        """Test that the failed transaction restores the schedules."""
+        device_bytes = device_schedule.to_bytes()
+        with pytest.raises(ValueError), editor:
+            device_schedule.monday.set_off("00:00", "01:00")
+            if commit:
+                await device_schedule.commit()
+
+            raise ValueError
+
+        assert device_schedule.to_bytes() == device_bytes
+        with editor:
+            pass
+
+        assert editor.commit() == []
+        mock_queue_send.assert_not_called()
+
+    async def test_transaction_nested_failed(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test that the failed nested transaction isn't committed."""
+        device_schedule.tuesday.set_on("00:00", "01:00")
+        expected_bytes = device_schedule.to_bytes()
+        device_schedule.tuesday.set_off("00:00", "01:00")
+        with editor:
+            device_schedule.tuesday.set_on("00:00", "01:00")
+            with pytest.raises(ValueError), editor:
+                device_schedule.monday.set_off("00:00", "01:00")
+                raise ValueError
+
+        assert device_schedule.to_bytes() == expected_bytes
+        mock_queue_send.assert_called_once()
+        request = mock_queue_send.call_args.args[0]
+        assert request.message[4:] == expected_bytes
+
+    async def test_transaction_untouched(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test that schedules changed outside the transaction aren't sent."""
+        device_schedule.monday.set_off("00:00", "01:00")
+        with editor:
+            pass
+
+        mock_queue_send.assert_not_called()
+
+    async def test_create_request(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test creating the schedule parameter request with the editor."""
+        device_bytes = device_schedule.to_bytes()
+        device_schedule.monday.set_off("00:00", "01:00")
+        parameter = ScheduleSwitch(
+            device=device_schedule.device,
+            description=ScheduleSwitchDescription(name="heating_schedule_switch"),
+        )
+
+        # Verify that the uncommitted changes aren't sent.
+        request = await parameter.create_request()
+        assert request.message[4:] == device_bytes
+
+        # Verify that the pending commit is sent with the request.
+        await device_schedule.commit()
+        request = await parameter.create_request()
+        assert request.message[4:] == device_schedule.to_bytes()
+        assert editor.commit() == []
+        assert not await editor.wait_confirmed("heating", timeout=0)
+        mock_queue_send.assert_not_called()
+
+    async def test_wait_confirmed_cancelled(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test cancelling the wait for the confirmation."""
+        device_schedule.monday.set_off("00:00", "01:00")
+        editor.add(device_schedule)
+        editor.commit()
+        task = asyncio.create_task(editor.wait_confirmed("heating"))
+        await asyncio.wait({task}, timeout=0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Verify that the closed editor rejects the confirmation.
+        task = asyncio.create_task(editor.wait_confirmed("heating"))
+        await asyncio.wait({task}, timeout=0.01)
+        editor.close()
+        assert await task is False
+
+    async def test_confirmed(
+        self,
+        mock_queue_send,
+        ecomax_with_schedule: EcoMAX,
+        editor: ScheduleEditor,
+        device_schedule: Schedule,
+    ) -> None:
+        """Test confirming the committed schedule."""
+        assert await editor.wait_confirmed("heating")
+        device_schedule.monday.set_off("00:00", "01:00")
+        editor.add(device_schedule)
+        editor.commit()
+        assert not await editor.wait_confirmed("heating", timeout=0)
+
+        ecomax_with_schedule.dispatch_nowait(
+            ATTR_SCHEDULES, ((0, device_schedule.to_bytes()),)
+        )
+        await ecomax_with_schedule.wait_until_done()
+        assert await editor.wait_confirmed("heating")
+        assert not editor.is_changed(device_schedule)
+
+    async def test_not_confirmed(
+        self,
+        mock_queue_send,
+        ecomax_with_schedule: EcoMAX,
+        editor: ScheduleEditor,
+        device_schedule: Schedule,
+    ) -> None:
+        """Test rejecting the committed schedule on a new frame version."""
+        old_schedule = device_schedule.to_bytes()
+        device_schedule.monday.set_off("00:00", "01:00")
+        editor.add(device_schedule)
+        editor.commit()
+
+        # Same frame version means that device has not applied it yet.
+        editor.update("heating", old_schedule)
+        assert not await editor.wait_confirmed("heating", timeout=0)
+
+        ecomax_with_schedule.dispatch_nowait(
+            ATTR_FRAME_VERSIONS, {FrameType.REQUEST_SCHEDULES: 2}
+        )
+        await ecomax_with_schedule.wait_until_done()
+        editor.update("heating", old_schedule)
+        assert not await editor.wait_confirmed("heating")
+
+    async def test_close(
+        self, mock_queue_send, editor: ScheduleEditor, device_schedule: Schedule
+    ) -> None:
+        """Test closing the schedule editor."""
+        device_schedule.monday.set_off("00:00", "01:00")
+        await device_schedule.commit()
+        editor.close()
+        assert editor.commit() == []
+        mock_queue_send.assert_not_called()
@@ -0,0 +1,131 @@
+"""Contains tests for the micro-benchmark suite."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pathlib
+from unittest.mock import patch
+
+from pyplumio.bench import (
+    FILTERS,
+    STRUCTURES,
+    BenchmarkResult,
+    Comparison,
+    MeasurementResult,
+    compare,
+    create_benchmarks,
+    create_measurements,
+    load_messages,
+    main,
+    run_benchmark,
+)
+
+TESTDATA_DIR = pathlib.Path(__file__).parent / "testdata"
+
+# Write latency measurement waits between the frames.
+_sleep = asyncio.sleep
+
+
+def test_load_messages() -> None:
+    """Test that the sample frames match the recorded test data."""
+    assert list(load_messages()) == list(load_messages(TESTDATA_DIR))
+
+
+def test_create_benchmarks() -> None:
+    """Test that benchmarks run for every hot path."""
+    benchmarks = create_benchmarks()
+    assert {
+        "bcc",
+        "FrameDecoder.feed",
+        "FrameReader.read",
+        "Frame.bytes",
+        "EventManager.dispatch",
+        "EcoMAX.handle_frame",
+    } <= set(benchmarks)
+    for structure in STRUCTURES:
+        assert f"{structure.__name__}.decode" in benchmarks
+
+    for name in FILTERS:
+        assert f"filters.{name}" in benchmarks
+
+    for benchmark in benchmarks.values():
+        assert benchmark(2) >= 0
+
+
+@patch("pyplumio.bench.MEMORY_DEVICES", 2)
+@patch("pyplumio.bench.BURST_SIZE", 2)
+@patch("pyplumio.bench.FRAME_INTERVAL", 0.001)
+def test_create_measurements() -> None:
+    """Test that measurements run for the decoder, protocol and devices."""
+    measurements = create_measurements()
+    assert set(measurements) == {
+        "FrameDecoder.copied_bytes",
+        "AsyncProtocol.write_latency",
+        "AsyncProtocol.write_latency_full_duplex",
+        "EcoMAX.retained_bytes",
+        "Parameter.retained_bytes",
+    }
+    with patch("asyncio.sleep", new=_sleep):
+        for measurement in measurements.values():
+            assert measurement() > 0
+
+
+def test_run_benchmark() -> None:
+    """Test that the number of operations is doubled up to the minimum time."""
+    calls = []
+
+    def _benchmark(number: int) -> float:
+        calls.append(number)
+        return number * 0.1
+
+    result = run_benchmark("test", _benchmark, repeat=3, min_time=0.4)
+    assert calls == [1, 2, 4, 4, 4]
+    assert result == BenchmarkResult("test", 4, 0.1)
+    assert result.ops_per_second == 10
+
+
+def test_compare() -> None:
+    """Test comparing the results against the baseline."""
+    results: list[BenchmarkResult | MeasurementResult] = [
+        BenchmarkResult("bcc", 10, 1.2),
+        BenchmarkResult("new", 10, 1.0),
+        MeasurementResult("EcoMAX.retained_bytes", 90),
+        MeasurementResult("new", 1.0),
+    ]
+    comparisons = compare(
+        results,
+        {
+            "results": {"bcc": {"time_per_op": 1.0}},
+            "measurements": {"EcoMAX.retained_bytes": {"value": 100}},
+        },
+    )
+    assert comparisons == [
+        Comparison("bcc", 1.0, 1.2),
+        Comparison("EcoMAX.retained_bytes", 100, 90),
+    ]
+    assert round(comparisons[0].change) == 20
+    assert round(comparisons[1].change) == -10
+
+
+def test_main(tmp_path, capsys) -> None:
+    """Test running the benchmarks from the command line."""
+    output = tmp_path / "results.json"
+    args = ["-k", "filters.clamp", "--min-time", "0", "--repeat", "1"]
+    assert main([*args, "--output", str(output)]) == 0
+    results = json.loads(output.read_text())["results"]
+    assert list(results) == ["filters.clamp"]
+    assert results["filters.clamp"]["time_per_op"] > 0
+
+    # Verify that the slowdown past the threshold is reported.
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps({"results": {"filters.clamp": {"time_per_op": 1e-12}}})
+    )
+    assert main([*args, "--baseline", str(baseline)]) == 1
+    captured = capsys.readouterr()
+    report = json.loads(captured.out)
+    assert report["comparison"]["filters.clamp"]["regression"]
+    assert "Regression: filters.clamp" in captured.err
+
+    assert main([*args, "--testdata", str(tmp_path / "missing")]) == 2
@@ -0,0 +1,129 @@
+"""Contains tests for the capture recorder."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from pyplumio.capture import (
+    CAPTURE_MAGIC,
+    CaptureError,
+    CaptureRecorder,
+    Direction,
+    RecordingStreamReader,
+    RecordingStreamWriter,
+    read_capture,
+)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+async def test_recorder(tmp_path, compress: bool) -> None:
+    """Test recording and reading the capture."""
+    path = tmp_path / "capture.bin"
+    recorder = CaptureRecorder(path, compress=compress)
+
+    # Verify that nothing is recorded before start.
+    recorder.record(Direction.RECEIVED, b"\x00")
+    await recorder.start()
+    recorder.record(Direction.RECEIVED, b"\x68\x01")
+    recorder.record(Direction.SENT, b"\x68\x02")
+    recorder.record(Direction.RECEIVED, b"")
+    await recorder.close()
+
+    assert path.read_bytes().startswith(b"\x1f\x8b" if compress else CAPTURE_MAGIC)
+    records = list(read_capture(path))
+    assert [(record.direction, record.data) for record in records] == [
+        (Direction.RECEIVED, b"\x68\x01"),
+        (Direction.SENT, b"\x68\x02"),
+    ]
+    assert 0 <= records[0].timestamp <= records[1].timestamp
+
+
+async def test_recorder_batches(tmp_path) -> None:
+    """Test that batches are written off the event loop."""
+    recorder = CaptureRecorder(tmp_path / "capture.bin", batch_size=4)
+    await recorder.start()
+    loop = asyncio.get_running_loop()
+    with patch.object(
+        loop, "run_in_executor", wraps=loop.run_in_executor
+    ) as mock_run_in_executor:
+        recorder.record(Direction.RECEIVED, b"\x01\x02")
+        assert not recorder.tasks
+
+        # Verify that exceeding the batch size starts the writer.
+        recorder.record(Direction.RECEIVED, b"\x03\x04")
+        recorder.record(Direction.RECEIVED, b"\x05\x06")
+        assert len(recorder.tasks) == 1
+        mock_run_in_executor.assert_not_called()
+        await recorder.wait_until_done()
+        mock_run_in_executor.assert_called_once()
+
+    await recorder.close()
+    assert [record.data for record in read_capture(recorder.path)] == [
+        b"\x01\x02",
+        b"\x03\x04",
+        b"\x05\x06",
+    ]
+
+
+async def test_recorder_flush_interval(tmp_path) -> None:
+    """Test that batches are written every flush interval."""
+    recorder = CaptureRecorder(tmp_path / "capture.bin")
+    await recorder.start()
+    timer = recorder._flush_timer
+    assert timer is not None
+
+    # Verify that the flush is skipped when there's nothing to write.
+    recorder._on_flush_timer()
+    assert not recorder.tasks
+    assert recorder._flush_timer is not timer
+
+    recorder.record(Direction.SENT, b"\x01")
+    recorder._on_flush_timer()
+    await recorder.wait_until_done()
+    await recorder.close()
+    assert recorder._flush_timer is None
+    assert [record.data for record in read_capture(recorder.path)] == [b"\x01"]
+
+
+async def test_invalid_capture(tmp_path) -> None:
+    """Test reading invalid capture files."""
+    path = tmp_path / "capture.bin"
+    path.write_bytes(b"not a capture")
+    with pytest.raises(CaptureError, match="Not a capture file"):
+        list(read_capture(path))
+
+    recorder = CaptureRecorder(path)
+    await recorder.start()
+    recorder.record(Direction.RECEIVED, b"\x68\x01\x02")
+    await recorder.close()
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(CaptureError, match="Truncated capture file"):
+        list(read_capture(path))
+
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(CaptureError, match="Truncated capture file"):
+        list(read_capture(path))
+
+
+async def test_recording_streams() -> None:
+    """Test that the recording streams record data."""
+    recorder = Mock(spec=CaptureRecorder)
+    reader = AsyncMock(spec=asyncio.StreamReader)
+    reader.read.return_value = b"\x68"
+    recording_reader = RecordingStreamReader(reader, recorder)
+    assert await recording_reader.read(10) == b"\x68"
+    reader.read.assert_awaited_once_with(10)
+    recorder.record.assert_called_once_with(Direction.RECEIVED, b"\x68")
+    assert recording_reader.at_eof is reader.at_eof
+
+    recorder.reset_mock()
+    writer = Mock(spec=asyncio.StreamWriter)
+    recording_writer = RecordingStreamWriter(writer, recorder)
+    recording_writer.write(b"\x16")
+    writer.write.assert_called_once_with(b"\x16")
+    recorder.record.assert_called_once_with(Direction.SENT, b"\x16")
+    recording_writer.close()
+    writer.close.assert_called_once()
@@ -0,0 +1,202 @@
+"""Contains tests for the frame decoder and encoder classes."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from pyplumio.codec import DEFAULT_BUFFER_SIZE, FrameDecoder, FrameEncoder
+from pyplumio.const import DeviceType, FrameType
+from pyplumio.exceptions import (
+    ChecksumError,
+    ReadError,
+    UnknownDeviceError,
+    UnknownFrameError,
+)
+from pyplumio.frames import ECONET_TYPE, ECONET_VERSION
+from pyplumio.frames.requests import EcomaxParametersRequest, ProgramVersionRequest
+
+ECOMAX_PARAMETERS_REQUEST = b"\x68\x0c\x00\x00\x56\x30\x05\x31\xff\x00\xc9\x16"
+PROGRAM_VERSION_REQUEST = b"\x68\x0a\x00\x00\x56\x30\x05\x40\x41\x16"
+
+
+@pytest.fixture(name="frame_decoder")
+def fixture_frame_decoder() -> FrameDecoder:
+    """Return a FrameDecoder instance."""
+    return FrameDecoder()
+
+
+class TestFrameDecoder:
+    """Tests for FrameDecoder class.
+
+    Verifies decoding frames from the fed bytes and handling of the
+    internal buffer.
+    """
+
+    def test_feed(self, frame_decoder: FrameDecoder) -> None:
+        """Test decoding a frame.
+
+        Checks correct parsing and field extraction from a frame.
+        """
+        frames = frame_decoder.feed(b"\x00" + ECOMAX_PARAMETERS_REQUEST)
+        assert len(frames) == 1
+        frame = frames[0]
+        assert isinstance(frame, EcomaxParametersRequest)
+        assert frame.frame_type == FrameType.REQUEST_ECOMAX_PARAMETERS
+        assert frame.sender == DeviceType.ECONET
+        assert frame.econet_type == ECONET_TYPE
+        assert frame.recipient == DeviceType.ALL
+        assert frame.message == b"\xff\x00"
+        assert frame.econet_version == ECONET_VERSION
+        assert len(frame_decoder) == 0
+
+    def test_feed_with_multiple_frames(self, frame_decoder: FrameDecoder) -> None:
+        """Test decoding multiple frames.
+
+        Verifies that all complete frames are returned at once, frames
+        intended for other recipients are skipped and that incomplete
+        frame is left in the buffer.
+        """
+        frames = frame_decoder.feed(
+            ECOMAX_PARAMETERS_REQUEST
+            + b"\x68\x0a\x00\x10\x56\x30\x05\x01\x10\x16"
+            + PROGRAM_VERSION_REQUEST
+            + ECOMAX_PARAMETERS_REQUEST[:5]
+        )
+        assert len(frames) == 2
+        assert isinstance(frames[0], EcomaxParametersRequest)
+        assert isinstance(frames[1], ProgramVersionRequest)
+        assert len(frame_decoder) == 5
+
+        assert frame_decoder.feed(ECOMAX_PARAMETERS_REQUEST[5:-1]) == []
+        frames = frame_decoder.feed(ECOMAX_PARAMETERS_REQUEST[-1:])
+        assert len(frames) == 1
+        assert isinstance(frames[0], EcomaxParametersRequest)
+
+    def test_feed_with_error(self, frame_decoder: FrameDecoder) -> None:
+        """Test decoding multiple frames with an invalid frame.
+
+        Verifies that frames decoded before the invalid frame are
+        returned and the error is raised on the next call.
+        """
+        frames = frame_decoder.feed(
+            ECOMAX_PARAMETERS_REQUEST
+            + b"\x68\x0c\x00\x00\x56\x30\x05\x31\xfe\x00\xc9\x16"
+            + PROGRAM_VERSION_REQUEST
+        )
+        assert len(frames) == 1
+        assert isinstance(frames[0], EcomaxParametersRequest)
+
+        with pytest.raises(ChecksumError, match="Incorrect frame checksum"):
+            frame_decoder.decode()
+
+        frames = frame_decoder.decode()
+        assert len(frames) == 1
+        assert isinstance(frames[0], ProgramVersionRequest)
+
+    @pytest.mark.parametrize(
+        ("data", "expected_exception", "error_pattern"),
+        [
+            (b"\x68\x03\x00\x00\x56\x30\x05", ReadError, "Unexpected frame length"),
+            (
+                b"\x68\x0c\x00\x00\x56\x30\x05\x31\xfe\x00\xc9\x16",
+                ChecksumError,
+                "Incorrect frame checksum",
+            ),
+            (
+                b"\x68\x0a\x00\x00\x10\x30\x05\x01\x46\x16",
+                UnknownDeviceError,
+                "Unknown sender",
+            ),
+            (
+                b"\x68\x0a\x00\x00\x56\x30\x05\x02\x03\x16",
+                UnknownFrameError,
+                "Unknown frame type",
+            ),
+        ],
+    )
+    def test_feed_with_invalid_frame(
+        self,
+        frame_decoder: FrameDecoder,
+        data: bytes,
+        expected_exception: type[Exception],
+        error_pattern: str,
+    ) -> None:
+        """Test decoding an invalid frame.
+
+        Ensures that the error is raised and the decoder recovers.
+        """
+        with pytest.raises(expected_exception, match=error_pattern):
+            frame_decoder.feed(data)
+
+        frames = frame_decoder.feed(PROGRAM_VERSION_REQUEST)
+        assert len(frames) == 1
+        assert isinstance(frames[0], ProgramVersionRequest)
+
+    def test_feed_with_logging(self, frame_decoder: FrameDecoder, caplog) -> None:
+        """Test decoding a frame with debug logging enabled."""
+        with caplog.at_level(logging.DEBUG):
+            frame_decoder.feed(PROGRAM_VERSION_REQUEST)
+
+        assert PROGRAM_VERSION_REQUEST.hex() in caplog.text
+
+    def test_consume(self, frame_decoder: FrameDecoder) -> None:
+        """Test consuming bytes from the buffer.
+
+        Ensures that bytes are removed from the buffer as expected.
+        """
+        frame_decoder.extend(bytearray(b"\x00\x01\x02"))
+        frame_decoder.consume(2)
+        assert bytes(frame_decoder.buffer) == b"\x02"
+        frame_decoder.consume(2)
+        assert len(frame_decoder.buffer) == 0
+
+    def test_seek_to(self, frame_decoder: FrameDecoder) -> None:
+        """Test seeking to a delimiter in the buffer.
+
+        Ensures that the buffer is trimmed up to the delimiter.
+        """
+        frame_decoder.extend(bytearray(b"\x00\x01\x02\x03\x04"))
+        assert frame_decoder.seek_to(2) is True
+        assert len(frame_decoder.buffer) == 3
+
+    def test_seek_to_without_delimiter(self, frame_decoder: FrameDecoder) -> None:
+        """Test seeking to a delimiter that is not in the buffer.
+
+        Ensures that the unread bytes are discarded.
+        """
+        frame_decoder.extend(bytearray(b"\x00\x01\x02"))
+        assert frame_decoder.seek_to(3) is False
+        assert len(frame_decoder.buffer) == 0
+        assert frame_decoder.seek_to(3) is False
+
+    def test_extend_with_compaction(self, frame_decoder: FrameDecoder) -> None:
+        """Test appending data to a buffer without free space at the end.
+
+        Ensures that unread bytes are moved to the start of the buffer
+        and the oldest bytes are discarded on overflow.
+        """
+        frame_decoder.extend(b"\x01" * (DEFAULT_BUFFER_SIZE - 2))
+        frame_decoder.consume(DEFAULT_BUFFER_SIZE - 4)
+        frame_decoder.extend(b"\x02\x03\x04")
+        assert bytes(frame_decoder.buffer) == b"\x01\x01\x02\x03\x04"
+
+        frame_decoder.extend(b"\x05" * (DEFAULT_BUFFER_SIZE - 1))
+        assert len(frame_decoder.buffer) == DEFAULT_BUFFER_SIZE
+        assert bytes(frame_decoder.buffer[:2]) == b"\x04\x05"
+
+        frame_decoder.extend(b"\x06" * (DEFAULT_BUFFER_SIZE + 1))
+        assert bytes(frame_decoder.buffer) == b"\x06" * DEFAULT_BUFFER_SIZE
+
+
+class TestFrameEncoder:
+    """Tests for FrameEncoder class."""
+
+    def test_encode(self) -> None:
+        """Test encoding frames."""
+        encoder = FrameEncoder()
+        assert encoder.encode(ProgramVersionRequest()) == PROGRAM_VERSION_REQUEST
+        assert encoder.encode_many(
+            (EcomaxParametersRequest(), ProgramVersionRequest())
+        ) == (ECOMAX_PARAMETERS_REQUEST + PROGRAM_VERSION_REQUEST)
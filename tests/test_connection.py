@@ -5,14 +5,25 @@ from __future__ import annotations
 from asyncio import StreamReader, StreamWriter
 import logging
 from typing import Final
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE
 
+from pyplumio.capture import (
+    CAPTURE_MAGIC,
+    CaptureRecorder,
+    Direction,
+    RecordingStreamReader,
+    RecordingStreamWriter,
+    struct_capture_header,
+    struct_record_header,
+)
 from pyplumio.connection import (
+    MAX_REPLAY_DELAY,
     RECONNECT_AFTER_SECONDS,
     Connection,
+    ReplayConnection,
     SerialConnection,
     TcpConnection,
 )
@@ -98,6 +109,39 @@ class TestConnection:
         await connection.close()
         mock_protocol.shutdown.assert_called_once()
 
+    @patch("pyplumio.connection.load_classes", new_callable=AsyncMock)
+    @patch.object(
+        DummyConnection, "_open_connection", return_value=("reader", "writer")
+    )
+    async def test_connect_loads_classes(
+        self, mock_open_connection, mock_load_classes, mock_protocol
+    ) -> None:
+        """Test that classes are loaded before connecting."""
+        connection = DummyConnection(protocol=mock_protocol)
+        await connection.connect()
+        mock_load_classes.assert_awaited_once_with()
+        mock_open_connection.assert_awaited_once()
+
+    @patch.object(
+        DummyConnection, "_open_connection", return_value=("reader", "writer")
+    )
+    async def test_connect_with_recorder(
+        self, mock_open_connection, mock_protocol, tmp_path
+    ) -> None:
+        """Test a connection with the capture recorder."""
+        recorder = CaptureRecorder(tmp_path / "capture.bin")
+        connection = DummyConnection(protocol=mock_protocol, recorder=recorder)
+        assert connection.recorder is recorder
+        await connection.connect()
+        reader, writer = mock_protocol.connection_established.call_args.args
+        assert isinstance(reader, RecordingStreamReader)
+        assert isinstance(writer, RecordingStreamWriter)
+        with patch.object(CaptureRecorder, "close") as mock_close:
+            await connection.close()
+
+        mock_close.assert_awaited_once()
+        await recorder.close()
+
     @pytest.mark.parametrize("reconnect_on_failure", [True, False])
     @patch.object(
         DummyConnection,
@@ -232,3 +276,78 @@ class TestSerialConnection:
         assert repr(serial_connection) == (
             f"SerialConnection(url={URL}, baudrate=115200, options={{'timeout': 10}})"
         )
+
+
+class TestReplayConnection:
+    """Contains tests for ReplayConnection class."""
+
+    @pytest.mark.parametrize("realtime", [False, True])
+    async def test_replay(self, mock_protocol, tmp_path, realtime: bool) -> None:
+        """Test replaying the capture."""
+        path = tmp_path / "capture.bin"
+        path.write_bytes(
+            CAPTURE_MAGIC
+            + struct_capture_header.pack(0)
+            + struct_record_header.pack(1, Direction.RECEIVED, 2)
+            + b"\x68\x01"
+            + struct_record_header.pack(2, Direction.SENT, 2)
+            + b"\x68\x02"
+            + struct_record_header.pack(3, Direction.RECEIVED, 2)
+            + b"\x68\x03"
+        )
+        connection = ReplayConnection(path, realtime=realtime, protocol=mock_protocol)
+        with (
+            patch("pyplumio.connection.time.monotonic", return_value=0),
+            patch("asyncio.sleep") as mock_sleep,
+        ):
+            await connection.connect()
+            await connection.wait_until_done()
+
+        reader, writer = mock_protocol.connection_established.call_args.args
+        assert await reader.read() == b"\x68\x01\x68\x03"
+        assert reader.at_eof()
+
+        # Verify that written data is discarded.
+        writer.write(b"\x68\x04")
+        await writer.drain()
+        assert not writer.is_closing()
+        writer.close()
+        await writer.wait_closed()
+        assert writer.is_closing()
+        assert mock_protocol.on_connection_lost.add.call_count == 0
+        if realtime:
+            mock_sleep.assert_has_awaits([call(1), call(3), call(0)])
+        else:
+            mock_sleep.assert_awaited_once_with(0)
+
+    async def test_replay_gap(self, mock_protocol, tmp_path) -> None:
+        """Test shortening the long gaps in real time."""
+        path = tmp_path / "capture.bin"
+        path.write_bytes(
+            CAPTURE_MAGIC
+            + struct_capture_header.pack(0)
+            + struct_record_header.pack(1, Direction.RECEIVED, 2)
+            + b"\x68\x01"
+            + struct_record_header.pack(60, Direction.RECEIVED, 2)
+            + b"\x68\x02"
+            + struct_record_header.pack(61, Direction.RECEIVED, 2)
+            + b"\x68\x03"
+        )
+        connection = ReplayConnection(path, realtime=True, protocol=mock_protocol)
+        with (
+            patch("pyplumio.connection.time") as mock_time,
+            patch("asyncio.sleep") as mock_sleep,
+        ):
+            mock_time.monotonic.side_effect = (0, 0, 1, 1 + MAX_REPLAY_DELAY)
+            await connection.connect()
+            await connection.wait_until_done()
+
+        # Verify that the following record keeps its original timing.
+        mock_sleep.assert_has_awaits([call(1), call(MAX_REPLAY_DELAY), call(1)])
+
+    async def test_repr(self, tmp_path) -> None:
+        """Test serializable representation."""
+        connection = ReplayConnection(tmp_path / "capture.bin")
+        assert repr(connection) == (
+            f"ReplayConnection(path={tmp_path / 'capture.bin'}, realtime=False)"
+        )
@@ -56,6 +56,16 @@ def test_data_type(
         assert repr(cls()) == f"{cls.__qualname__}()"
         assert cls().__eq__(UNDEFINED) is NotImplemented
 
+    # Verify the stateless codec at the offset.
+    message = b"\xff" + bytes(buffer)
+    value, size = cls.unpack_from(memoryview(message), 1)
+    assert size == len(buffer)
+    assert cls.unpack_from(message, 1) == (value, size)
+    assert cls.calcsize(value) == size
+    packed = bytearray(len(message))
+    assert cls.pack_into(memoryview(packed), 1, value) == size
+    assert packed[1:] == buffer
+
 
 def test_hash_no_value() -> None:
     """Test data type hash with no value."""
@@ -83,6 +93,24 @@ def test_bitarray() -> None:
     assert data_types.BitArray().pack() == b""
 
 
+def test_bitarray_codec() -> None:
+    """Test a bit array stateless codec."""
+    buffer = bytearray([0xFF, 0x55])
+    last_index = data_types.BITARRAY_LAST_INDEX
+    for index in range(8):
+        assert data_types.BitArray.unpack_from(buffer, 1, index=index) == (
+            not index % 2,
+            1 if index == last_index else 0,
+        )
+
+    packed = bytearray([0xFF, 0xAA])
+    for index in range(8):
+        data_types.BitArray.pack_into(packed, 1, not index % 2, index=index)
+
+    assert packed == buffer
+    assert data_types.BitArray.calcsize(True) == 1
+
+
 def test_bitarray_no_value() -> None:
     """Test a bit array data type with no value."""
     with pytest.raises(ValueError):
@@ -92,3 +120,9 @@ def test_bitarray_no_value() -> None:
 def test_string_unknown_char() -> None:
     """Test string with unknown unicode char."""
     assert data_types.String.from_bytes(b"test\xd8\x00").value == "test�"
+
+
+def test_string_no_terminator() -> None:
+    """Test string without the null terminator."""
+    for buffer in (b"test", memoryview(b"test")):
+        assert data_types.String.unpack_from(buffer) == ("test", 5)
@@ -5,7 +5,7 @@ from importlib import reload
 import logging
 import sys
 from typing import Any, Literal
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -145,7 +145,7 @@ async def test_on_change_parameter() -> None:
     test_callback = AsyncMock()
     test_parameter = AsyncMock(spec=Parameter)
     test_parameter.values = ParameterValues(0, 0, 1)
-    test_parameter.update_pending.is_set = Mock(return_value=False)
+    test_parameter.pending = False
     wrapped_callback = filters.on_change(test_callback)
     assert hash(wrapped_callback) == hash(test_callback)
     await wrapped_callback(test_parameter)
@@ -161,11 +161,11 @@ async def test_on_change_parameter() -> None:
     test_callback.assert_not_awaited()
 
     # Check that callback is awaited on local value change.
-    test_parameter.update_pending.is_set.return_value = True
+    test_parameter.pending = True
     await wrapped_callback(test_parameter)
     test_callback.assert_awaited_once_with(test_parameter)
     test_callback.reset_mock()
-    test_parameter.update_pending.is_set.return_value = False
+    test_parameter.pending = False
 
     # Check that callback is awaited on remote value change.
     test_parameter.values = ParameterValues(1, 0, 1)
@@ -1,12 +1,14 @@
 """Contains tests for the init module."""
 
 from typing import Final
+from unittest.mock import patch
 
 from pyplumio import (
     SerialConnection,
     TcpConnection,
     open_serial_connection,
     open_tcp_connection,
+    preload,
 )
 
 URL: Final = "/dev/ttyUSB0"
@@ -23,3 +25,12 @@ def test_connection_helpers() -> None:
     assert isinstance(tcp_connection, TcpConnection)
     assert tcp_connection.host == IP
     assert tcp_connection.port == 3939
+
+
+@patch("pyplumio.load_device_classes")
+@patch("pyplumio.load_frame_classes")
+def test_preload(mock_load_frame_classes, mock_load_device_classes) -> None:
+    """Test preloading frame and device classes."""
+    preload()
+    mock_load_frame_classes.assert_called_once()
+    mock_load_device_classes.assert_called_once()
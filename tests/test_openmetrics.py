@@ -0,0 +1,183 @@
+"""Contains tests for the OpenMetrics exporter."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyplumio.const import DeviceType, FrameType
+from pyplumio.frames.requests import CheckDeviceRequest
+from pyplumio.frames.responses import EcomaxControlResponse
+from pyplumio.openmetrics import (
+    CONTENT_TYPE,
+    FAMILIES,
+    OpenMetricsExporter,
+    _handle_request,
+    render_statistics,
+    start_metrics_server,
+)
+from pyplumio.protocol import DeviceStatistics, Statistics
+from pyplumio.request_tracker import RoundTripStatistics
+
+
+@pytest.fixture(name="statistics")
+def fixture_statistics() -> Statistics:
+    """Return the statistics with some traffic."""
+    statistics = Statistics()
+    statistics.connected_since = datetime.fromtimestamp(1000)
+    statistics.devices.add(
+        DeviceStatistics(
+            address=DeviceType.ECOMAX,
+            first_seen=datetime.fromtimestamp(1000),
+            last_seen=datetime.fromtimestamp(2000),
+        )
+    )
+    response = EcomaxControlResponse(sender=DeviceType.ECOMAX)
+    statistics.update_received(response)
+    statistics.traffic.update_decode_time(FrameType.RESPONSE_ECOMAX_CONTROL, 0.003)
+    statistics.update_sent(CheckDeviceRequest())
+    statistics.write_queue.wait_times.observe(0.02)
+    round_trip = statistics.round_trip_times[FrameType.REQUEST_ECOMAX_CONTROL] = (
+        RoundTripStatistics()
+    )
+    round_trip.update(0.4)
+    return statistics
+
+
+def test_render_statistics(statistics: Statistics) -> None:
+    """Test rendering the statistics samples."""
+    samples = render_statistics(statistics, (("connection", "test"),))
+    assert set(samples) == {family.name for family in FAMILIES}
+    assert samples["pyplumio_received_frames"] == [
+        'pyplumio_received_frames_total{connection="test"} 1'
+    ]
+    assert samples["pyplumio_connected_since_seconds"] == [
+        'pyplumio_connected_since_seconds{connection="test"} 1000.0'
+    ]
+    assert samples["pyplumio_connection_loss_at_seconds"] == []
+    assert samples["pyplumio_device_last_seen_seconds"] == [
+        'pyplumio_device_last_seen_seconds{connection="test",device="ecomax"} 2000.0'
+    ]
+    assert (
+        'pyplumio_frame_type_received_bytes_total{connection="test",'
+        'frame_type="response_ecomax_control"} 10'
+    ) in samples["pyplumio_frame_type_received_bytes"]
+    assert (
+        'pyplumio_sender_received_frames_total{connection="test",sender="ecomax"} 1'
+    ) in samples["pyplumio_sender_received_frames"]
+
+    decode_seconds = samples["pyplumio_frame_decode_seconds"]
+    assert (
+        'pyplumio_frame_decode_seconds_bucket{connection="test",'
+        'frame_type="response_ecomax_control",le="0.0025"} 0'
+    ) in decode_seconds
+    assert (
+        'pyplumio_frame_decode_seconds_bucket{connection="test",'
+        'frame_type="response_ecomax_control",le="0.005"} 1'
+    ) in decode_seconds
+    assert (
+        'pyplumio_frame_decode_seconds_count{connection="test",'
+        'frame_type="response_ecomax_control"} 1'
+    ) in decode_seconds
+    assert (
+        'pyplumio_round_trip_seconds_sum{connection="test",'
+        'frame_type="request_ecomax_control"} 0.4'
+    ) in samples["pyplumio_round_trip_seconds"]
+    assert (
+        'pyplumio_received_frames_per_second{connection="test",window="60s"} 0.0'
+    ) in samples["pyplumio_received_frames_per_second"]
+
+
+async def test_exporter(statistics: Statistics) -> None:
+    """Test rendering the exposition."""
+    exporter = OpenMetricsExporter()
+    exporter.add("boiler", statistics)
+    exporter.add("other", Statistics())
+    exposition = (await exporter.render()).decode()
+    lines = exposition.splitlines()
+    assert lines[0] == "# TYPE pyplumio_received_frames counter"
+    assert lines[1] == "# HELP pyplumio_received_frames Received frames."
+    assert lines[2] == 'pyplumio_received_frames_total{connection="boiler"} 1'
+    assert lines[3] == 'pyplumio_received_frames_total{connection="other"} 0'
+    assert exposition.endswith("# EOF\n")
+
+    # Verify that the exposition is cached.
+    statistics.received_frames += 1
+    assert (await exporter.render()).decode() == exposition
+
+    exporter.remove("other")
+    exposition = (await exporter.render()).decode()
+    assert 'pyplumio_received_frames_total{connection="boiler"} 2' in exposition
+    assert 'connection="other"' not in exposition
+
+
+@patch("time.monotonic", return_value=100)
+@patch("pyplumio.openmetrics.render_statistics", wraps=render_statistics)
+async def test_exporter_incremental(mock_render_statistics, mock_monotonic) -> None:
+    """Test that only the changed statistics are rendered again."""
+    exporter = OpenMetricsExporter(max_age=0)
+    changed, unchanged = Statistics(), Statistics()
+    exporter.add("changed", changed)
+    exporter.add("unchanged", unchanged)
+    await exporter.render()
+    assert mock_render_statistics.call_count == 2
+
+    changed.received_frames += 1
+    await exporter.render()
+    assert mock_render_statistics.call_count == 3
+
+    # Verify that samples are rendered again each second.
+    mock_monotonic.return_value = 101
+    await exporter.render()
+    assert mock_render_statistics.call_count == 5
+
+
+async def test_metrics_server(statistics: Statistics) -> None:
+    """Test the metrics HTTP endpoint."""
+    exporter = OpenMetricsExporter()
+    exporter.add("boiler", statistics)
+    server = await start_metrics_server(exporter, port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def _request(request: bytes) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    async with server:
+        response = await _request(b"GET /metrics HTTP/1.1\r\nHost: test\r\n\r\n")
+        headers, body = response.split(b"\r\n\r\n", 1)
+        assert headers.startswith(b"HTTP/1.1 200 OK")
+        assert f"Content-Type: {CONTENT_TYPE}".encode() in headers
+        assert body == await exporter.render()
+
+        response = await _request(b"GET /other HTTP/1.1\r\n\r\n")
+        assert response.startswith(b"HTTP/1.1 404 Not Found")
+
+        response = await _request(b"POST /metrics HTTP/1.1\r\n\r\n")
+        assert response.startswith(b"HTTP/1.1 405 Method Not Allowed")
+
+
+@pytest.mark.parametrize(
+    "request_bytes",
+    [
+        b"GET /metrics HTTP/1.1" + b"x" * 64 + b"\r\n\r\n",
+        b"GET\r\n\r\n",
+        b"\xff\r\n\r\n",
+    ],
+    ids=["overlong", "malformed", "undecodable"],
+)
+async def test_metrics_bad_request(request_bytes: bytes) -> None:
+    """Test that the bad request is answered with 400."""
+    reader = asyncio.StreamReader(limit=32)
+    reader.feed_data(request_bytes)
+    reader.feed_eof()
+    writer = Mock(spec=asyncio.StreamWriter)
+    await _handle_request(OpenMetricsExporter(), reader, writer)
+    writer.write.assert_called_once()
+    assert writer.write.call_args.args[0].startswith(b"HTTP/1.1 400 Bad Request")
+    writer.close.assert_called_once()
@@ -7,10 +7,11 @@ from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
-from pyplumio.const import ATTR_CONNECTED, ATTR_SETUP, DeviceType
+from pyplumio.const import ATTR_CONNECTED, ATTR_SETUP, DeviceType, FrameType
 from pyplumio.devices import PhysicalDevice
 from pyplumio.exceptions import ProtocolError
-from pyplumio.frames import Request, Response
+from pyplumio.frames.requests import AlertsRequest, CheckDeviceRequest
+from pyplumio.frames.responses import AlertsResponse, EcomaxControlResponse
 from pyplumio.protocol import NEVER, AsyncProtocol, DummyProtocol, Statistics
 from pyplumio.stream import FrameReader, FrameWriter
 
@@ -68,8 +69,8 @@ class TestDummyProtocol:
         assert protocol.writer is None
 
 
-request = Request()
-response = Response(sender=DeviceType.ECOMAX)
+request = CheckDeviceRequest()
+response = EcomaxControlResponse(sender=DeviceType.ECOMAX)
 
 
 class TestAsyncProtocol:
@@ -177,14 +178,14 @@ class TestAsyncProtocol:
     @patch("pyplumio.protocol.AsyncProtocol.connection_lost", new_callable=Mock)
     @patch("pyplumio.protocol.FrameWriter.write")
     @patch(
-        "pyplumio.protocol.FrameReader.read",
-        side_effect=(response, response, ProtocolError, Exception, OSError),
+        "pyplumio.protocol.FrameReader.read_many",
+        side_effect=([response], [response], ProtocolError, Exception, OSError),
     )
     @patch("pyplumio.devices.Device.dispatch_nowait")
     async def test_frame_handler(
         self,
         mock_dispatch_nowait,
-        mock_read,
+        mock_read_many,
         mock_write,
         mock_connection_lost,
         mock_create_task,
@@ -218,7 +219,7 @@ class TestAsyncProtocol:
         assert mock_empty.call_count == 5
 
         # Test read and device creation.
-        assert mock_read.await_count == 5
+        assert mock_read_many.await_count == 5
         assert mock_dispatch_nowait.call_count == 2
         mock_dispatch_nowait.assert_has_calls(
             [call(ATTR_CONNECTED, True), call(ATTR_SETUP, True)]
@@ -244,15 +245,161 @@ class TestAsyncProtocol:
         assert statistics.received_bytes == 20
         assert statistics.received_frames == 2
         assert statistics.failed_frames == 1
+        assert statistics.traffic.received
         statistics.reset_transfer_statistics()
         assert statistics.sent_bytes == 0
         assert statistics.sent_frames == 0
         assert statistics.received_bytes == 0
         assert statistics.sent_bytes == 0
         assert statistics.failed_frames == 0
+        assert statistics.write_queue.queued_frames == 0
+        assert not statistics.round_trip_times
+        assert not statistics.traffic.received
 
         # Test device statistics.
         device_statistics = statistics.devices.pop()
         assert device_statistics.address == DeviceType.ECOMAX
         await device_statistics.update_last_seen()
         assert device_statistics.last_seen == datetime.now()
+
+
+class TestAsyncProtocolFullDuplex:
+    """Contains tests for AsyncProtocol class in full-duplex mode."""
+
+    @patch("pyplumio.protocol.FrameReader", autospec=True)
+    @patch("pyplumio.protocol.FrameWriter", autospec=True)
+    @patch("pyplumio.protocol.AsyncProtocol.frame_reader", new_callable=Mock)
+    @patch("pyplumio.protocol.AsyncProtocol.frame_writer", new_callable=Mock)
+    @patch("asyncio.create_task")
+    async def test_connection_established(
+        self,
+        mock_create_task,
+        mock_frame_writer_task,
+        mock_frame_reader_task,
+        mock_frame_writer,
+        mock_frame_reader,
+    ) -> None:
+        """Test establishing the connection."""
+        protocol = AsyncProtocol(full_duplex=True)
+        mock_reader = AsyncMock(spec=asyncio.StreamReader, autospec=True)
+        mock_writer = AsyncMock(spec=asyncio.StreamWriter, autospec=True)
+        protocol.connection_established(reader=mock_reader, writer=mock_writer)
+        mock_frame_reader_task.assert_called_once_with(
+            reader=mock_frame_reader.return_value
+        )
+        mock_frame_writer_task.assert_called_once_with(
+            writer=mock_frame_writer.return_value
+        )
+        mock_create_task.assert_has_calls(
+            [
+                call(mock_frame_reader_task.return_value, name="frame_reader_task"),
+                call(mock_frame_writer_task.return_value, name="frame_writer_task"),
+            ],
+            any_order=True,
+        )
+
+    @patch("pyplumio.protocol.AsyncProtocol.connection_lost", new_callable=Mock)
+    @patch(
+        "pyplumio.protocol.FrameReader.read_many",
+        side_effect=([response], ProtocolError, Exception, OSError),
+    )
+    @patch("pyplumio.devices.Device.dispatch_nowait")
+    async def test_frame_reader(
+        self, mock_dispatch_nowait, mock_read_many, mock_connection_lost, caplog
+    ) -> None:
+        """Test frame reader."""
+        protocol = AsyncProtocol(full_duplex=True)
+        protocol.connected.set()
+        mock_writer_task = Mock(spec=asyncio.Task)
+        protocol._io_tasks = {mock_writer_task}
+        with caplog.at_level(logging.DEBUG):
+            await protocol.frame_reader(
+                reader=FrameReader(AsyncMock(spec=asyncio.StreamReader))
+            )
+
+        assert mock_read_many.await_count == 4
+        assert protocol.statistics.received_frames == 1
+        assert protocol.statistics.failed_frames == 1
+        assert "Can't process received frame" in caplog.text
+        assert "Unexpected exception" in caplog.text
+
+        # Test that the writer task was cancelled on connection lost.
+        mock_writer_task.cancel.assert_called_once()
+        mock_connection_lost.assert_called_once()
+
+    @pytest.mark.parametrize("full_duplex", [False, True])
+    @patch("pyplumio.protocol.AsyncProtocol.connection_lost", new_callable=Mock)
+    @patch("pyplumio.devices.ecomax.EcoMAX.handle_frame")
+    @patch("pyplumio.devices.Device.dispatch_nowait")
+    async def test_failed_frame_in_batch(
+        self,
+        mock_dispatch_nowait,
+        mock_handle_frame,
+        mock_connection_lost,
+        full_duplex: bool,
+        caplog,
+    ) -> None:
+        """Test that failed frame doesn't discard the rest of the batch."""
+        mock_handle_frame.side_effect = (None, ProtocolError("bad"), Exception, None)
+        protocol = AsyncProtocol(full_duplex=full_duplex)
+        protocol.connected.set()
+        reader = FrameReader(AsyncMock(spec=asyncio.StreamReader))
+        with (
+            patch.object(
+                FrameReader,
+                "read_many",
+                side_effect=([response, response, response, response], OSError),
+            ),
+            caplog.at_level(logging.DEBUG),
+        ):
+            if full_duplex:
+                await protocol.frame_reader(reader=reader)
+            else:
+                await protocol.frame_handler(
+                    reader=reader,
+                    writer=FrameWriter(AsyncMock(spec=asyncio.StreamWriter)),
+                )
+
+        assert mock_handle_frame.call_count == 4
+        assert protocol.statistics.received_frames == 4
+        assert protocol.statistics.failed_frames == 2
+        assert "Can't process received frame: bad" in caplog.text
+        assert "Unexpected exception while processing frame" in caplog.text
+        mock_connection_lost.assert_called_once()
+
+    @patch("pyplumio.protocol.AsyncProtocol.connection_lost", new_callable=Mock)
+    @patch(
+        "pyplumio.protocol.FrameWriter.write", side_effect=(None, Exception, OSError)
+    )
+    async def test_frame_writer(self, mock_write, mock_connection_lost, caplog) -> None:
+        """Test frame writer."""
+        protocol = AsyncProtocol(full_duplex=True)
+        protocol.connected.set()
+        mock_reader_task = Mock(spec=asyncio.Task)
+        protocol._io_tasks = {mock_reader_task}
+        for _ in range(3):
+            protocol._write_queue.put_nowait(CheckDeviceRequest())
+
+        await protocol.frame_writer(
+            writer=FrameWriter(AsyncMock(spec=asyncio.StreamWriter))
+        )
+
+        assert mock_write.await_count == 3
+        assert protocol.statistics.sent_frames == 1
+        assert "Unexpected exception" in caplog.text
+        assert protocol._write_queue.empty()
+        mock_reader_task.cancel.assert_called_once()
+        mock_connection_lost.assert_called_once()
+
+
+@patch("pyplumio.devices.Device.dispatch_nowait")
+async def test_request_tracking(mock_dispatch_nowait) -> None:
+    """Test resolving the pending request with the received response."""
+    protocol = AsyncProtocol()
+    request = AlertsRequest(recipient=DeviceType.ECOMAX)
+    future = protocol._request_tracker.expect(request)
+    protocol._request_tracker.sent(request)
+    alerts_response = AlertsResponse(sender=DeviceType.ECOMAX, data={})
+    await protocol._process_frame(alerts_response)
+    assert await future is alerts_response
+    assert protocol.statistics.round_trip_times[FrameType.REQUEST_ALERTS].count == 1
@@ -0,0 +1,150 @@
+"""Contains tests for the request tracker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pyplumio.const import ATTR_INDEX, ATTR_VALUE, DeviceType, FrameType
+from pyplumio.frames.requests import (
+    AlertsRequest,
+    ProgramVersionRequest,
+    SetEcomaxParameterRequest,
+)
+from pyplumio.frames.responses import (
+    AlertsResponse,
+    ProgramVersionResponse,
+    SetEcomaxParameterResponse,
+)
+from pyplumio.request_tracker import RequestTracker, RoundTripStatistics
+
+
+@pytest.fixture(name="request_tracker")
+def fixture_request_tracker() -> RequestTracker:
+    """Return a request tracker."""
+    return RequestTracker()
+
+
+async def test_expect(request_tracker: RequestTracker) -> None:
+    """Test resolving the response future."""
+    request = AlertsRequest(recipient=DeviceType.ECOMAX)
+    assert not request_tracker.is_pending(request)
+    future = request_tracker.expect(request)
+    assert request_tracker.is_pending(request)
+    assert request_tracker.expect(AlertsRequest(recipient=DeviceType.ECOMAX)) is future
+
+    # Verify that response from a different device is ignored.
+    assert not request_tracker.resolve(AlertsResponse(sender=DeviceType.ECOSTER))
+    assert not future.done()
+
+    response = AlertsResponse(sender=DeviceType.ECOMAX)
+    assert request_tracker.resolve(response)
+    assert await future is response
+    assert len(request_tracker) == 0
+
+
+async def test_expect_broadcast(request_tracker: RequestTracker) -> None:
+    """Test resolving the response future for a broadcast request."""
+    future = request_tracker.expect(ProgramVersionRequest(recipient=DeviceType.ALL))
+    response = ProgramVersionResponse(sender=DeviceType.ECOMAX)
+    assert request_tracker.resolve(response)
+    assert await future is response
+
+
+@patch("time.monotonic", side_effect=(0, 1, 2, 5))
+async def test_round_trip_time(mock_monotonic, request_tracker: RequestTracker) -> None:
+    """Test recording the round-trip time."""
+    for _ in range(2):
+        request_tracker.sent(AlertsRequest(recipient=DeviceType.ECOMAX))
+        request_tracker.resolve(AlertsResponse(sender=DeviceType.ECOMAX))
+
+    statistics = request_tracker.statistics[FrameType.REQUEST_ALERTS]
+    assert statistics.count == 2
+    assert statistics.total == 4
+    assert statistics.min == 1
+    assert statistics.max == 3
+    assert statistics.last == 3
+    assert statistics.mean == 2
+    assert statistics.histogram.count == 2
+
+
+@patch("time.monotonic", side_effect=(0, 1, 2, 3, 5))
+async def test_pipelined_requests(
+    mock_monotonic, request_tracker: RequestTracker
+) -> None:
+    """Test that pipelined requests of the same type are resolved in order."""
+    for index in (1, 2):
+        request_tracker.sent(
+            SetEcomaxParameterRequest(
+                recipient=DeviceType.ECOMAX, data={ATTR_INDEX: index, ATTR_VALUE: 1}
+            )
+        )
+
+    assert len(request_tracker) == 2
+    assert request_tracker.resolve(SetEcomaxParameterResponse(sender=DeviceType.ECOMAX))
+    assert len(request_tracker) == 1
+    assert request_tracker.resolve(SetEcomaxParameterResponse(sender=DeviceType.ECOMAX))
+    assert len(request_tracker) == 0
+
+    # Verify that each response is timed from its own request.
+    statistics = request_tracker.statistics[FrameType.REQUEST_SET_ECOMAX_PARAMETER]
+    assert statistics.count == 2
+    assert statistics.min == 3
+    assert statistics.max == 4
+
+
+@patch("time.monotonic", side_effect=(0, 20, 21, 21))
+async def test_expired_requests(
+    mock_monotonic, request_tracker: RequestTracker
+) -> None:
+    """Test that requests with the lost response are skipped."""
+    for _ in range(2):
+        request_tracker.sent(AlertsRequest(recipient=DeviceType.ECOMAX))
+
+    assert request_tracker.resolve(AlertsResponse(sender=DeviceType.ECOMAX))
+    assert len(request_tracker) == 0
+    assert request_tracker.statistics[FrameType.REQUEST_ALERTS].last == 1
+
+
+def test_clear(request_tracker: RequestTracker) -> None:
+    """Test forgetting pending requests."""
+    request_tracker.sent(AlertsRequest(recipient=DeviceType.ECOMAX))
+    request_tracker.clear()
+    assert len(request_tracker) == 0
+    assert not request_tracker.resolve(AlertsResponse(sender=DeviceType.ECOMAX))
+    assert RoundTripStatistics().mean == 0.0
+
+
+def test_discard(request_tracker: RequestTracker) -> None:
+    """Test forgetting a pending request."""
+    request = AlertsRequest(recipient=DeviceType.ECOMAX)
+    request_tracker.sent(request)
+    assert request_tracker.is_pending(request)
+    request_tracker.discard(request)
+    assert not request_tracker.is_pending(request)
+
+
+def test_discard_pipelined(request_tracker: RequestTracker) -> None:
+    """Test forgetting only the discarded request of the same type."""
+    request1 = AlertsRequest(recipient=DeviceType.ECOMAX)
+    request2 = AlertsRequest(recipient=DeviceType.ECOMAX)
+    request_tracker.sent(request1)
+    request_tracker.sent(request2)
+    request_tracker.discard(request1)
+    assert request_tracker.is_pending(request2)
+    assert len(request_tracker) == 1
+    request_tracker.discard(request1)
+    assert len(request_tracker) == 1
+
+
+async def test_resolve_invalid(request_tracker: RequestTracker) -> None:
+    """Test keeping the request pending, if the response is invalid."""
+    request = AlertsRequest(recipient=DeviceType.ECOMAX)
+    future = request_tracker.expect(request)
+    response = AlertsResponse(sender=DeviceType.ECOMAX)
+    with patch.object(AlertsRequest, "validate_response", return_value=False):
+        assert not request_tracker.resolve(response)
+
+    assert request_tracker.is_pending(request)
+    assert not future.done()
+    assert request_tracker.resolve(response)
+    assert await future is response
@@ -5,22 +5,24 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Generator
 import logging
-from unittest.mock import AsyncMock, call, patch
+from unittest.mock import patch
 
 import pytest
 
+from pyplumio.codec import MAX_FRAME_LENGTH
 from pyplumio.const import DeviceType, FrameType
-from pyplumio.exceptions import ChecksumError, ReadError, UnknownDeviceError
-from pyplumio.frames import ECONET_TYPE, ECONET_VERSION
+from pyplumio.exceptions import ChecksumError
 from pyplumio.frames.requests import EcomaxParametersRequest, ProgramVersionRequest
 from pyplumio.stream import (
-    DEFAULT_BUFFER_SIZE,
     FORCE_CLOSE_AFTER_SECONDS,
-    MAX_FRAME_LENGTH,
-    BufferedReader,
+    WAIT_FOR_READ_SECONDS,
     FrameReader,
     FrameWriter,
 )
+from pyplumio.utils import timeout
+
+ECOMAX_PARAMETERS_REQUEST = b"\x68\x0c\x00\x00\x56\x30\x05\x31\xff\x00\xc9\x16"
+PROGRAM_VERSION_REQUEST = b"\x68\x0a\x00\x00\x56\x30\x05\x40\x41\x16"
 
 
 @pytest.fixture(name="mock_stream_writer")
@@ -42,16 +44,6 @@ def fixture_frame_writer(mock_stream_writer) -> FrameWriter:
     return FrameWriter(mock_stream_writer)
 
 
-@pytest.fixture(name="buffered_reader")
-def fixture_buffered_reader() -> Generator[BufferedReader]:
-    """BufferedReader instance.
-
-    Returns a BufferedReader using a patched StreamReader.
-    """
-    with patch("asyncio.StreamReader", autospec=True) as mock_stream_reader:
-        yield BufferedReader(mock_stream_reader)
-
-
 @pytest.fixture(name="frame_reader")
 def fixture_frame_reader() -> Generator[FrameReader]:
     """FrameReader instance.
@@ -62,16 +54,6 @@ def fixture_frame_reader() -> Generator[FrameReader]:
         yield FrameReader(mock_stream_reader)
 
 
-@pytest.fixture(name="read_frame_start")
-def fixture_read_frame_start():
-    """Mock frame start delimiter.
-
-    Patches StreamReader.read to return the frame start byte.
-    """
-    with patch("asyncio.StreamReader.read", return_value=b"\x68") as mock_read:
-        yield mock_read
-
-
 class TestFrameWriter:
     """Tests for FrameWriter class.
 
@@ -138,357 +120,198 @@ class TestFrameWriter:
         )
 
 
-class TestBufferedReader:
-    """Test for BufferedReader class.
+class TestFrameReader:
+    """Tests for FrameReader class.
 
-    Verifies handling of reader with an internal buffer.
+    Verifies reading frames from the stream and error handling.
     """
 
-    @patch("pyplumio.stream.BufferedReader.trim_to")
-    @patch("asyncio.StreamReader.readexactly")
-    @pytest.mark.parametrize(
-        ("size", "data"),
-        (
-            (0, bytearray()),
-            (3, bytearray(b"\x00\x01\x02")),
-            (5, bytearray(b"\x00\x01\x02\x03\x04")),
-        ),
-    )
-    async def test_ensure_buffer(
-        self,
-        mock_readexactly,
-        mock_trim_to,
-        buffered_reader: BufferedReader,
-        size: int,
-        data: bytearray,
-    ) -> None:
-        """Test ensuring buffer size.
+    @patch("asyncio.StreamReader.read", return_value=ECOMAX_PARAMETERS_REQUEST)
+    async def test_read(self, mock_read, frame_reader: FrameReader) -> None:
+        """Test reading a frame.
 
-        Ensures that the buffer is filled to the requested size and
-        that the buffer is trimmed appropriately.
+        Checks that the bytes read from the stream are decoded.
         """
-        mock_readexactly.return_value = data
-        await buffered_reader.ensure_buffer(size)
-        if size == 0:
-            mock_readexactly.assert_not_awaited()
-            mock_trim_to.assert_not_called()
-        else:
-            mock_readexactly.assert_awaited_once_with(size)
-            mock_trim_to.assert_called_once_with(DEFAULT_BUFFER_SIZE)
-            assert len(buffered_reader.buffer) == size
+        frame = await frame_reader.read()
+        assert isinstance(frame, EcomaxParametersRequest)
+        assert frame.frame_type == FrameType.REQUEST_ECOMAX_PARAMETERS
+        assert frame.sender == DeviceType.ECONET
+        assert frame.recipient == DeviceType.ALL
+        assert frame.message == b"\xff\x00"
+        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
 
     @patch(
-        "asyncio.StreamReader.readexactly",
-        side_effect=asyncio.IncompleteReadError(b"", expected=7),
+        "asyncio.StreamReader.read",
+        side_effect=(
+            ECOMAX_PARAMETERS_REQUEST[:5],
+            ECOMAX_PARAMETERS_REQUEST[5:],
+        ),
     )
-    async def test_ensure_buffer_with_incomplete_read(
-        self, mock_readexactly, buffered_reader: BufferedReader
+    async def test_read_incomplete_frame(
+        self, mock_read, frame_reader: FrameReader
     ) -> None:
-        """Test ensuring buffer size with incomplete read.
-
-        Ensures that a ReadError is raised when the read is incomplete.
-        """
-        with pytest.raises(
-            ReadError, match="Incomplete read. Tried to read 5 additional bytes"
-        ):
-            await buffered_reader.ensure_buffer(5)
-
-        mock_readexactly.assert_awaited_once_with(5)
+        """Test reading a frame split between multiple reads."""
+        frame = await frame_reader.read()
+        assert isinstance(frame, EcomaxParametersRequest)
+        assert mock_read.await_count == 2
 
-    @patch("asyncio.StreamReader.readexactly", side_effect=asyncio.CancelledError())
-    async def test_ensure_buffer_with_cancelled_error(
-        self, mock_readexactly, buffered_reader: BufferedReader, caplog
+    @patch(
+        "asyncio.StreamReader.read",
+        side_effect=(
+            b"\x68\x0a\x00\x10\x56\x30\x05\x01\x10\x16",
+            PROGRAM_VERSION_REQUEST,
+        ),
+    )
+    async def test_read_skips_unknown_recipient(
+        self, mock_read, frame_reader: FrameReader
     ) -> None:
-        """Test ensuring buffer size with cancelled error.
-
-        Ensures that CancelledError is raised and logged when the read is cancelled.
-        """
-        with pytest.raises(asyncio.CancelledError), caplog.at_level(logging.DEBUG):
-            await buffered_reader.ensure_buffer(5)
-
-        assert "Read operation cancelled while ensuring buffer" in caplog.text
-        mock_readexactly.assert_awaited_once_with(5)
+        """Test reading skips frames intended for other recipients."""
+        frame = await frame_reader.read()
+        assert isinstance(frame, ProgramVersionRequest)
+        assert mock_read.await_count == 2
 
-    @patch("asyncio.StreamReader.readexactly", side_effect=OSError())
-    async def test_ensure_buffer_with_unexpected_error(
-        self, mock_readexactly, buffered_reader: BufferedReader
+    @patch("asyncio.StreamReader.read", return_value=False)
+    async def test_broken_connection(
+        self, mock_read, frame_reader: FrameReader, caplog
     ) -> None:
-        """Test ensuring buffer size with unexpected error.
+        """Test broken connection.
 
-        Ensures that OSError is raised when an unexpected error occurs.
+        Ensures OSError is raised for empty read buffer.
         """
-        with pytest.raises(
-            OSError, match="Serial connection broken while trying to ensure 5 bytes"
+        with (
+            pytest.raises(OSError, match="Serial connection broken"),
+            caplog.at_level(logging.DEBUG),
         ):
-            await buffered_reader.ensure_buffer(5)
-
-        mock_readexactly.assert_awaited_once_with(5)
-
-    async def test_consume(self, buffered_reader: BufferedReader) -> None:
-        """Test consuming bytes from the buffer.
-
-        Ensures that bytes are removed from the buffer as expected.
-        """
-        buffered_reader.buffer.extend(bytearray(b"\x00\x01"))
-        assert len(buffered_reader.buffer) == 2
-        await buffered_reader.consume(2)
-        assert len(buffered_reader.buffer) == 0
-
-    async def test_peek(self, buffered_reader: BufferedReader) -> None:
-        """Test peeking bytes from the buffer.
-
-        Ensures that peeking returns the correct bytes without consuming them.
-        """
-        buffered_reader.buffer.extend(bytearray(b"\x00\x01\x02"))
-        peeked_data = await buffered_reader.peek(2)
-        assert len(peeked_data) == 2
-        assert peeked_data == bytearray(b"\x00\x01")
-        assert len(buffered_reader.buffer) == 3
-
-    def test_seek_to(self, buffered_reader: BufferedReader) -> None:
-        """Test seeking to a delimiter in the buffer.
-
-        Ensures that the buffer is trimmed up to the delimiter.
-        """
-        buffered_reader.buffer.extend(bytearray(b"\x00\x01\x02\x03\x04"))
-        assert buffered_reader.seek_to(2) is True
-        assert len(buffered_reader.buffer) == 3
-
-    def test_trim_to(self, buffered_reader: BufferedReader) -> None:
-        """Test trimming the buffer to a specific size.
-
-        Ensures that the buffer is trimmed to the correct length.
-        """
-        buffered_reader.buffer.extend(bytearray(b"\x00\x01\x02\x03\x04"))
-        buffered_reader.trim_to(3)
-        assert len(buffered_reader.buffer) == 3
-        assert buffered_reader.buffer == bytearray(b"\x02\x03\x04")
-
-    @patch("asyncio.StreamReader.read", return_value=bytearray(b"\x00\x01\x02"))
-    @patch("pyplumio.stream.BufferedReader.trim_to")
-    async def test_read_into_buffer(
-        self, mock_trim_to, mock_read, buffered_reader: BufferedReader
-    ) -> None:
-        """Test filling the internal buffer with data.
+            await frame_reader.read()
 
-        Ensures that the buffer is filled and trimmed as expected.
-        """
-        await buffered_reader.read_into_buffer(MAX_FRAME_LENGTH)
-        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
-        mock_trim_to.assert_called_once_with(DEFAULT_BUFFER_SIZE)
-        assert len(buffered_reader.buffer) == 3
+        assert "Stream ended while filling internal buffer." in caplog.text
+        mock_read.assert_awaited_once()
 
     @patch("asyncio.StreamReader.read", side_effect=asyncio.CancelledError())
-    async def test_read_into_buffer_with_cancelled_error(
-        self, mock_read, buffered_reader: BufferedReader, caplog
+    async def test_read_with_cancelled_error(
+        self, mock_read, frame_reader: FrameReader, caplog
     ) -> None:
-        """Test filling the internal buffer with cancelled error.
+        """Test reading with cancelled error.
 
-        Ensures that CancelledError is raised and logged when the read is cancelled.
+        Ensures that CancelledError is raised and logged.
         """
         with caplog.at_level(logging.DEBUG), pytest.raises(asyncio.CancelledError):
-            await buffered_reader.read_into_buffer(MAX_FRAME_LENGTH)
+            await frame_reader.read()
 
         mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
         assert "Read operation cancelled while filling internal buffer." in caplog.text
 
     @patch("asyncio.StreamReader.read", side_effect=OSError())
-    async def test_read_into_buffer_with_unexpected_error(
-        self, mock_read, buffered_reader: BufferedReader, caplog
+    async def test_read_with_unexpected_error(
+        self, mock_read, frame_reader: FrameReader
     ) -> None:
-        """Test filling the internal buffer with unexpected error.
+        """Test reading with unexpected error.
 
         Ensures that OSError is raised when an unexpected error occurs.
         """
         with pytest.raises(
             OSError, match="Serial connection broken while filling internal buffer"
         ):
-            await buffered_reader.read_into_buffer(MAX_FRAME_LENGTH)
-
-        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
-
-    @patch("asyncio.StreamReader.read", return_value=b"")
-    async def test_read_into_buffer_with_broken_connection(
-        self, mock_read, buffered_reader: BufferedReader, caplog
-    ) -> None:
-        """Test filling the buffer with broken connection.
-
-        Ensures that OSError is raised and logged when the connection is broken.
-        """
-        with (
-            pytest.raises(OSError, match="Serial connection broken"),
-            caplog.at_level(logging.DEBUG),
-        ):
-            await buffered_reader.read_into_buffer(MAX_FRAME_LENGTH)
+            await frame_reader.read()
 
-        assert "Stream ended while filling internal buffer." in caplog.text
         mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
 
-
-class TestFrameReader:
-    """Tests for FrameReader class.
-
-    Verifies reading, error handling, and frame validation.
-    """
-
-    @patch("asyncio.StreamReader.read", return_value=(b"\x00\x68"))
     @patch(
-        "asyncio.StreamReader.readexactly",
-        side_effect=(b"\x0c\x00\x00\x56\x30\x05", b"\x31\xff\x00\xc9\x16"),
+        "asyncio.StreamReader.read",
+        return_value=b"\x68\x0c\x00\x00\x56\x30\x05\x31\xfe\x00\xc9\x16",
     )
-    async def test_read(
-        self, mock_readexactly, mock_read, frame_reader: FrameReader
-    ) -> None:
-        """Test reading a frame.
-
-        Checks correct parsing and field extraction from a frame.
-        """
-        frame = await frame_reader.read()
-        assert isinstance(frame, EcomaxParametersRequest)
-        assert frame.frame_type == FrameType.REQUEST_ECOMAX_PARAMETERS
-        assert frame.sender == DeviceType.ECONET
-        assert frame.econet_type == ECONET_TYPE
-        assert frame.recipient == DeviceType.ALL
-        assert frame.message == b"\xff\x00"
-        assert frame.econet_version == ECONET_VERSION
-        assert mock_read.call_count == 1
-        mock_read.assert_has_calls([call(MAX_FRAME_LENGTH)])
-        assert mock_readexactly.call_count == 2
-        mock_readexactly.assert_has_calls([call(6), call(5)])
-
-    @patch("asyncio.StreamReader.read", return_value=False)
-    async def test_broken_connection(
+    async def test_incorrect_checksum(
         self, mock_read, frame_reader: FrameReader
     ) -> None:
-        """Test broken connection.
-
-        Ensures OSError is raised for empty read buffer.
-        """
-        with pytest.raises(OSError, match="Serial connection broken"):
-            await frame_reader.read()
-
-        mock_read.assert_awaited_once()
-
-    @patch(
-        "asyncio.StreamReader.readexactly",
-        side_effect=asyncio.IncompleteReadError(b"", expected=7),
-    )
-    async def test_incomplete_header(
-        self, mock_readexactly, frame_reader: FrameReader, read_frame_start
-    ) -> None:
-        """Test incomplete header.
-
-        Ensures ReadError is raised for incomplete frame header.
-        """
-        with pytest.raises(ReadError, match="Incomplete read"):
-            await frame_reader.read()
-
-        read_frame_start.assert_awaited_once()
-        mock_readexactly.assert_awaited_once_with(6)
-
-    @patch("asyncio.StreamReader.readexactly", return_value=b"\x03\x00\x00\x56\x30\x05")
-    async def test_unexpected_frame_length(
-        self, mock_readexactly, frame_reader: FrameReader, read_frame_start
-    ) -> None:
-        """Test unexpected frame length.
+        """Test incorrect checksum.
 
-        Ensures ReadError is raised for unexpected frame length.
+        Ensures ChecksumError is raised for invalid checksum.
         """
-        with pytest.raises(ReadError, match="Unexpected frame length"):
+        with pytest.raises(ChecksumError, match="Incorrect frame checksum"):
             await frame_reader.read()
 
-        read_frame_start.assert_awaited_once()
-        mock_readexactly.assert_awaited_once_with(6)
+        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
 
     @patch(
-        "asyncio.StreamReader.readexactly",
-        side_effect=(
-            b"\x0c\x00\x00\x56\x30\x05",
-            asyncio.IncompleteReadError(b"", 10),
+        "asyncio.StreamReader.read",
+        return_value=(
+            ECOMAX_PARAMETERS_REQUEST
+            + b"\x68\x0a\x00\x10\x56\x30\x05\x01\x10\x16"
+            + PROGRAM_VERSION_REQUEST
         ),
-        new_callable=AsyncMock,
     )
-    async def test_incomplete_frame(
-        self, mock_readexactly, frame_reader: FrameReader, read_frame_start
-    ) -> None:
-        """Test incomplete frame.
+    async def test_read_many(self, mock_read, frame_reader: FrameReader) -> None:
+        """Test reading all available frames.
 
-        Ensures ReadError is raised for incomplete frame data.
+        Verifies that all complete frames are returned at once and that
+        frames left from previous single frame read are returned first.
         """
-        with pytest.raises(ReadError, match="Incomplete read"):
-            await frame_reader.read()
-
-        read_frame_start.assert_awaited_once()
-        mock_readexactly.assert_has_calls([call(6), call(5)])
+        frames = await frame_reader.read_many()
+        assert len(frames) == 2
+        assert isinstance(frames[0], EcomaxParametersRequest)
+        assert isinstance(frames[1], ProgramVersionRequest)
+        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
 
-    @pytest.mark.parametrize(
-        ("target", "expected_exception", "error_pattern"),
-        [
-            ("asyncio.StreamReader.readexactly", OSError, "Serial connection broken"),
-            ("asyncio.StreamReader.read", OSError, "Serial connection broken"),
-            ("asyncio.StreamReader.readexactly", asyncio.CancelledError, None),
-            ("asyncio.StreamReader.read", asyncio.CancelledError, None),
-        ],
-    )
-    async def test_read_exceptions(
-        self,
-        frame_reader: FrameReader,
-        read_frame_start,
-        target: str,
-        expected_exception: type[Exception],
-        error_pattern: str,
-    ) -> None:
-        """Test read exceptions."""
-        with (
-            patch(target, side_effect=expected_exception()),
-            pytest.raises(expected_exception, match=error_pattern),
-        ):
-            await frame_reader.read()
+        frame = await frame_reader.read()
+        assert isinstance(frame, EcomaxParametersRequest)
+        frames = await frame_reader.read_many()
+        assert len(frames) == 1
+        assert isinstance(frames[0], ProgramVersionRequest)
+        assert mock_read.await_count == 2
 
     @patch(
-        "asyncio.StreamReader.readexactly",
-        side_effect=(b"\x0c\x00\x00\x56\x30\x05", b"\x31\xfe\x00\xc9\x16"),
+        "asyncio.StreamReader.read",
+        side_effect=(ECOMAX_PARAMETERS_REQUEST + PROGRAM_VERSION_REQUEST, b""),
     )
-    async def test_incorrect_checksum(
-        self, mock_readexactly, frame_reader: FrameReader, read_frame_start
-    ) -> None:
-        """Test incorrect checksum.
+    async def test_async_iterator(self, mock_read, frame_reader: FrameReader) -> None:
+        """Test iterating over received frames.
 
-        Ensures ChecksumError is raised for invalid checksum.
+        Verifies that frames are yielded one by one and that
+        iteration ends with an error when the stream ends.
         """
-        with pytest.raises(ChecksumError, match="Incorrect frame checksum"):
-            await frame_reader.read()
+        frames = []
+        with pytest.raises(OSError, match="Serial connection broken"):
+            async for frame in frame_reader:
+                frames.append(frame)
 
-        read_frame_start.assert_awaited_once()
-        mock_readexactly.assert_has_calls([call(6), call(5)])
+        assert len(frames) == 2
+        assert isinstance(frames[0], EcomaxParametersRequest)
+        assert isinstance(frames[1], ProgramVersionRequest)
 
-    @patch(
-        "asyncio.StreamReader.read",
-        return_value=b"\x68\x0a\x00\x10\x56\x30\x05\x01\x10\x16",
+    def test_read_timeout(self) -> None:
+        """Test that reads from the stream have a timeout."""
+        assert (
+            getattr(FrameReader._read_frames, "_has_timeout_seconds", None)
+            == WAIT_FOR_READ_SECONDS
+        )
+
+    @pytest.mark.parametrize(
+        "chunk",
+        [b"\x00\x01\x02\x03", b"\x68\x0a\x00\x10\x56\x30\x05\x01\x10\x16"],
+        ids=["garbage", "unknown_recipient"],
     )
-    async def test_unknown_recipient(
-        self, mock_read, frame_reader: FrameReader
+    async def test_read_timeout_without_frame(
+        self, frame_reader: FrameReader, chunk: bytes
     ) -> None:
-        """Test unknown recipient.
+        """Test that the read times out when no valid frame is received.
 
-        Verifies that the reader returns None when the recipient address
-        in the frame is not recognized as a valid device.
+        Ensures that the stream that keeps sending bytes, none of which
+        can be decoded into a frame, doesn't keep the reader waiting.
         """
-        result = await frame_reader.read()
-        assert result is None
-        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
+        loop = asyncio.get_running_loop()
 
-    @patch(
-        "asyncio.StreamReader.read",
-        return_value=b"\x68\x0a\x00\x00\x10\x30\x05\x01\x46\x16",
-    )
-    async def test_unknown_sender(self, mock_read, frame_reader: FrameReader) -> None:
-        """Test unknown sender.
+        async def read(size: int) -> bytes:
+            """Return the chunk after a short delay."""
+            future: asyncio.Future[bytes] = loop.create_future()
+            loop.call_later(0.01, future.set_result, chunk)
+            return await future
 
-        Verifies that an UnknownDeviceError is raised when the sender
-        address in the frame does not match any known device types.
-        """
-        with pytest.raises(UnknownDeviceError, match="Unknown sender"):
+        read_frames = timeout(0.05)(getattr(FrameReader._read_frames, "__wrapped__"))
+        with (
+            patch("asyncio.StreamReader.read", side_effect=read) as mock_read,
+            patch.object(FrameReader, "_read_frames", read_frames),
+            pytest.raises(TimeoutError),
+        ):
             await frame_reader.read()
 
-        mock_read.assert_awaited_once_with(MAX_FRAME_LENGTH)
+        assert mock_read.await_count > 1
@@ -0,0 +1,43 @@
+"""Contains tests for the traffic statistics."""
+
+from unittest.mock import patch
+
+from pyplumio.const import DeviceType, FrameType
+from pyplumio.frames.requests import CheckDeviceRequest
+from pyplumio.frames.responses import EcomaxControlResponse
+from pyplumio.traffic import RATE_WINDOWS, RateSnapshot, TrafficStatistics
+
+
+@patch("time.monotonic", return_value=100.5)
+def test_traffic_statistics(mock_monotonic) -> None:
+    """Test traffic statistics."""
+    traffic = TrafficStatistics()
+    response = EcomaxControlResponse(sender=DeviceType.ECOMAX)
+    for _ in range(3):
+        traffic.update_received(response)
+
+    traffic.update_received(EcomaxControlResponse(sender=DeviceType.ECOSTER))
+    traffic.update_decode_time(FrameType.RESPONSE_ECOMAX_CONTROL, 0.002)
+    traffic.update_decode_time(FrameType.RESPONSE_ALERTS, 0.002)
+    traffic.update_sent(CheckDeviceRequest())
+
+    mock_monotonic.return_value = 101.5
+    snapshot = traffic.snapshot()
+    received = snapshot.received[FrameType.RESPONSE_ECOMAX_CONTROL]
+    assert received.frames == 4
+    assert received.bytes == 40
+    assert received.decode_time is not None
+    assert received.decode_time.count == 1
+    assert snapshot.senders[DeviceType.ECOMAX].frames == 3
+    assert snapshot.senders[DeviceType.ECOSTER].frames == 1
+    assert snapshot.sent[FrameType.REQUEST_CHECK_DEVICE].bytes == 10
+    assert snapshot.sent[FrameType.REQUEST_CHECK_DEVICE].decode_time is None
+    assert snapshot.received_rates[1] == RateSnapshot(4, 40)
+    assert snapshot.sent_rates[10] == RateSnapshot(0.1, 1)
+    assert tuple(snapshot.received_rates) == RATE_WINDOWS
+
+    traffic.reset()
+    snapshot = traffic.snapshot()
+    assert not snapshot.received
+    assert not snapshot.senders
+    assert snapshot.received_rates[1] == RateSnapshot(0, 0)
@@ -0,0 +1,126 @@
+"""Contains tests for the write queue."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pyplumio.const import ATTR_DEVICE_INDEX, ATTR_INDEX, ATTR_VALUE, DeviceType
+from pyplumio.frames import Frame
+from pyplumio.frames.requests import (
+    CheckDeviceRequest,
+    EcomaxControlRequest,
+    ProgramVersionRequest,
+    SetEcomaxParameterRequest,
+    SetMixerParameterRequest,
+)
+from pyplumio.frames.responses import DeviceAvailableResponse
+from pyplumio.write_queue import (
+    WritePriority,
+    WriteQueue,
+    get_coalesce_key,
+    get_priority,
+)
+
+
+def set_ecomax_parameter(index: int, value: int) -> SetEcomaxParameterRequest:
+    """Return a request to set an ecoMAX parameter."""
+    return SetEcomaxParameterRequest(
+        recipient=DeviceType.ECOMAX, data={ATTR_INDEX: index, ATTR_VALUE: value}
+    )
+
+
+@pytest.fixture(name="write_queue")
+def fixture_write_queue() -> WriteQueue:
+    """Return a write queue."""
+    return WriteQueue()
+
+
+@pytest.mark.parametrize(
+    ("frame", "priority"),
+    [
+        (DeviceAvailableResponse(), WritePriority.RESPONSE),
+        (set_ecomax_parameter(1, 2), WritePriority.WRITE),
+        (EcomaxControlRequest(data={ATTR_VALUE: 1}), WritePriority.WRITE),
+        (ProgramVersionRequest(), WritePriority.READ),
+    ],
+)
+def test_get_priority(frame: Frame, priority: WritePriority) -> None:
+    """Test getting a write priority for the frame."""
+    assert get_priority(frame) == priority
+
+
+def test_get_coalesce_key() -> None:
+    """Test getting a coalesce key for the frame."""
+    assert get_coalesce_key(ProgramVersionRequest()) is None
+    assert get_coalesce_key(set_ecomax_parameter(1, 2)) == get_coalesce_key(
+        set_ecomax_parameter(1, 3)
+    )
+    assert get_coalesce_key(set_ecomax_parameter(1, 2)) != get_coalesce_key(
+        set_ecomax_parameter(2, 2)
+    )
+    assert get_coalesce_key(
+        SetMixerParameterRequest(data={ATTR_DEVICE_INDEX: 0, ATTR_INDEX: 1})
+    ) != get_coalesce_key(
+        SetMixerParameterRequest(data={ATTR_DEVICE_INDEX: 1, ATTR_INDEX: 1})
+    )
+
+
+async def test_priority(write_queue: WriteQueue) -> None:
+    """Test that frames are taken in the order of their priority."""
+    frames = [
+        ProgramVersionRequest(),
+        set_ecomax_parameter(1, 2),
+        CheckDeviceRequest(),
+        DeviceAvailableResponse(),
+        set_ecomax_parameter(2, 2),
+    ]
+    for frame in frames:
+        write_queue.put_nowait(frame)
+
+    assert [write_queue.get_nowait() for _ in range(write_queue.qsize())] == [
+        frames[3],
+        frames[1],
+        frames[4],
+        frames[0],
+        frames[2],
+    ]
+
+
+async def test_coalescing(write_queue: WriteQueue) -> None:
+    """Test that the pending frame is replaced by a newer one."""
+    write_queue.put_nowait(set_ecomax_parameter(1, 2))
+    write_queue.put_nowait(set_ecomax_parameter(2, 2))
+    write_queue.put_nowait(latest := set_ecomax_parameter(1, 3))
+    assert write_queue.qsize() == 2
+    assert write_queue.get_nowait() is latest
+    write_queue.task_done()
+    write_queue.get_nowait()
+    write_queue.task_done()
+    await write_queue.join()
+
+    # Verify that the dequeued frame is not replaced.
+    write_queue.put_nowait(set_ecomax_parameter(1, 4))
+    assert write_queue.qsize() == 1
+    assert write_queue.statistics.coalesced_frames == 1
+
+
+@patch("time.monotonic", side_effect=(0, 1, 2, 4, 7))
+async def test_statistics(mock_monotonic, write_queue: WriteQueue) -> None:
+    """Test the write queue statistics."""
+    assert write_queue.statistics.mean_wait_time == 0.0
+    write_queue.put_nowait(ProgramVersionRequest())
+    write_queue.put_nowait(CheckDeviceRequest())
+    write_queue.get_nowait()
+    write_queue.put_nowait(ProgramVersionRequest())
+    write_queue.get_nowait()
+
+    statistics = write_queue.statistics
+    assert statistics.queued_frames == 3
+    assert statistics.dequeued_frames == 2
+    assert statistics.max_depth == 2
+    assert statistics.max_wait_time == 6
+    assert statistics.mean_wait_time == 4
+    statistics.reset()
+    assert statistics.queued_frames == 0
+    assert statistics.max_wait_time == 0
+    assert statistics.wait_times.count == 0